@@ -0,0 +1,121 @@
+"""Prometheus 미들웨어 요청당 오버헤드 벤치마크
+
+이전 BaseHTTPMiddleware 구현과 순수 ASGI 구현을 같은 FastAPI 앱에 붙여
+ASGI 호출을 직접 반복하고, 미들웨어가 없는 경우 대비 요청당 추가 시간을
+비교합니다.
+
+    PYTHONPATH=. python scripts/bench_middleware.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.core.metrics import API_REQUEST_DURATION, API_REQUESTS
+from src.core.middleware import PrometheusMiddleware
+
+
+class LegacyPrometheusMiddleware(BaseHTTPMiddleware):
+    """비교용 이전 구현"""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        start_time = time.time()
+        response = await call_next(request)
+        duration = time.time() - start_time
+        API_REQUESTS.labels(
+            method=request.method,
+            endpoint=request.url.path,
+            status=response.status_code,
+        ).inc()
+        API_REQUEST_DURATION.labels(
+            method=request.method, endpoint=request.url.path
+        ).observe(duration)
+        return response
+
+
+def create_app(middleware: type | None) -> FastAPI:
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str) -> dict[str, str]:
+        return {"id": item_id}
+
+    return app
+
+
+async def run(app: FastAPI, requests: int) -> float:
+    """요청당 평균 시간 (마이크로초)"""
+
+    async def call(index: int) -> None:
+        """본문 이후 receive()는 응답이 끝날 때까지 대기 (서버 동작과 동일)"""
+        received = False
+        done = asyncio.Event()
+
+        async def receive() -> dict[str, Any]:
+            nonlocal received
+            if not received:
+                received = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                done.set()
+
+        await app(scope(index), receive, send)
+
+    def scope(index: int) -> dict[str, Any]:
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/items/{index % 100}",
+            "raw_path": f"/items/{index % 100}".encode(),
+            "query_string": b"",
+            "headers": [(b"host", b"bench")],
+            "server": ("bench", 80),
+            "client": ("127.0.0.1", 12345),
+            "root_path": "",
+        }
+
+    # 미들웨어 스택 구성 및 워밍업
+    for index in range(200):
+        await call(index)
+
+    start_time = time.perf_counter()
+    for index in range(requests):
+        await call(index)
+    return (time.perf_counter() - start_time) / requests * 1_000_000
+
+
+async def main(requests: int) -> None:
+    baseline = await run(create_app(None), requests)
+    results = {
+        "none": baseline,
+        "legacy (BaseHTTPMiddleware)": await run(
+            create_app(LegacyPrometheusMiddleware), requests
+        ),
+        "asgi": await run(create_app(PrometheusMiddleware), requests),
+    }
+    for name, per_request in results.items():
+        print(
+            f"{name:<30} {per_request:8.1f} us/request"
+            f"  (+{per_request - baseline:.1f} us)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,85 @@
+"""PDF 페이지 범위별 병렬 파싱 벤치마크
+
+합성 청구서 PDF를 만들어 한 프로세스에서 순서대로 파싱하는 경우와
+프로세스 풀에서 페이지 범위별로 나눠 파싱하는 경우의 소요 시간을 워커 수별로
+비교하며, 워커 수를 지정하지 않은 기본 설정도 함께 측정합니다. 캐시를 거치지
+않고 파싱만 측정합니다.
+
+    PYTHONPATH=. python scripts/bench_pdf_parallel.py --pages 48 --workers 1 2 4
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.core.config import settings, worker_count
+from src.services.pdf.extractor import parse_pages_parallel
+from src.services.pdf.parser import PARTS, parse_pages
+from src.services.pdf.pool import close_pdf_pool, pdf_pool_size, run_in_pdf_pool
+from tests.helpers.pdf import write_pdf
+
+TABLE = [["Item", "Quantity", "Amount"]] + [
+    [f"Item {row}", str(row), f"{row * 1200:,}"] for row in range(1, 11)
+]
+
+
+def create_document(directory: Path, pages: int) -> Path:
+    lines = [
+        f"Invoice line {line} description amount {line * 100}" for line in range(18)
+    ]
+    return write_pdf(directory / "bench.pdf", [lines] * pages, TABLE)
+
+
+async def parse_sequential(path: Path, pages: int) -> float:
+    start_time = time.perf_counter()
+    await run_in_pdf_pool(
+        parse_pages,
+        str(path),
+        list(range(1, pages + 1)),
+        PARTS,
+        settings.pdf_page_timeout,
+    )
+    return time.perf_counter() - start_time
+
+
+async def parse_parallel(path: Path, pages: int) -> float:
+    start_time = time.perf_counter()
+    await parse_pages_parallel(path, list(range(1, pages + 1)))
+    return time.perf_counter() - start_time
+
+
+async def main(pages: int, workers: list[int], repeat: int) -> None:
+    print(f"cpu count: {worker_count()}, pages: {pages}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = create_document(Path(directory), pages)
+
+        settings.pdf_workers = 1
+        # 워커 시작 시간 제외
+        await parse_sequential(path, 1)
+        baseline = min([await parse_sequential(path, pages) for _ in range(repeat)])
+        print(f"{'sequential':<14} {baseline:8.3f} s")
+        close_pdf_pool()
+
+        # None은 기본 설정 (서버 워커별 풀 크기 = 사용 가능한 CPU 수)
+        for count in [None, *workers]:
+            settings.pdf_workers = count
+            size = pdf_pool_size()
+            await parse_parallel(path, size)
+            elapsed = min([await parse_parallel(path, pages) for _ in range(repeat)])
+            label = f"default x{size}" if count is None else f"parallel x{size}"
+            print(f"{label:<14} {elapsed:8.3f} s  ({baseline / elapsed:.2f}x)")
+            close_pdf_pool()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=48)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=sorted({1, 2, os.cpu_count() or 1})
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.pages, args.workers, args.repeat))
@@ -0,0 +1,299 @@
+"""Agent 기본 클래스"""
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Iterable, cast
+
+from openai.types.chat import ChatCompletionMessageToolCall
+from structlog import get_logger
+
+from src.agent.core.session import SessionStore, fit_history
+from src.agent.core.types import (
+    AgentBatchItemResult,
+    AgentRequest,
+    AgentResponse,
+    TokenUsage,
+)
+from src.agent.functions.base import ToolSet
+from src.agent.functions.registry import FunctionRegistry
+from src.core.config import settings
+from src.core.exceptions import (
+    AgentError,
+    FunctionExecutionError,
+    FunctionNotFoundError,
+    LLMError,
+    ValidationError,
+)
+from src.core.types import ErrorResponse
+from src.services.llm.base import LLMService
+from src.services.llm.tokens import estimate_tokens
+
+logger = get_logger(__name__)
+
+
+def check_input_tokens(text: str) -> None:
+    """입력 토큰 추정치가 상한을 넘으면 LLM 호출 전에 ValidationError"""
+    tokens = estimate_tokens(text)
+    if tokens > settings.agent_max_input_tokens:
+        raise ValidationError(
+            "Input exceeds the token limit",
+            details={
+                "estimated_tokens": tokens,
+                "max_tokens": settings.agent_max_input_tokens,
+            },
+        )
+
+
+class Agent:
+    """LLM 서비스와 함수 레지스트리로 요청을 처리하는 Agent"""
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        registry: FunctionRegistry,
+        sessions: SessionStore | None = None,
+    ) -> None:
+        self.llm_service = llm_service
+        self.registry = registry
+        self.sessions = sessions
+
+    async def run(self, request: AgentRequest) -> AgentResponse:
+        """단일 요청 처리
+
+        모델이 tool_calls를 요청하면 한 턴의 호출을 모두 동시에 실행해 결과를
+        tool 메시지로 돌려주고, 최종 답변이 나오거나 최대 단계 수에 도달할
+        때까지 반복합니다. 마지막 단계에서 요청된 tool call은 실행하지 않고
+        MAX_STEPS_EXCEEDED로 끝냅니다. session_id가 있으면 토큰 예산에 맞춘
+        이전 대화를 앞에 붙이고 최종 답변을 세션에 저장합니다.
+        """
+        try:
+            # 요청된 함수 조합의 tools 페이로드 가져오기
+            try:
+                functions = self.registry.get_tool_set(request.functions)
+            except FunctionNotFoundError as e:
+                logger.error("함수를 찾을 수 없음", error=str(e))
+                raise e from e
+
+            prompt = str(request.input)
+            check_input_tokens(prompt)
+            user_message = {"role": "user", "content": prompt}
+            history = await self._load_history(request.session_id)
+            messages: list[dict[str, Any]] = [
+                *fit_history(history, settings.session_history_token_budget),
+                user_message,
+            ]
+            usage: TokenUsage | None = None
+
+            for step in range(1, settings.agent_max_steps + 1):
+                # 이전 대화가 없는 첫 단계는 프롬프트만으로 호출해
+                # 캐시/병합 키를 단순하게 유지
+                response = await self._generate(
+                    prompt, functions, messages if len(messages) > 1 else None
+                )
+                usage = self._add_usage(usage, response.get("usage"))
+
+                tool_calls = response.get("tool_calls")
+                if not tool_calls:
+                    if request.session_id and self.sessions is not None:
+                        await self.sessions.save(
+                            request.session_id,
+                            [
+                                *history,
+                                user_message,
+                                {"role": "assistant", "content": response["content"]},
+                            ],
+                        )
+                    return AgentResponse(
+                        result=response["content"],
+                        usage=usage,
+                        session_id=request.session_id,
+                    )
+
+                # 마지막 단계에서는 결과를 쓸 수 없으므로 함수를 실행하지 않음
+                if step == settings.agent_max_steps:
+                    break
+
+                messages.append(
+                    {
+                        "role": "assistant",
+                        "content": response.get("content") or None,
+                        "tool_calls": [
+                            tool_call.model_dump(mode="json")
+                            for tool_call in tool_calls
+                        ],
+                    }
+                )
+                messages.extend(await self._run_tool_calls(tool_calls))
+
+            raise AgentError(
+                f"Agent did not finish within {settings.agent_max_steps} steps",
+                code="MAX_STEPS_EXCEEDED",
+                details={"max_steps": settings.agent_max_steps},
+            )
+
+        except Exception as e:
+            logger.error("요청 처리 실패", error=str(e))
+            raise
+
+    async def _load_history(self, session_id: str | None) -> list[dict[str, Any]]:
+        """세션 이력 조회"""
+        if session_id is None:
+            return []
+        if self.sessions is None:
+            raise ValidationError("Sessions are not available (Redis not configured)")
+        return await self.sessions.load(session_id)
+
+    async def _generate(
+        self,
+        prompt: str,
+        functions: ToolSet | None,
+        messages: list[dict[str, Any]] | None,
+    ) -> dict[str, Any]:
+        """LLM 호출 (실패 시 LLMError)"""
+        try:
+            response = await self.llm_service.generate(
+                prompt=prompt,
+                functions=functions,
+                streaming=False,
+                messages=messages,
+            )
+        except AgentError:
+            raise
+        except Exception as e:
+            logger.error("LLM 호출 실패", error=str(e))
+            raise LLMError(str(e)) from e
+
+        if not isinstance(response, dict):
+            raise ValidationError("Unexpected response type")
+        return response
+
+    @staticmethod
+    def _add_usage(
+        total: TokenUsage | None, usage: dict[str, int] | None
+    ) -> TokenUsage | None:
+        if not usage:
+            return total
+        if total is None:
+            return TokenUsage(**usage)
+        return TokenUsage(
+            prompt_tokens=total.prompt_tokens + usage["prompt_tokens"],
+            completion_tokens=total.completion_tokens + usage["completion_tokens"],
+        )
+
+    async def _run_tool_calls(
+        self, tool_calls: list[ChatCompletionMessageToolCall]
+    ) -> list[dict[str, Any]]:
+        """한 턴의 tool call을 동시에 실행하고 tool 메시지로 변환
+
+        실패한 호출은 오류 내용을 해당 호출의 결과로 전달해 모델이 이어서
+        처리하도록 합니다.
+        """
+        results = await asyncio.gather(
+            *(self._run_tool_call(tool_call) for tool_call in tool_calls),
+            return_exceptions=True,
+        )
+
+        messages = []
+        for tool_call, result in zip(tool_calls, results, strict=True):
+            if isinstance(result, FunctionExecutionError):
+                detail = cast(dict[str, Any], result.detail)
+                result = {"error": detail["details"]["error"]}
+            elif isinstance(result, BaseException):
+                raise result
+            messages.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "content": json.dumps(result, ensure_ascii=False, default=str),
+                }
+            )
+        return messages
+
+    async def _run_tool_call(self, tool_call: ChatCompletionMessageToolCall) -> Any:
+        """호출별 시간 제한을 적용해 함수 실행"""
+        name = tool_call.function.name
+        timeout = settings.agent_tool_timeout
+        try:
+            return await asyncio.wait_for(
+                self.call_function(name, tool_call.function.arguments), timeout
+            )
+        except asyncio.TimeoutError as e:
+            logger.error("함수 실행 시간 초과", function=name, timeout=timeout)
+            raise FunctionExecutionError(
+                name, TimeoutError(f"Timed out after {timeout}s")
+            ) from e
+
+    async def call_function(self, name: str, arguments: str) -> Any:
+        """LLM이 요청한 함수 실행"""
+        try:
+            function = self.registry.get_function(name)
+            args = json.loads(arguments) if arguments else {}
+            return await function(**args)
+        except Exception as e:
+            logger.error("함수 실행 실패", function=name, error=str(e))
+            raise FunctionExecutionError(name, e) from e
+
+    async def run_batch(
+        self, requests: Iterable[AgentRequest], concurrency: int
+    ) -> AsyncIterator[AgentBatchItemResult]:
+        """여러 요청을 제한된 동시성으로 처리하고 완료 순서대로 반환
+
+        작업자 수만큼만 요청을 꺼내 실행하므로 입력이 커도 메모리가 일정하며,
+        한 항목의 실패는 해당 항목의 error로만 보고됩니다.
+        """
+        items = enumerate(requests)
+        results: asyncio.Queue[AgentBatchItemResult | None] = asyncio.Queue(
+            maxsize=concurrency
+        )
+
+        async def worker() -> None:
+            try:
+                # 동일한 이터레이터를 공유하므로 각 항목은 한 작업자만 처리
+                for index, request in items:
+                    await results.put(await self._run_item(index, request))
+            except Exception as e:
+                logger.error("배치 입력 처리 실패", error=str(e))
+            await results.put(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            remaining = len(workers)
+            while remaining:
+                result = await results.get()
+                if result is None:
+                    remaining -= 1
+                    continue
+                yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _run_item(
+        self, index: int, request: AgentRequest
+    ) -> AgentBatchItemResult:
+        """배치 항목 처리 (예외를 항목별 에러로 변환)"""
+        start_time = time.perf_counter()
+        try:
+            response = await self.run(request)
+            return AgentBatchItemResult(
+                index=index,
+                result=response.result,
+                usage=response.usage,
+                duration=time.perf_counter() - start_time,
+            )
+        except AgentError as e:
+            detail = cast(dict[str, Any], e.detail)
+            error = ErrorResponse(
+                error=detail["error"],
+                code=detail["code"],
+                details=detail.get("details"),
+            )
+        except Exception as e:
+            error = ErrorResponse(
+                error=str(e), code="INTERNAL_SERVER_ERROR", details=None
+            )
+        return AgentBatchItemResult(
+            index=index, error=error, duration=time.perf_counter() - start_time
+        )
@@ -0,0 +1,107 @@
+"""대화 세션 저장소 (Redis)"""
+
+import json
+import zlib
+from typing import Any
+
+from structlog import get_logger
+
+from src.core.config import settings
+from src.services.llm.tokens import estimate_message_tokens
+from src.services.redis import RedisService, get_redis_service
+
+logger = get_logger(__name__)
+
+SESSION_KEY_PREFIX = "agent:session:"
+
+# 저장 형식 버전 (앞 1바이트)
+ENCODING_VERSION = b"\x01"
+
+# 저장 시 역할 이름을 한 글자로 축약
+ROLE_CODES = {"user": "u", "assistant": "a"}
+ROLE_NAMES = {code: role for role, code in ROLE_CODES.items()}
+
+
+def encode_history(messages: list[dict[str, Any]]) -> bytes:
+    """대화 이력을 [역할 코드, 내용] 배열의 압축 JSON으로 인코딩"""
+    payload = json.dumps(
+        [[ROLE_CODES[message["role"]], message["content"]] for message in messages],
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return ENCODING_VERSION + zlib.compress(payload.encode())
+
+
+def decode_history(data: bytes) -> list[dict[str, Any]]:
+    """압축된 대화 이력 디코딩"""
+    if data[:1] != ENCODING_VERSION:
+        raise ValueError("Unsupported session encoding")
+    entries = json.loads(zlib.decompress(data[1:]))
+    return [{"role": ROLE_NAMES[role], "content": content} for role, content in entries]
+
+
+def fit_history(
+    history: list[dict[str, Any]], token_budget: int
+) -> list[dict[str, Any]]:
+    """토큰 예산에 맞도록 오래된 턴부터 제외한 이력 반환"""
+    tokens = [estimate_message_tokens([message]) for message in history]
+    total = sum(tokens)
+    start = 0
+    while start < len(history) and total > token_budget:
+        total -= tokens[start]
+        start += 1
+        # 사용자 메시지로 시작하도록 턴 단위로 제외
+        while start < len(history) and history[start]["role"] != "user":
+            total -= tokens[start]
+            start += 1
+    return history[start:]
+
+
+class SessionStore:
+    """세션별 대화 이력 저장소
+
+    사용자 입력과 최종 답변만 저장하며(tool 메시지 제외), 최근
+    max_messages개만 유지합니다. 세션은 마지막 사용 후 ttl초가 지나면
+    만료됩니다. 같은 세션에 동시에 요청하면 나중에 끝난 요청의 이력이
+    남습니다.
+    """
+
+    def __init__(self, redis: RedisService, ttl: int, max_messages: int) -> None:
+        self.redis = redis
+        self.ttl = ttl
+        self.max_messages = max_messages
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"{SESSION_KEY_PREFIX}{session_id}"
+
+    async def load(self, session_id: str) -> list[dict[str, Any]]:
+        """세션 이력 조회 (없거나 읽을 수 없으면 빈 이력)"""
+        data = await self.redis.get_bytes(self._key(session_id))
+        if data is None:
+            return []
+        try:
+            return decode_history(data)
+        except Exception as e:
+            logger.warning("세션 이력 디코딩 실패", session_id=session_id, error=str(e))
+            return []
+
+    async def save(self, session_id: str, history: list[dict[str, Any]]) -> None:
+        """세션 이력 저장 및 만료 시간 갱신"""
+        await self.redis.set(
+            self._key(session_id),
+            encode_history(history[-self.max_messages :]),
+            expire=self.ttl,
+        )
+
+    async def delete(self, session_id: str) -> None:
+        """세션 삭제"""
+        await self.redis.delete(self._key(session_id))
+
+
+def get_session_store() -> SessionStore | None:
+    """세션 저장소 조회 (Redis 미설정 시 None)"""
+    redis = get_redis_service()
+    if redis is None:
+        return None
+    return SessionStore(redis, settings.session_ttl, settings.session_max_messages)
@@ -2,6 +2,8 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from src.core.types import ErrorResponse
+
 
 class FunctionParameter(BaseModel):
     """함수 파라미터 정의"""
@@ -22,12 +24,47 @@ class FunctionMetadata(BaseModel):
 class AgentRequest(BaseModel):
     """에이전트 요청 모델"""
 
-    input: str = Field(..., min_length=1, max_length=4096)
+    # 문자 수는 페이로드 상한이며, 실제 입력 한도는 토큰 수로 검사
+    input: str = Field(..., min_length=1, max_length=8192)
     functions: Optional[list[str]] = None
     streaming: bool = False
+    session_id: Optional[str] = Field(None, pattern=r"^[A-Za-z0-9_-]{1,128}$")
+
+
+class TokenUsage(BaseModel):
+    """LLM 토큰 사용량"""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
 
 
 class AgentResponse(BaseModel):
     """에이전트 응답 모델"""
 
     result: Any
+    usage: Optional[TokenUsage] = None  # 캐시/병합된 응답이면 None
+    session_id: Optional[str] = None
+
+
+class AgentBatchRequest(BaseModel):
+    """에이전트 배치 요청 모델"""
+
+    items: list[AgentRequest] = Field(..., min_length=1)
+    concurrency: Optional[int] = Field(None, ge=1)
+    stream: bool = False  # True이면 완료 순서대로 NDJSON 스트리밍
+
+
+class AgentBatchItemResult(BaseModel):
+    """에이전트 배치 항목 결과 모델"""
+
+    index: int
+    result: Any = None
+    error: Optional[ErrorResponse] = None
+    usage: Optional[TokenUsage] = None
+    duration: Optional[float] = None  # 처리 시간 (초)
+
+
+class AgentBatchResponse(BaseModel):
+    """에이전트 배치 응답 모델 (입력 순서)"""
+
+    results: list[AgentBatchItemResult]
@@ -1,13 +1,24 @@
 """Agent 함수 기본 클래스"""
 
+import asyncio
+import hashlib
+import json
 import time
 from abc import ABC, abstractmethod
-from typing import Any
+from functools import cached_property
+from typing import Any, Iterator, Sequence
 
 from structlog import get_logger
 
 from src.agent.core.types import FunctionMetadata
-from src.core.metrics import FUNCTION_CALLS, FUNCTION_DURATION, FUNCTION_ERRORS
+from src.agent.functions.cache import get_function_cache
+from src.core.metrics import (
+    FUNCTION_CALLS,
+    FUNCTION_CANCELLED,
+    FUNCTION_DURATION,
+    FUNCTION_ERRORS,
+)
+from src.services.llm.tokens import estimate_tokens
 
 logger = get_logger(__name__)
 
@@ -19,21 +30,52 @@ class AgentFunction(ABC):
     description: str
     parameters: dict[str, Any]
 
+    # 결정적 함수의 결과 캐시 유지 시간 (초, None이면 캐시하지 않음)
+    cache_ttl: int | None = None
+
     @abstractmethod
     async def execute(self, **kwargs: Any) -> Any:
         """함수 실행 로직"""
         pass
 
+    def cache_key(self, **kwargs: Any) -> str:
+        """결과 캐시 키 (기본: 정규화된 전체 인자의 해시)
+
+        ID 기반 조회처럼 일부 인자만으로 결과가 정해지는 함수는 재정의합니다.
+        """
+        payload = json.dumps(
+            kwargs,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
     async def __call__(self, **kwargs: Any) -> Any:
         """함수 실행 및 메트릭 수집"""
         start_time = time.time()
         FUNCTION_CALLS.labels(function_name=self.name).inc()
 
+        cache_key = None
+        if self.cache_ttl is not None:
+            cache_key = self.cache_key(**kwargs)
+            hit, cached = await get_function_cache().get(self.name, cache_key)
+            if hit:
+                return cached
+
         try:
             result = await self.execute(**kwargs)
             duration = time.time() - start_time
             FUNCTION_DURATION.labels(function_name=self.name).observe(duration)
+            if cache_key is not None and self.cache_ttl is not None:
+                await get_function_cache().set(
+                    self.name, cache_key, result, self.cache_ttl
+                )
             return result
+        except asyncio.CancelledError:
+            FUNCTION_CANCELLED.labels(function_name=self.name).inc()
+            raise
         except Exception as e:
             logger.error(
                 "함수 실행 실패",
@@ -54,7 +96,7 @@ class AgentFunction(ABC):
             "parameters": self.parameters,
         }
 
-    @property
+    @cached_property
     def metadata(self) -> FunctionMetadata:
         """함수 메타데이터"""
         return FunctionMetadata(
@@ -62,3 +104,44 @@ class AgentFunction(ABC):
             description=self.description,
             parameters=self.parameters,
         )
+
+    @cached_property
+    def tool_schema(self) -> dict[str, Any]:
+        """OpenAI tools 형식 스키마"""
+        return {"type": "function", "function": self.to_dict()}
+
+
+class ToolSet:
+    """LLM에 전달할 함수 묶음과 직렬화된 tools 페이로드
+
+    함수는 이름순으로 정렬하고 키를 정렬한 JSON으로 정규화하므로, 같은 함수
+    묶음이면 항상 바이트 단위로 동일한 페이로드와 해시를 갖습니다.
+    """
+
+    def __init__(self, functions: Sequence[AgentFunction]) -> None:
+        unique = {function.name: function for function in functions}
+        self.functions: tuple[AgentFunction, ...] = tuple(
+            unique[name] for name in sorted(unique)
+        )
+        canonical = json.dumps(
+            [function.tool_schema for function in self.functions],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        self.schema_hash = hashlib.sha256(canonical.encode()).hexdigest()
+        # 요청마다 다시 계산하지 않도록 스키마 토큰 수를 미리 추정
+        self.token_estimate = estimate_tokens(canonical)
+        # 페이로드는 공유되므로 호출 측에서 변경하지 않아야 함
+        self.tools: list[dict[str, Any]] = json.loads(canonical)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """정렬된 함수 이름 목록"""
+        return tuple(function.name for function in self.functions)
+
+    def __len__(self) -> int:
+        return len(self.functions)
+
+    def __iter__(self) -> Iterator[AgentFunction]:
+        return iter(self.functions)
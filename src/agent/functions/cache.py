@@ -0,0 +1,184 @@
+"""Agent 함수 결과 캐시 (프로세스 LRU + Redis)"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+from structlog import get_logger
+
+from src.core.config import settings
+from src.core.metrics import FUNCTION_CACHE_REQUESTS
+from src.services.redis import RedisService
+
+logger = get_logger(__name__)
+
+CACHE_KEY_PREFIX = "agent:function:"
+INVALIDATION_CHANNEL = "agent:function:invalidate"
+
+# 무효화 구독이 끊겼을 때 재연결 대기 시간 (초)
+RESUBSCRIBE_DELAY = 1.0
+
+
+class FunctionResultCache:
+    """함수 결과 2단 캐시
+
+    1단은 워커 내부의 크기 제한 LRU, 2단은 워커 간 공유되는 Redis입니다.
+    값은 JSON으로 저장하므로 JSON 직렬화가 불가능한 결과는 캐시하지 않습니다.
+    무효화는 Redis pub/sub으로 모든 워커의 로컬 캐시에 전파됩니다.
+    """
+
+    def __init__(self, max_size: int, redis: RedisService | None = None) -> None:
+        self.max_size = max_size
+        self.redis = redis
+        # 캐시 키 -> (만료 시각, 직렬화된 값)
+        self._local: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def _cache_key(function_name: str, key: str) -> str:
+        return f"{CACHE_KEY_PREFIX}{function_name}:{key}"
+
+    def _get_local(self, cache_key: str) -> str | None:
+        entry = self._local.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._local[cache_key]
+            return None
+        self._local.move_to_end(cache_key)
+        return value
+
+    def _set_local(self, cache_key: str, value: str, expires_at: float) -> None:
+        self._local[cache_key] = (expires_at, value)
+        self._local.move_to_end(cache_key)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    def _evict_local(self, function_name: str, key: str | None = None) -> None:
+        if key is not None:
+            self._local.pop(self._cache_key(function_name, key), None)
+            return
+        prefix = self._cache_key(function_name, "")
+        for cache_key in [k for k in self._local if k.startswith(prefix)]:
+            del self._local[cache_key]
+
+    async def get(self, function_name: str, key: str) -> tuple[bool, Any]:
+        """캐시 조회 (적중 여부, 값)"""
+        cache_key = self._cache_key(function_name, key)
+
+        value = self._get_local(cache_key)
+        if value is not None:
+            FUNCTION_CACHE_REQUESTS.labels(
+                function_name=function_name, result="local_hit"
+            ).inc()
+            return True, json.loads(value)
+
+        if self.redis is not None:
+            try:
+                raw = await self.redis.get(cache_key)
+            except Exception as e:
+                logger.warning(
+                    "함수 캐시 조회 실패", function=function_name, error=str(e)
+                )
+                raw = None
+            if raw is not None:
+                try:
+                    entry = json.loads(raw)
+                    value, expires_at = entry["value"], float(entry["expires_at"])
+                except (ValueError, TypeError, KeyError) as e:
+                    # 손상된 항목은 캐시 미스로 처리 (다음 저장 시 덮어씀)
+                    logger.warning(
+                        "함수 캐시 항목 해석 실패", function=function_name, error=str(e)
+                    )
+                    raw = None
+            if raw is not None:
+                self._set_local(cache_key, json.dumps(value), expires_at)
+                FUNCTION_CACHE_REQUESTS.labels(
+                    function_name=function_name, result="redis_hit"
+                ).inc()
+                return True, value
+
+        FUNCTION_CACHE_REQUESTS.labels(function_name=function_name, result="miss").inc()
+        return False, None
+
+    async def set(self, function_name: str, key: str, value: Any, ttl: int) -> None:
+        """캐시 저장"""
+        try:
+            serialized = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError):
+            logger.debug(
+                "직렬화 불가능한 함수 결과는 캐시하지 않음", function=function_name
+            )
+            return
+
+        cache_key = self._cache_key(function_name, key)
+        expires_at = time.time() + ttl
+        self._set_local(cache_key, serialized, expires_at)
+
+        if self.redis is not None:
+            entry = json.dumps(
+                {"value": value, "expires_at": expires_at}, ensure_ascii=False
+            )
+            try:
+                await self.redis.set(cache_key, entry, expire=ttl)
+            except Exception as e:
+                logger.warning(
+                    "함수 캐시 저장 실패", function=function_name, error=str(e)
+                )
+
+    async def invalidate(self, function_name: str, key: str | None = None) -> None:
+        """캐시 무효화 (key가 없으면 함수 전체, 모든 워커에 전파)"""
+        self._evict_local(function_name, key)
+        if self.redis is None:
+            return
+
+        if key is not None:
+            await self.redis.delete(self._cache_key(function_name, key))
+        else:
+            await self.redis.delete_pattern(f"{self._cache_key(function_name, '')}*")
+        await self.redis.publish(
+            INVALIDATION_CHANNEL,
+            json.dumps({"function_name": function_name, "key": key}),
+        )
+
+    async def listen_invalidations(self) -> None:
+        """다른 워커의 무효화 메시지를 구독해 로컬 캐시에 반영"""
+        if self.redis is None:
+            return
+
+        while True:
+            pubsub = self.redis.client.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    data = json.loads(message["data"])
+                    self._evict_local(data["function_name"], data.get("key"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("함수 캐시 무효화 구독 실패", error=str(e))
+                await asyncio.sleep(RESUBSCRIBE_DELAY)
+            finally:
+                await pubsub.reset()
+
+
+_function_cache: FunctionResultCache | None = None
+
+
+def init_function_cache(redis: RedisService | None = None) -> FunctionResultCache:
+    """워커 공용 함수 결과 캐시 초기화"""
+    global _function_cache
+    _function_cache = FunctionResultCache(settings.function_cache_max_size, redis)
+    return _function_cache
+
+
+def get_function_cache() -> FunctionResultCache:
+    """워커 공용 함수 결과 캐시 조회 (미초기화 시 로컬 전용으로 생성)"""
+    cache = _function_cache
+    if cache is None:
+        return init_function_cache()
+    return cache
@@ -1,6 +1,6 @@
 from typing import Any, Dict
 
-from src.agent.core.agent_function import AgentFunction
+from src.agent.functions.base import AgentFunction
 
 
 class CalculateFunction(AgentFunction):
@@ -16,6 +16,7 @@ class CalculateFunction(AgentFunction):
         },
         "required": ["expression"],
     }
+    cache_ttl = 3600
 
     async def execute(self, **kwargs: Dict[str, Any]) -> Any:
         """수학 표현식을 안전하게 계산합니다."""
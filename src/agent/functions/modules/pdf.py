@@ -0,0 +1,68 @@
+"""PDF 청구서 추출 함수"""
+
+from pathlib import Path
+from typing import Any
+
+from src.agent.functions.base import AgentFunction
+from src.core.config import settings
+from src.core.metrics import FUNCTION_DURATION
+from src.services.pdf.extractor import extract_pdf_document
+from src.services.pdf.parser import DEFAULT_PARTS, PARTS
+
+
+def resolve_document_path(path: str) -> Path:
+    """문서 저장소 기준 경로 확인 (저장소 밖 경로 거부)"""
+    root = Path(settings.pdf_storage_dir).resolve()
+    resolved = (root / path).resolve()
+    if not resolved.is_relative_to(root):
+        raise ValueError("문서 저장소 밖의 경로는 읽을 수 없습니다.")
+    if not resolved.is_file():
+        raise ValueError(f"문서를 찾을 수 없습니다: {path}")
+    return resolved
+
+
+class ExtractPdfFunction(AgentFunction):
+    name = "extract_pdf"
+    description = "PDF 청구서에서 페이지별 텍스트, 좌표가 포함된 단어, 표를 추출합니다."
+    parameters = {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": "문서 저장소 기준 PDF 파일 경로",
+            },
+            "pages": {
+                "type": "array",
+                "items": {"type": "integer", "minimum": 1},
+                "description": "추출할 페이지 번호 (1부터 시작, 생략 시 전체)",
+            },
+            "include": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(PARTS)},
+                "description": "추출 항목 (기본: text, tables)",
+            },
+        },
+        "required": ["path"],
+    }
+
+    async def execute(self, **kwargs: Any) -> Any:
+        """워커 프로세스에서 PDF를 파싱합니다 (같은 내용의 문서는 캐시에서 조회)."""
+        path = str(kwargs.get("path", ""))
+        pages = [int(page) for page in kwargs.get("pages") or []]
+        include = tuple(kwargs.get("include") or DEFAULT_PARTS)
+        unknown = set(include) - set(PARTS)
+        if unknown:
+            raise ValueError(f"지원하지 않는 추출 항목입니다: {sorted(unknown)}")
+
+        result = await extract_pdf_document(
+            resolve_document_path(path), pages or None, include
+        )
+        for page in result["pages"]:
+            if not page["cached"]:
+                FUNCTION_DURATION.labels(function_name=f"{self.name}_page").observe(
+                    page["duration"]
+                )
+        return {"path": path, **result}
+
+
+extract_pdf = ExtractPdfFunction()
@@ -1,55 +1,126 @@
+import asyncio
 import importlib
+import json
+import os
 import pkgutil
-from typing import Dict
+import sys
+from collections import OrderedDict
+from typing import Dict, Sequence
 
 from structlog import get_logger
 
-from src.agent.core.exceptions import FunctionNotFoundError
-from src.agent.functions.base import AgentFunction
+from src.agent.core.exceptions import AgentError, FunctionNotFoundError
+from src.agent.core.types import FunctionMetadata
+from src.agent.functions.base import AgentFunction, ToolSet
+from src.services.redis import RedisService
 
 logger = get_logger(__name__)
 
+# 함수 조합별 tools 페이로드 캐시 최대 크기
+TOOL_SET_CACHE_SIZE = 256
+
+# 레지스트리 리로드를 모든 워커에 전파하는 채널
+RELOAD_CHANNEL = "agent:function:reload"
+
+# 리로드 구독이 끊겼을 때 재연결 대기 시간 (초)
+RESUBSCRIBE_DELAY = 1.0
+
 
 class FunctionRegistry:
     """Agent 함수 레지스트리"""
 
     def __init__(self) -> None:
         self._functions: Dict[str, AgentFunction] = {}
+        self._metadata: Dict[str, FunctionMetadata] = {}
+        self._tool_sets: OrderedDict[tuple[str, ...], ToolSet] = OrderedDict()
+        self._frozen = False
+
+    @property
+    def frozen(self) -> bool:
+        """동결 여부"""
+        return self._frozen
 
     def register(self, function: AgentFunction) -> None:
         """함수 등록"""
+        if self._frozen:
+            raise AgentError("Function registry is frozen")
+
         logger.info(
             "함수 등록",
             name=function.name,
             description=function.description,
         )
         self._functions[function.name] = function
+        self._metadata[function.name] = function.metadata
+        self._tool_sets.clear()
+
+    def freeze(self) -> "FunctionRegistry":
+        """레지스트리 동결 (이후 등록 불가)"""
+        self._frozen = True
+        return self
 
     def get_function(self, name: str) -> AgentFunction:
         """함수 조회"""
-        if name not in self._functions:
-            raise FunctionNotFoundError(f"Function {name} not found")
-        return self._functions[name]
+        try:
+            return self._functions[name]
+        except KeyError:
+            raise FunctionNotFoundError(f"Function {name} not found") from None
+
+    def get_metadata(self, name: str) -> FunctionMetadata:
+        """미리 계산된 함수 메타데이터 조회"""
+        try:
+            return self._metadata[name]
+        except KeyError:
+            raise FunctionNotFoundError(f"Function {name} not found") from None
+
+    def get_tool_set(self, names: Sequence[str] | None) -> ToolSet | None:
+        """함수 조합에 대한 tools 페이로드 조회 (조합별로 한 번만 직렬화)"""
+        if not names:
+            return None
+
+        key = tuple(sorted(set(names)))
+        tool_set = self._tool_sets.get(key)
+        if tool_set is not None:
+            self._tool_sets.move_to_end(key)
+            return tool_set
+
+        tool_set = ToolSet([self.get_function(name) for name in key])
+        self._tool_sets[key] = tool_set
+        if len(self._tool_sets) > TOOL_SET_CACHE_SIZE:
+            self._tool_sets.popitem(last=False)
+        return tool_set
 
     def list_functions(self) -> list[AgentFunction]:
         """등록된 모든 함수 목록"""
         return list(self._functions.values())
 
+    def list_metadata(self) -> list[FunctionMetadata]:
+        """등록된 모든 함수 메타데이터 목록"""
+        return list(self._metadata.values())
+
     @classmethod
-    def load_functions(cls) -> "FunctionRegistry":
-        """모듈에서 자동으로 함수 로드"""
+    def load_functions(cls, reload: bool = False) -> "FunctionRegistry":
+        """모듈에서 자동으로 함수 로드
+
+        reload가 True이면 이미 import된 모듈도 다시 읽어 새 코드를 반영합니다.
+        """
         registry = cls()
 
         # functions/modules 디렉토리의 모든 모듈을 검색
         modules_path = "src.agent.functions.modules"
         try:
+            if reload:
+                importlib.invalidate_caches()
             package = importlib.import_module(modules_path)
             for _, name, _ in pkgutil.iter_modules(
                 package.__path__,
                 f"{modules_path}.",
             ):
                 try:
-                    module = importlib.import_module(name)
+                    if reload and name in sys.modules:
+                        module = importlib.reload(sys.modules[name])
+                    else:
+                        module = importlib.import_module(name)
                     # AgentFunction 인스턴스 검색 및 등록
                     for attr_name in dir(module):
                         attr = getattr(module, attr_name)
@@ -64,4 +135,77 @@ class FunctionRegistry:
         except Exception as e:
             logger.error("함수 로드 실패", error=str(e))
 
-        return registry
+        return registry.freeze()
+
+
+# 프로세스 전역 레지스트리 스냅샷 (교체는 참조 재할당 한 번으로 원자적)
+_registry: FunctionRegistry | None = None
+_reload_lock = asyncio.Lock()
+
+
+def init_function_registry() -> FunctionRegistry:
+    """프로세스 전역 레지스트리 초기화 (이미 초기화된 경우 재사용)"""
+    global _registry
+    if _registry is None:
+        _registry = FunctionRegistry.load_functions()
+    return _registry
+
+
+def get_function_registry() -> FunctionRegistry:
+    """현재 레지스트리 스냅샷 조회"""
+    registry = _registry
+    if registry is None:
+        return init_function_registry()
+    return registry
+
+
+async def reload_function_registry(
+    redis: RedisService | None = None,
+) -> FunctionRegistry:
+    """함수 모듈을 다시 읽어 새 스냅샷으로 교체
+
+    로드는 스레드에서 수행하며, 진행 중인 요청은 기존 스냅샷을 계속 사용합니다.
+    redis가 있으면 Redis pub/sub으로 다른 워커에도 리로드를 전파합니다.
+    """
+    registry = await _reload()
+    if redis is not None:
+        await redis.publish(RELOAD_CHANNEL, json.dumps({"pid": os.getpid()}))
+    return registry
+
+
+async def _reload() -> FunctionRegistry:
+    global _registry
+    async with _reload_lock:
+        registry = await asyncio.to_thread(FunctionRegistry.load_functions, True)
+        _registry = registry
+
+    logger.info(
+        "함수 레지스트리 리로드",
+        functions=[function.name for function in registry.list_functions()],
+    )
+    return registry
+
+
+async def listen_registry_reloads(redis: RedisService | None) -> None:
+    """다른 워커의 리로드 메시지를 구독해 레지스트리 교체"""
+    if redis is None:
+        return
+
+    while True:
+        pubsub = redis.client.pubsub()
+        try:
+            await pubsub.subscribe(RELOAD_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                # 직접 리로드한 워커는 다시 읽지 않음
+                if json.loads(message["data"]).get("pid") == os.getpid():
+                    continue
+                await _reload()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("함수 레지스트리 리로드 구독 실패", error=str(e))
+            await asyncio.sleep(RESUBSCRIBE_DELAY)
+        finally:
+            await pubsub.reset()
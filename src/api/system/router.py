@@ -1,9 +1,52 @@
-from fastapi import APIRouter
+import secrets
+from typing import Any
+
+from fastapi import APIRouter, Header
+from starlette.status import HTTP_403_FORBIDDEN
+
+from src.agent.functions.cache import get_function_cache
+from src.agent.functions.registry import reload_function_registry
+from src.core.config import settings
+from src.core.exceptions import AgentError
+from src.services.redis import get_redis_service
 
 router = APIRouter(tags=["system"])
 
 
+def verify_admin_key(api_key: str | None) -> None:
+    """관리자 API 키 검증"""
+    if not settings.admin_api_key or not api_key:
+        raise AgentError("Forbidden", code="FORBIDDEN", status_code=HTTP_403_FORBIDDEN)
+    if not secrets.compare_digest(api_key, settings.admin_api_key):
+        raise AgentError("Forbidden", code="FORBIDDEN", status_code=HTTP_403_FORBIDDEN)
+
+
 @router.get("/health")
 async def health_check() -> dict[str, str]:
     """시스템 상태 확인"""
     return {"status": "ok"}
+
+
+@router.post("/admin/functions/reload")
+async def reload_functions(
+    x_admin_api_key: str | None = Header(None),
+) -> dict[str, Any]:
+    """함수 레지스트리 핫 리로드 (모든 워커에 전파)"""
+    verify_admin_key(x_admin_api_key)
+    registry = await reload_function_registry(get_redis_service())
+    return {
+        "status": "ok",
+        "functions": [function.name for function in registry.list_functions()],
+    }
+
+
+@router.post("/admin/functions/{function_name}/cache/invalidate")
+async def invalidate_function_cache(
+    function_name: str,
+    key: str | None = None,
+    x_admin_api_key: str | None = Header(None),
+) -> dict[str, str]:
+    """함수 결과 캐시 무효화 (모든 워커에 전파)"""
+    verify_admin_key(x_admin_api_key)
+    await get_function_cache().invalidate(function_name, key)
+    return {"status": "ok"}
@@ -0,0 +1,56 @@
+"""클라이언트 연결 종료 감지"""
+
+import asyncio
+from contextlib import suppress
+from typing import Awaitable, TypeVar
+
+from fastapi import Request
+from structlog import get_logger
+
+from src.core.exceptions import AgentError
+from src.core.metrics import CLIENT_DISCONNECTS
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# 클라이언트가 응답 전에 연결을 끊은 요청 (nginx 관례)
+CLIENT_CLOSED_REQUEST = 499
+
+
+async def wait_for_disconnect(request: Request) -> None:
+    """클라이언트가 연결을 끊을 때까지 대기
+
+    요청 본문을 모두 읽은 뒤의 receive()는 연결이 끊기거나 응답이 끝날
+    때까지 http.disconnect를 기다립니다.
+    """
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def cancel_on_disconnect(
+    request: Request, awaitable: Awaitable[T], endpoint: str
+) -> T:
+    """클라이언트 연결이 끊기면 진행 중인 작업(LLM 호출, 함수 실행)을 취소"""
+    task = asyncio.ensure_future(awaitable)
+    watcher = asyncio.create_task(wait_for_disconnect(request))
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        if not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    if task.cancelled():
+        CLIENT_DISCONNECTS.labels(endpoint=endpoint).inc()
+        logger.info("클라이언트 연결 종료로 요청 취소", endpoint=endpoint)
+        raise AgentError(
+            "Client closed request",
+            code="CLIENT_DISCONNECTED",
+            status_code=CLIENT_CLOSED_REQUEST,
+        )
+    return task.result()
@@ -43,6 +43,7 @@ async def agent_error_handler(request: Request, exc: AgentError) -> JSONResponse
     return JSONResponse(
         status_code=exc.status_code,
         content={"result": None, **error_response.model_dump()},
+        headers=exc.headers,
     )
 
 
@@ -26,3 +26,23 @@ class ErrorResponse(BaseModel):
     error: str
     code: str
     details: Optional[dict[str, Any]] = None
+
+
+class DocumentUploadResponse(BaseModel):
+    """문서 업로드 응답 모델"""
+
+    document_id: str  # 파일 내용의 SHA-256
+    path: str  # 문서 저장소 기준 경로 (extract_pdf 함수 인자)
+    filename: Optional[str] = None
+    size: int
+    extraction: Optional[dict[str, Any]] = None
+
+
+class InvoiceExtractionResponse(BaseModel):
+    """청구서 추출 응답 모델"""
+
+    document_id: str
+    page_count: int
+    pages: list[int]  # 추출한 페이지 번호
+    truncated: bool
+    invoice: dict[str, Any]
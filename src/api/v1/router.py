@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
-from src.api.v1.routes import agent
+from src.api.v1.routes import agent, documents
 
 router = APIRouter()
 router.include_router(agent.router, prefix="/agent", tags=["agent"])
+router.include_router(documents.router, prefix="/documents", tags=["documents"])
@@ -1,32 +1,51 @@
 """Agent API 라우터"""
 
-import json
-from typing import AsyncIterator, Final
+import asyncio
+import uuid
+from typing import Any, AsyncIterator, Final
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Request
+from fastapi.responses import StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 from structlog import get_logger
 
-from src.agent.core.types import AgentRequest, AgentResponse
-from src.agent.functions.registry import FunctionRegistry
+from src.agent.core.base import Agent, check_input_tokens
+from src.agent.core.session import get_session_store
+from src.agent.core.types import (
+    AgentBatchItemResult,
+    AgentBatchRequest,
+    AgentBatchResponse,
+    AgentRequest,
+    AgentResponse,
+)
+from src.agent.functions.registry import FunctionRegistry, get_function_registry
+from src.api.v1.disconnect import cancel_on_disconnect
+from src.api.v1.sse import coalesce_events
+from src.core.config import settings
 from src.core.exceptions import (
-    FunctionExecutionError,
+    AgentError,
     FunctionNotFoundError,
     LLMError,
+    StreamNotFoundError,
     ValidationError,
 )
+from src.core.metrics import CLIENT_DISCONNECTS
+from src.services.llm.base import LLMService, close_stream
+from src.services.llm.cache import CacheMode
+from src.services.llm.factory import wrap_llm_service
 from src.services.llm.openai import OpenAIService
+from src.services.streams import get_stream_store
 
 router = APIRouter()
 logger = get_logger(__name__)
 
-
-def get_llm_service() -> OpenAIService:
-    return OpenAIService()
+# 재개/추가 구독에 사용할 스트림 ID 응답 헤더
+STREAM_ID_HEADER = "X-Stream-Id"
 
 
-def get_function_registry() -> FunctionRegistry:
-    return FunctionRegistry.load_functions()
+def get_llm_service(x_llm_cache: str | None = Header(None)) -> LLMService:
+    # X-LLM-Cache: bypass | refresh 로 요청별 캐시 동작 제어
+    return wrap_llm_service(OpenAIService(), CacheMode.parse(x_llm_cache))
 
 
 # 의존성 상수 정의
@@ -37,77 +56,82 @@ FUNCTION_REGISTRY_DEPENDS: Final = Depends(get_function_registry)
 @router.post("/chat")
 async def chat(
     request: AgentRequest,
-    llm_service: OpenAIService = LLM_SERVICE_DEPENDS,
+    http_request: Request,
+    llm_service: LLMService = LLM_SERVICE_DEPENDS,
     registry: FunctionRegistry = FUNCTION_REGISTRY_DEPENDS,
 ) -> AgentResponse:
-    """LLM과 대화"""
-    try:
-        # 요청된 함수들 가져오기
-        functions = None
-        if request.functions:
-            try:
-                functions = [registry.get_function(name) for name in request.functions]
-            except FunctionNotFoundError as e:
-                logger.error("함수를 찾을 수 없음", error=str(e))
-                raise e from e
+    """LLM과 대화 (클라이언트 연결이 끊기면 LLM 호출과 함수 실행 취소)"""
+    agent = Agent(llm_service, registry, get_session_store())
+    return await cancel_on_disconnect(http_request, agent.run(request), "chat")
 
-        # LLM 호출
-        try:
-            response = await llm_service.generate(
-                prompt=str(request.input),
-                functions=functions,
-                streaming=False,
-            )
-        except Exception as e:
-            logger.error("LLM 호출 실패", error=str(e))
-            raise LLMError(str(e)) from e
 
-        if not isinstance(response, dict):
-            raise ValidationError("Unexpected response type")
+@router.post("/chat/batch", response_model=None)
+async def chat_batch(
+    request: AgentBatchRequest,
+    llm_service: LLMService = LLM_SERVICE_DEPENDS,
+    registry: FunctionRegistry = FUNCTION_REGISTRY_DEPENDS,
+) -> AgentBatchResponse | StreamingResponse:
+    """여러 요청을 동시에 처리 (입력 순서 응답 또는 완료 순서 NDJSON)"""
+    if len(request.items) > settings.batch_max_items:
+        raise ValidationError(
+            f"Too many batch items (max {settings.batch_max_items})",
+            details={"max_items": settings.batch_max_items},
+        )
 
-        # Function Call 처리
-        if response.get("function_call"):
-            try:
-                function_name = response["function_call"].name
-                function = registry.get_function(function_name)
-                args = json.loads(response["function_call"].arguments)
-                result = await function(**args)
-                return AgentResponse(result=result)
-            except Exception as e:
-                logger.error(
-                    "함수 실행 실패",
-                    function=function_name,
-                    error=str(e),
-                )
-                raise FunctionExecutionError(function_name, e) from e
+    concurrency = min(
+        request.concurrency or settings.batch_max_concurrency,
+        settings.batch_max_concurrency,
+        len(request.items),
+    )
+    agent = Agent(llm_service, registry, get_session_store())
+    results = agent.run_batch(request.items, concurrency)
+
+    if request.stream:
+
+        async def ndjson_generator() -> AsyncIterator[str]:
+            async for item in results:
+                yield item.model_dump_json() + "\n"
+
+        return StreamingResponse(ndjson_generator(), media_type="application/x-ndjson")
 
-        return AgentResponse(result=response["content"])
+    ordered: list[AgentBatchItemResult] = [item async for item in results]
+    ordered.sort(key=lambda item: item.index)
+    return AgentBatchResponse(results=ordered)
 
-    except Exception as e:
-        logger.error("요청 처리 실패", error=str(e))
-        raise
+
+@router.delete("/sessions/{session_id}")
+async def delete_session(session_id: str) -> dict[str, str]:
+    """대화 세션 삭제"""
+    sessions = get_session_store()
+    if sessions is None:
+        raise ValidationError("Sessions are not available (Redis not configured)")
+    await sessions.delete(session_id)
+    return {"status": "ok"}
 
 
 @router.post("/chat/stream")
 async def chat_stream(
     request: AgentRequest,
-    llm_service: OpenAIService = LLM_SERVICE_DEPENDS,
+    llm_service: LLMService = LLM_SERVICE_DEPENDS,
     registry: FunctionRegistry = FUNCTION_REGISTRY_DEPENDS,
 ) -> EventSourceResponse:
-    """LLM과 스트리밍 대화"""
+    """LLM과 스트리밍 대화
+
+    Redis가 있으면 생성은 요청과 분리되어 Redis Stream에 기록되며, 각 이벤트의
+    id와 X-Stream-Id 헤더로 연결이 끊긴 뒤에도 이어 받을 수 있습니다.
+    """
 
-    async def event_generator() -> AsyncIterator[dict[str, str]]:
+    check_input_tokens(str(request.input))
+    agent = Agent(llm_service, registry)
+
+    async def event_generator() -> AsyncIterator[str | dict[str, str]]:
         try:
-            # 요청된 함수들 가져오기
-            functions = None
-            if request.functions:
-                try:
-                    functions = [
-                        registry.get_function(name) for name in request.functions
-                    ]
-                except FunctionNotFoundError as e:
-                    logger.error("함수를 찾을 수 없음", error=str(e))
-                    raise e from e
+            # 요청된 함수 조합의 tools 페이로드 가져오기
+            try:
+                functions = registry.get_tool_set(request.functions)
+            except FunctionNotFoundError as e:
+                logger.error("함수를 찾을 수 없음", error=str(e))
+                raise e from e
 
             # LLM 스트리밍 호출
             try:
@@ -116,33 +140,92 @@ async def chat_stream(
                     functions=functions,
                     streaming=True,
                 )
+            except AgentError:
+                raise
             except Exception as e:
                 logger.error("LLM 호출 실패", error=str(e))
                 raise LLMError(str(e)) from e
 
-            if isinstance(response, AsyncIterator):
+            if not isinstance(response, AsyncIterator):
+                raise ValidationError("Unexpected response type")
+
+            # 완성된 호출은 바로 실행해 나머지 토큰 생성과 겹치게 하고,
+            # 결과는 호출 순서대로 준비되는 즉시 전달
+            tasks: list[asyncio.Task[Any]] = []
+            emitted = 0
+            try:
                 async for chunk in response:
                     if chunk.get("content"):
-                        yield {"data": chunk["content"]}
-                    elif chunk.get("function_call"):
-                        try:
-                            function_name = chunk["function_call"].name
-                            function = registry.get_function(function_name)
-                            args = json.loads(chunk["function_call"].arguments)
-                            result = await function(**args)
-                            yield {"data": str(result)}
-                        except Exception as e:
-                            logger.error(
-                                "함수 실행 실패",
-                                function=function_name,
-                                error=str(e),
+                        # 텍스트 델타는 coalesce_events에서 병합
+                        yield chunk["content"]
+                    call = (
+                        chunk["tool_call"].function
+                        if chunk.get("tool_call")
+                        else chunk.get("function_call")
+                    )
+                    if call:
+                        tasks.append(
+                            asyncio.create_task(
+                                agent.call_function(call.name, call.arguments)
                             )
-                            raise FunctionExecutionError(function_name, e) from e
-            else:
-                raise ValidationError("Unexpected response type")
-
+                        )
+                    while emitted < len(tasks) and tasks[emitted].done():
+                        yield {"data": str(tasks[emitted].result())}
+                        emitted += 1
+
+                for task in tasks[emitted:]:
+                    yield {"data": str(await task)}
+            finally:
+                # 연결 종료로 중단되면 업스트림 스트림과 실행 중인 함수 정리
+                for task in tasks:
+                    task.cancel()
+                await close_stream(response)
+
+        except (asyncio.CancelledError, GeneratorExit):
+            # EventSourceResponse가 연결 종료를 감지하면 생성기를 취소
+            CLIENT_DISCONNECTS.labels(endpoint="chat_stream").inc()
+            raise
         except Exception as e:
             logger.error("스트리밍 처리 실패", error=str(e))
             raise
 
-    return EventSourceResponse(event_generator())
+    events = coalesce_events(
+        event_generator(),
+        settings.sse_coalesce_window,
+        settings.sse_coalesce_max_bytes,
+    )
+    streams = get_stream_store()
+    if streams is None:
+        return EventSourceResponse(events, ping=settings.sse_ping_interval)
+
+    stream_id = uuid.uuid4().hex
+    await streams.start(stream_id, events)
+    return EventSourceResponse(
+        streams.read(stream_id),
+        ping=settings.sse_ping_interval,
+        headers={STREAM_ID_HEADER: stream_id},
+    )
+
+
+@router.get("/chat/stream/{stream_id}")
+async def resume_chat_stream(
+    stream_id: str,
+    last_event_id: str | None = Header(None),
+) -> EventSourceResponse:
+    """진행 중이거나 최근 끝난 스트림 구독
+
+    Last-Event-ID가 있으면 그 이후 청크부터, 없으면 처음부터 재생한 뒤 실시간
+    청크를 이어서 전달합니다. LLM을 다시 호출하지 않습니다.
+    """
+    streams = get_stream_store()
+    if streams is None:
+        raise ValidationError(
+            "Resumable streams are not available (Redis not configured)"
+        )
+    if not await streams.exists(stream_id):
+        raise StreamNotFoundError(stream_id)
+    return EventSourceResponse(
+        streams.read(stream_id, last_event_id),
+        ping=settings.sse_ping_interval,
+        headers={STREAM_ID_HEADER: stream_id},
+    )
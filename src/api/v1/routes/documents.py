@@ -0,0 +1,116 @@
+"""문서 업로드/추출 API"""
+
+import asyncio
+import re
+from pathlib import Path
+
+from fastapi import APIRouter, Request
+from starlette.status import HTTP_201_CREATED
+from structlog import get_logger
+
+from src.api.v1.disconnect import cancel_on_disconnect
+from src.api.v1.models import DocumentUploadResponse, InvoiceExtractionResponse
+from src.api.v1.routes.agent import LLM_SERVICE_DEPENDS
+from src.api.v1.upload import MultipartUpload, store_upload
+from src.core.config import settings
+from src.core.exceptions import DocumentNotFoundError, ValidationError
+from src.services.invoice import InvoicePipeline
+from src.services.llm.base import LLMService
+from src.services.pdf.extractor import extract_pdf_document, stream_pdf_document
+from src.services.pdf.parser import DEFAULT_PARTS
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+# 문서 저장소 안의 업로드 디렉터리 (임시 파일도 같은 파일 시스템에 두어 이동만 함)
+UPLOAD_DIR = "uploads"
+
+# PDF 파일 시그니처
+PDF_SIGNATURE = b"%PDF-"
+
+# 문서 ID (파일 내용의 SHA-256)
+DOCUMENT_ID_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+@router.post("", status_code=HTTP_201_CREATED)
+async def upload_document(
+    request: Request, extract: bool = False
+) -> DocumentUploadResponse:
+    """PDF 문서 업로드 (multipart/form-data의 file 필드)
+
+    본문은 메모리에 올리지 않고 청크 단위로 디스크에 기록하며, 문서는 내용의
+    SHA-256 이름으로 저장됩니다. extract가 true이면 저장한 문서를 바로
+    추출해 결과를 함께 반환합니다.
+    """
+    storage = Path(settings.pdf_storage_dir)
+    upload = await MultipartUpload(
+        "file",
+        settings.upload_max_bytes,
+        storage / UPLOAD_DIR,
+        signature=PDF_SIGNATURE,
+    ).receive(request)
+    path = await store_upload(upload, storage / UPLOAD_DIR / f"{upload.sha256}.pdf")
+    logger.info(
+        "문서 업로드", document_id=upload.sha256, size=upload.size, extract=extract
+    )
+
+    extraction = None
+    if extract:
+        try:
+            extraction = await cancel_on_disconnect(
+                request,
+                extract_pdf_document(path, None, DEFAULT_PARTS, digest=upload.sha256),
+                "documents",
+            )
+        except ValueError as e:
+            raise ValidationError(str(e)) from None
+
+    return DocumentUploadResponse(
+        document_id=upload.sha256,
+        path=str(path.relative_to(storage)),
+        filename=upload.filename,
+        size=upload.size,
+        extraction=extraction,
+    )
+
+
+@router.post("/{document_id}/invoice")
+async def extract_invoice(
+    document_id: str,
+    request: Request,
+    llm_service: LLMService = LLM_SERVICE_DEPENDS,
+) -> InvoiceExtractionResponse:
+    """업로드한 PDF에서 청구서 정보 추출
+
+    파싱이 끝난 페이지부터 청크 단위로 LLM 추출을 시작하므로 파싱과 LLM 호출
+    시간이 겹치며, 청크별 결과는 페이지 순서대로 병합됩니다.
+    """
+    path = Path(settings.pdf_storage_dir) / UPLOAD_DIR / f"{document_id}.pdf"
+    if not DOCUMENT_ID_PATTERN.match(document_id):
+        raise DocumentNotFoundError(document_id)
+    if not await asyncio.to_thread(path.is_file):
+        raise DocumentNotFoundError(document_id)
+
+    pipeline = InvoicePipeline(
+        llm_service,
+        chunk_pages=settings.invoice_chunk_pages,
+        concurrency=settings.invoice_llm_concurrency,
+        queue_size=settings.invoice_queue_size,
+    )
+
+    async def run() -> InvoiceExtractionResponse:
+        document = await stream_pdf_document(
+            path, None, DEFAULT_PARTS, digest=document_id
+        )
+        return InvoiceExtractionResponse(
+            document_id=document_id,
+            page_count=document.page_count,
+            pages=document.numbers,
+            truncated=document.truncated,
+            invoice=await pipeline.run(document),
+        )
+
+    try:
+        return await cancel_on_disconnect(request, run(), "invoice")
+    except ValueError as e:
+        raise ValidationError(str(e)) from None
@@ -0,0 +1,89 @@
+"""SSE 이벤트 병합 (coalescing)"""
+
+import asyncio
+from contextlib import suppress
+from typing import Any, AsyncIterator
+
+from src.core.metrics import SSE_DELTAS_PER_RESPONSE, SSE_EVENTS_PER_RESPONSE
+
+
+async def coalesce_events(
+    events: AsyncIterator[str | dict[str, str]],
+    window: float,
+    max_bytes: int,
+) -> AsyncIterator[dict[str, str]]:
+    """텍스트 델타를 시간 창/바이트 단위로 묶어 SSE 이벤트로 변환
+
+    문자열은 병합 가능한 텍스트 델타, dict는 그대로 보낼 독립 이벤트입니다.
+    첫 델타는 TTFB가 늘지 않도록 바로 보내고, 이후 델타는 첫 델타가 버퍼에
+    들어온 뒤 window초가 지나거나 max_bytes 이상 쌓이면 한 이벤트로 보냅니다.
+    독립 이벤트 앞의 버퍼는 먼저 보내므로 순서는 유지됩니다. window가 0이면
+    병합하지 않습니다.
+    """
+    loop = asyncio.get_running_loop()
+    buffer: list[str] = []
+    buffered_bytes = 0
+    deadline = 0.0
+    event_count = 0
+    delta_count = 0
+    pending: asyncio.Future[Any] | None = None
+
+    def flush() -> dict[str, str]:
+        nonlocal buffered_bytes, event_count
+        data = "".join(buffer)
+        buffer.clear()
+        buffered_bytes = 0
+        event_count += 1
+        return {"data": data}
+
+    try:
+        while True:
+            if buffer:
+                # 버퍼가 있으면 다음 델타를 창이 끝날 때까지만 기다림
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(events))
+                done, _ = await asyncio.wait(
+                    {pending}, timeout=max(deadline - loop.time(), 0)
+                )
+                if not done:
+                    yield flush()
+                    continue
+            try:
+                if pending is not None:
+                    item = await pending
+                else:
+                    item = await anext(events)
+            except StopAsyncIteration:
+                break
+            finally:
+                pending = None
+
+            if isinstance(item, dict):
+                if buffer:
+                    yield flush()
+                event_count += 1
+                yield item
+                continue
+
+            delta_count += 1
+            if delta_count == 1 or window <= 0:
+                # 첫 토큰은 바로 전달
+                event_count += 1
+                yield {"data": item}
+                continue
+            if not buffer:
+                deadline = loop.time() + window
+            buffer.append(item)
+            buffered_bytes += len(item.encode())
+            if buffered_bytes >= max_bytes:
+                yield flush()
+
+        if buffer:
+            yield flush()
+    finally:
+        if pending is not None:
+            pending.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await pending
+        SSE_EVENTS_PER_RESPONSE.observe(event_count)
+        SSE_DELTAS_PER_RESPONSE.observe(delta_count)
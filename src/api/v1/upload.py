@@ -0,0 +1,233 @@
+"""멀티파트 파일 업로드 (디스크로 스트리밍)"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastapi import Request
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import MultipartParser, parse_options_header
+from structlog import get_logger
+
+from src.core.exceptions import (
+    PayloadTooLargeError,
+    UnsupportedMediaTypeError,
+    ValidationError,
+)
+from src.core.metrics import UPLOAD_BYTES, UPLOAD_REJECTED
+
+logger = get_logger(__name__)
+
+# 파일 외 필드와 멀티파트 경계/헤더에 허용하는 크기
+FORM_OVERHEAD_BYTES = 64 * 1024
+
+# 디스크에 쓰기 전에 메모리에 모으는 최대 크기
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+@dataclass
+class UploadedFile:
+    """디스크에 저장된 업로드 파일"""
+
+    path: Path
+    filename: str | None
+    size: int
+    sha256: str
+
+
+class _FileSink:
+    """파일 데이터를 해시하며 임시 파일에 기록 (스레드에서 호출)"""
+
+    def __init__(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.file = tempfile.NamedTemporaryFile(
+            dir=directory, suffix=".part", delete=False
+        )
+        self.path = Path(self.file.name)
+        self.digest = hashlib.sha256()
+
+    def write(self, chunks: list[bytes]) -> None:
+        for chunk in chunks:
+            self.digest.update(chunk)
+            self.file.write(chunk)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def discard(self) -> None:
+        self.file.close()
+        self.path.unlink(missing_ok=True)
+
+
+class MultipartUpload:
+    """요청 본문을 청크 단위로 파싱해 한 파일 필드를 디스크에 기록
+
+    본문 전체를 메모리에 올리지 않으며, 버퍼는 WRITE_BUFFER_SIZE를 넘지
+    않습니다. 해시는 기록과 함께 계산하고, 크기 제한은 Content-Length로 먼저
+    확인한 뒤 받는 동안에도 확인해 초과하는 즉시 거절합니다. signature가
+    있으면 파일 앞부분이 일치하지 않을 때 나머지를 받지 않고 거절합니다.
+    """
+
+    def __init__(
+        self,
+        field: str,
+        max_bytes: int,
+        directory: Path,
+        signature: bytes | None = None,
+    ) -> None:
+        self.field = field.encode()
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.signature = signature
+        self.filename: str | None = None
+        self.size = 0
+
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: dict[bytes, bytes] = {}
+        self._in_file = False
+        self._file_seen = False
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._head = b""
+
+    # python-multipart 콜백 (동기, 데이터는 모아 두었다가 스레드에서 기록)
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(
+            self._headers.get(b"content-disposition", b"")
+        )
+        self._in_file = options.get(b"name") == self.field and not self._file_seen
+        if self._in_file:
+            self._file_seen = True
+            filename = options.get(b"filename")
+            self.filename = filename.decode(errors="replace") if filename else None
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if not self._in_file:
+            return
+        chunk = data[start:end]
+        self.size += len(chunk)
+        if len(self._head) < len(self.signature or b""):
+            self._head += chunk[: len(self.signature or b"") - len(self._head)]
+        if self.size <= self.max_bytes:
+            self._pending.append(chunk)
+            self._pending_bytes += len(chunk)
+
+    def _on_part_end(self) -> None:
+        self._in_file = False
+
+    def _check(self) -> None:
+        if self.size > self.max_bytes:
+            raise PayloadTooLargeError(self.max_bytes)
+        if self.signature and len(self._head) >= len(self.signature):
+            if self._head != self.signature:
+                UPLOAD_REJECTED.labels(reason="signature").inc()
+                raise UnsupportedMediaTypeError("Unexpected file type")
+
+    async def receive(self, request: Request) -> UploadedFile:
+        """요청 본문을 받아 임시 파일로 저장"""
+        content_type, options = parse_options_header(
+            request.headers.get("content-type", "")
+        )
+        boundary = options.get(b"boundary")
+        if content_type != b"multipart/form-data" or not boundary:
+            UPLOAD_REJECTED.labels(reason="content_type").inc()
+            raise UnsupportedMediaTypeError("Expected multipart/form-data")
+
+        max_body = self.max_bytes + FORM_OVERHEAD_BYTES
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            if int(content_length) > max_body:
+                UPLOAD_REJECTED.labels(reason="size").inc()
+                raise PayloadTooLargeError(self.max_bytes)
+
+        parser = MultipartParser(
+            boundary,
+            callbacks={
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+        sink = await asyncio.to_thread(_FileSink, self.directory)
+        received = 0
+        try:
+            async for chunk in request.stream():
+                received += len(chunk)
+                if received > max_body:
+                    raise PayloadTooLargeError(self.max_bytes)
+                parser.write(chunk)
+                self._check()
+                if self._pending_bytes >= WRITE_BUFFER_SIZE:
+                    await self._flush(sink)
+            parser.finalize()
+            await self._flush(sink)
+            await asyncio.to_thread(sink.close)
+        except MultipartParseError as e:
+            await asyncio.to_thread(sink.discard)
+            raise ValidationError(f"Invalid multipart body: {e}") from None
+        except PayloadTooLargeError:
+            UPLOAD_REJECTED.labels(reason="size").inc()
+            await asyncio.to_thread(sink.discard)
+            raise
+        except BaseException:
+            await asyncio.to_thread(sink.discard)
+            raise
+
+        if not self._file_seen:
+            await asyncio.to_thread(sink.discard)
+            raise ValidationError(f"Missing file field '{self.field.decode()}'")
+        if self.signature and self._head != self.signature:
+            UPLOAD_REJECTED.labels(reason="signature").inc()
+            await asyncio.to_thread(sink.discard)
+            raise UnsupportedMediaTypeError("Unexpected file type")
+
+        UPLOAD_BYTES.inc(self.size)
+        return UploadedFile(
+            path=sink.path,
+            filename=self.filename,
+            size=self.size,
+            sha256=sink.digest.hexdigest(),
+        )
+
+    async def _flush(self, sink: _FileSink) -> None:
+        if not self._pending:
+            return
+        chunks, self._pending, self._pending_bytes = self._pending, [], 0
+        await asyncio.to_thread(sink.write, chunks)
+
+
+def _move(source: Path, destination: Path) -> None:
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if destination.exists():
+        source.unlink(missing_ok=True)
+    else:
+        os.replace(source, destination)
+
+
+async def store_upload(upload: UploadedFile, destination: Path) -> Path:
+    """임시 파일을 최종 경로로 이동 (같은 내용이 이미 있으면 임시 파일 삭제)"""
+    await asyncio.to_thread(_move, upload.path, destination)
+    upload.path = destination
+    return destination
@@ -0,0 +1,289 @@
+"""JSONL 일괄 처리 CLI
+
+AgentRequest 형태의 JSONL 레코드를 HTTP API와 같은 레지스트리/LLM 서비스로
+처리하고 결과를 JSONL로 기록합니다.
+
+    python -m src.cli.bulk requests.jsonl results.jsonl --concurrency 8
+
+완료된 레코드 ID는 체크포인트 파일에 추가 기록되므로, 중단된 실행을 같은
+명령으로 다시 시작하면 완료된 레코드는 LLM을 다시 호출하지 않고 건너뜁니다.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, TextIO
+
+from pydantic import ValidationError as PydanticValidationError
+from structlog import get_logger
+
+from src.agent.core.base import Agent
+from src.agent.core.types import AgentBatchItemResult, AgentRequest
+from src.agent.functions.cache import init_function_cache
+from src.agent.functions.registry import init_function_registry
+from src.core.config import settings
+from src.core.logging import setup_logging
+from src.services.llm.cache import CacheMode
+from src.services.llm.client import close_openai_client, init_openai_client
+from src.services.llm.factory import wrap_llm_service
+from src.services.llm.openai import OpenAIService
+from src.services.llm.singleflight import init_single_flight
+from src.services.pdf.cache import init_document_cache
+from src.services.redis import close_redis_service, init_redis_service
+
+logger = get_logger(__name__)
+
+# 레코드 ID로 사용할 필드 (없으면 줄 번호)
+RECORD_ID_FIELDS = ("request_id", "id")
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    """nearest-rank 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class BulkStats:
+    """일괄 처리 통계"""
+
+    def __init__(self) -> None:
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0  # 체크포인트로 건너뛴 레코드
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.latencies: list[float] = []
+        self.elapsed = 0.0
+
+    @property
+    def processed(self) -> int:
+        return self.succeeded + self.failed
+
+    def record(self, item: AgentBatchItemResult) -> None:
+        if item.error is None:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        if item.usage is not None:
+            self.prompt_tokens += item.usage.prompt_tokens
+            self.completion_tokens += item.usage.completion_tokens
+        if item.duration is not None:
+            self.latencies.append(item.duration)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "throughput_per_second": (
+                round(self.processed / self.elapsed, 3) if self.elapsed else None
+            ),
+            "tokens": {
+                "prompt": self.prompt_tokens,
+                "completion": self.completion_tokens,
+                "total": self.prompt_tokens + self.completion_tokens,
+            },
+            "latency_seconds": {
+                "p50": percentile(self.latencies, 50),
+                "p95": percentile(self.latencies, 95),
+            },
+        }
+
+
+def load_checkpoint(path: Path) -> set[str]:
+    """완료된 레코드 ID 목록 읽기"""
+    if not path.exists():
+        return set()
+    with path.open(encoding="utf-8") as f:
+        return {line.strip() for line in f if line.strip()}
+
+
+class BulkRunner:
+    """JSONL 입력을 Agent 배치로 처리하며 결과와 체크포인트를 기록
+
+    결과 줄을 먼저 기록한 뒤 체크포인트에 ID를 추가하므로, 프로세스가 중단되어도
+    체크포인트에 있는 레코드의 결과는 항상 출력 파일에 남아 있습니다. 실패한
+    레코드는 체크포인트에 기록하지 않아 재시작 시 다시 처리됩니다.
+    """
+
+    def __init__(self, agent: Agent, concurrency: int) -> None:
+        self.agent = agent
+        self.concurrency = concurrency
+        self.stats = BulkStats()
+
+    async def run(
+        self, input_path: Path, output_path: Path, checkpoint_path: Path
+    ) -> BulkStats:
+        done = load_checkpoint(checkpoint_path)
+        # 배치 인덱스 -> 레코드 ID (처리 중인 항목만 유지)
+        record_ids: dict[int, str] = {}
+        start_time = time.perf_counter()
+
+        try:
+            with (
+                output_path.open("a", encoding="utf-8") as output,
+                checkpoint_path.open("a", encoding="utf-8") as checkpoint,
+            ):
+
+                def requests() -> Iterator[AgentRequest]:
+                    index = 0
+                    for record_id, record in self._read_records(input_path):
+                        if record_id in done:
+                            self.stats.skipped += 1
+                            continue
+                        try:
+                            request = AgentRequest.model_validate(record)
+                        except PydanticValidationError as e:
+                            # 잘못된 입력은 재시도해도 같으므로 완료로 기록
+                            self.stats.failed += 1
+                            self._write(output, self._invalid_record(record_id, e))
+                            self._checkpoint(checkpoint, record_id)
+                            continue
+                        record_ids[index] = record_id
+                        index += 1
+                        yield request
+
+                async for item in self.agent.run_batch(requests(), self.concurrency):
+                    record_id = record_ids.pop(item.index)
+                    self.stats.record(item)
+                    self._write(
+                        output,
+                        {
+                            "id": record_id,
+                            **item.model_dump(mode="json", exclude={"index"}),
+                        },
+                    )
+                    if item.error is None:
+                        self._checkpoint(checkpoint, record_id)
+                    else:
+                        logger.warning(
+                            "레코드 처리 실패", id=record_id, error=item.error.error
+                        )
+        finally:
+            self.stats.elapsed = time.perf_counter() - start_time
+        return self.stats
+
+    @staticmethod
+    def _read_records(path: Path) -> Iterator[tuple[str, Any]]:
+        """(레코드 ID, 레코드) 순회 (JSON 파싱 실패 레코드는 None)"""
+        with path.open(encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    yield f"line-{line_number}", None
+                    continue
+                record_id = next(
+                    (
+                        str(record[field])
+                        for field in RECORD_ID_FIELDS
+                        if isinstance(record, dict) and record.get(field) is not None
+                    ),
+                    f"line-{line_number}",
+                )
+                yield record_id, record
+
+    @staticmethod
+    def _invalid_record(
+        record_id: str, error: PydanticValidationError
+    ) -> dict[str, Any]:
+        return {
+            "id": record_id,
+            "error": {
+                "error": "Invalid record",
+                "code": "VALIDATION_ERROR",
+                "details": {
+                    "errors": error.errors(include_url=False, include_context=False)
+                },
+            },
+        }
+
+    @staticmethod
+    def _write(output: TextIO, data: dict[str, Any]) -> None:
+        output.write(json.dumps(data, ensure_ascii=False) + "\n")
+        output.flush()
+
+    @staticmethod
+    def _checkpoint(checkpoint: TextIO, record_id: str) -> None:
+        checkpoint.write(record_id + "\n")
+        checkpoint.flush()
+
+
+@asynccontextmanager
+async def agent_context(cache_mode: CacheMode) -> AsyncIterator[Agent]:
+    """API 서버와 동일한 레지스트리/LLM 서비스로 Agent 구성"""
+    registry = init_function_registry()
+    init_openai_client()
+    redis = init_redis_service()
+    init_single_flight(redis)
+    init_document_cache(redis)
+    init_function_cache(redis)
+    try:
+        yield Agent(wrap_llm_service(OpenAIService(), cache_mode), registry)
+    finally:
+        await close_openai_client()
+        await close_redis_service()
+
+
+async def run(args: argparse.Namespace) -> BulkStats:
+    checkpoint_path = args.checkpoint or args.output.with_name(
+        args.output.name + ".checkpoint"
+    )
+    async with agent_context(CacheMode.parse(args.llm_cache)) as agent:
+        runner = BulkRunner(agent, args.concurrency)
+        try:
+            return await runner.run(args.input, args.output, checkpoint_path)
+        finally:
+            logger.info("일괄 처리 종료", **runner.stats.summary())
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli.bulk",
+        description="AgentRequest JSONL 일괄 처리",
+    )
+    parser.add_argument("input", type=Path, help="입력 JSONL 파일")
+    parser.add_argument("output", type=Path, help="결과 JSONL 파일 (이어 쓰기)")
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="체크포인트 파일 (기본값: <output>.checkpoint)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.batch_max_concurrency,
+        help="동시 처리 수",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        choices=[mode.value for mode in CacheMode],
+        default=CacheMode.DEFAULT.value,
+        help="LLM 응답 캐시 동작",
+    )
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    setup_logging()
+    stats = asyncio.run(run(parse_args(argv)))
+    print(json.dumps(stats.summary(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import os
 from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,11 +21,112 @@ class Settings(BaseSettings):
     # API 설정
     api_version: str = "v1"
     api_prefix: str = "/api/v1"
+    admin_api_key: Optional[str] = None
 
     # OpenAI 설정
     openai_api_key: Optional[str] = None
     openai_model: str = "gpt-4-turbo"
-    openai_max_tokens: int = 4000
+    openai_max_tokens: int = 4000  # 응답 토큰 예약 상한
+    openai_min_output_tokens: int = 256
+    openai_context_window: int = 128000
+    openai_output_headroom: float = 1.5  # 관측된 p99 출력 토큰 대비 예약 배수
+    openai_output_sample_size: int = 200
+    openai_max_connections: int = 100
+    openai_max_keepalive_connections: int = 20
+    openai_keepalive_expiry: float = 30.0
+    openai_http2: bool = False  # h2 패키지 필요 (httpx[http2])
+    openai_connect_timeout: float = 5.0
+    openai_read_timeout: float = 600.0
+    openai_pool_timeout: float = 10.0
+
+    # LLM 응답 캐시 설정 (Redis 필요)
+    llm_cache_enabled: bool = False
+    llm_cache_ttl: int = 3600
+
+    # 동일 요청 병합 설정 (Redis가 있으면 워커 간에도 병합)
+    llm_singleflight_enabled: bool = True
+    llm_singleflight_lock_ttl: float = 120.0
+    llm_singleflight_wait_timeout: float = 120.0
+    llm_singleflight_result_ttl: int = 5
+
+    # LLM 동시 호출 제한 설정 (AIMD, 워커/모델별)
+    llm_limiter_enabled: bool = True
+    llm_limiter_initial_limit: int = 20
+    llm_limiter_min_limit: int = 1
+    llm_limiter_max_limit: int = 100
+    llm_limiter_queue_size: int = 100
+    llm_limiter_queue_timeout: float = 10.0
+    llm_limiter_latency_tolerance: float = 2.0  # 기준 지연 대비 감소 임계 배수
+
+    # LLM 재시도 설정 (지수 백오프 + 지터, 워커 공용 재시도 예산)
+    llm_retry_max_attempts: int = 3  # 최초 호출 포함
+    llm_retry_initial_delay: float = 0.5
+    llm_retry_max_delay: float = 20.0  # Retry-After가 이보다 길면 재시도하지 않음
+    llm_retry_budget_ratio: float = 0.1  # 요청당 적립되는 재시도 토큰
+    llm_retry_budget_capacity: float = 10.0
+
+    # Agent 루프 설정
+    agent_max_steps: int = 5
+    agent_tool_timeout: float = 30.0  # tool call별 실행 시간 제한 (초)
+    # 사용자 입력 토큰 상한 (추정치, 한글은 문자당 약 1토큰이므로 4096자까지 허용)
+    agent_max_input_tokens: int = 4096
+
+    # 스트리밍 응답 설정
+    sse_coalesce_window: float = 0.05  # 델타 병합 시간 창 (초, 0이면 병합 안 함)
+    sse_coalesce_max_bytes: int = 1024
+    sse_ping_interval: int = 15  # keepalive ping 주기 (초)
+
+    # 재개 가능한 스트림 설정 (Redis Streams 필요)
+    stream_resume_enabled: bool = True
+    stream_ttl: int = 300  # 마지막 청크 이후 스트림 보관 시간 (초)
+    stream_block_timeout: float = 5.0
+    stream_reader_grace: int = 30  # 구독자가 없을 때 생성을 취소하기까지의 시간 (초)
+
+    # 대화 세션 설정 (Redis 필요)
+    session_ttl: int = 86400
+    session_max_messages: int = 50
+    session_history_token_budget: int = 3000  # 프롬프트에 포함할 이전 대화 토큰 예산
+
+    # 배치 처리 설정
+    batch_max_items: int = 1000
+    batch_max_concurrency: int = 8
+
+    # 함수 결과 캐시 설정 (로컬 LRU 크기, Redis가 있으면 2단 캐시)
+    function_cache_max_size: int = 1024
+
+    # 문서 업로드 설정
+    upload_max_bytes: int = 50 * 1024 * 1024
+
+    # PDF 파싱 설정 (spawn 프로세스 풀에서 실행)
+    pdf_storage_dir: str = "data/documents"  # extract_pdf 함수가 읽는 문서 저장소
+    pdf_workers: Optional[int] = None  # 서버 워커별 파싱 워커 수 (미설정 시 CPU 수)
+    pdf_worker_max_tasks: int = 100  # 파싱 워커 교체 전 처리할 작업 수
+    pdf_page_timeout: float = 10.0  # 페이지별 파싱 시간 제한 (초)
+    pdf_max_pages: int = 50  # 한 번에 추출할 최대 페이지 수
+    pdf_pages_per_task: int = 8  # 워커 작업 하나가 파싱할 최대 페이지 수
+    # 문서당 파싱 메모리 상한 (0이면 무제한)
+    pdf_document_memory_limit: int = 1024 * 1024 * 1024
+    pdf_cache_dir: str = "data/pdf_cache"  # 파싱 결과 로컬 디스크 캐시
+    pdf_cache_max_bytes: int = 512 * 1024 * 1024  # 0이면 디스크 캐시 미사용
+    pdf_cache_ttl: int = 604800  # Redis 캐시 유지 시간 (초)
+
+    # 청구서 추출 파이프라인 설정 (파싱 → LLM 추출 → 병합)
+    invoice_chunk_pages: int = 2  # LLM 호출 하나에 넣을 페이지 수
+    invoice_llm_concurrency: int = 4  # 문서당 동시 LLM 호출 수
+    invoice_queue_size: int = 4  # 파싱과 LLM 호출 사이에 대기하는 최대 청크 수
+
+    # 메트릭 설정 (멀티프로세스 수집은 PROMETHEUS_MULTIPROC_DIR 환경 변수로 활성화)
+    metrics_memory_interval: float = 15.0  # 워커별 메모리 사용량 갱신 주기 (초)
+
+    # 프로덕션 서버 설정 (python -m src.server)
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    server_workers: Optional[int] = None  # 미설정 시 사용 가능한 CPU 수
+    server_max_requests: int = 10000  # 워커 교체 전 처리할 요청 수 (0이면 교체 안 함)
+    server_max_requests_jitter: int = 1000
+    server_backlog: int = 2048
+    server_keepalive_timeout: int = 5
+    server_graceful_timeout: int = 30  # 종료 시 진행 중인 요청 대기 시간 (초)
 
     # Internal API 설정
     internal_api_url: Optional[str] = None
@@ -62,6 +164,15 @@ class Settings(BaseSettings):
                 raise ValidationError(error_msg)
 
 
+def worker_count(configured: int | None = None) -> int:
+    """워커 수 (미설정 또는 0이면 프로세스가 사용할 수 있는 CPU 수)"""
+    if configured:
+        return configured
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 settings = Settings()
 
 try:
@@ -4,8 +4,11 @@ from fastapi import HTTPException
 from starlette.status import (
     HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    HTTP_415_UNSUPPORTED_MEDIA_TYPE,
     HTTP_422_UNPROCESSABLE_ENTITY,
     HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 
 
@@ -18,6 +21,7 @@ class AgentError(HTTPException):
         code: str = "AGENT_ERROR",
         status_code: int = HTTP_500_INTERNAL_SERVER_ERROR,
         details: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
     ):
         super().__init__(
             status_code=status_code,
@@ -26,6 +30,7 @@ class AgentError(HTTPException):
                 "code": code,
                 "details": details,
             },
+            headers=headers,
         )
 
 
@@ -41,6 +46,30 @@ class FunctionNotFoundError(AgentError):
         )
 
 
+class StreamNotFoundError(AgentError):
+    """스트림을 찾을 수 없을 때 발생하는 예외 (만료 포함)"""
+
+    def __init__(self, stream_id: str):
+        super().__init__(
+            message=f"Stream {stream_id} not found",
+            code="STREAM_NOT_FOUND",
+            status_code=HTTP_404_NOT_FOUND,
+            details={"stream_id": stream_id},
+        )
+
+
+class DocumentNotFoundError(AgentError):
+    """업로드된 문서를 찾을 수 없을 때 발생하는 예외"""
+
+    def __init__(self, document_id: str):
+        super().__init__(
+            message=f"Document {document_id} not found",
+            code="DOCUMENT_NOT_FOUND",
+            status_code=HTTP_404_NOT_FOUND,
+            details={"document_id": document_id},
+        )
+
+
 class FunctionExecutionError(AgentError):
     """함수 실행 중 발생하는 예외"""
 
@@ -80,6 +109,43 @@ class LLMError(AgentError):
         )
 
 
+class PayloadTooLargeError(AgentError):
+    """요청 본문이 크기 제한을 넘을 때 발생하는 예외"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(
+            message=f"Payload exceeds {max_bytes} bytes",
+            code="PAYLOAD_TOO_LARGE",
+            status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            details={"max_bytes": max_bytes},
+        )
+
+
+class UnsupportedMediaTypeError(AgentError):
+    """지원하지 않는 콘텐츠 형식일 때 발생하는 예외"""
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None):
+        super().__init__(
+            message=message,
+            code="UNSUPPORTED_MEDIA_TYPE",
+            status_code=HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            details=details,
+        )
+
+
+class ServiceOverloadedError(AgentError):
+    """과부하로 요청을 처리할 수 없을 때 발생하는 예외"""
+
+    def __init__(self, retry_after: int, details: dict[str, Any] | None = None):
+        super().__init__(
+            message="Service overloaded, retry later",
+            code="SERVICE_OVERLOADED",
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            details=details,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
 class ValidationError(AgentError):
     """입력 검증 실패 예외"""
 
@@ -1,6 +1,29 @@
-"""Prometheus 메트릭스 정의"""
+"""Prometheus 메트릭스 정의
 
-from prometheus_client import Counter, Gauge, Histogram
+PROMETHEUS_MULTIPROC_DIR가 설정되면 워커별 값이 공유 디렉터리의 파일에
+기록되고, /metrics는 모든 워커의 값을 합쳐 반환합니다. Gauge는 종료된
+워커의 값이 남지 않도록 live 모드를 사용합니다.
+"""
+
+import asyncio
+import os
+from glob import glob
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# 레이블 없는 메트릭은 정의 시점에 값 파일을 만들므로 디렉터리를 먼저 준비
+if os.environ.get(MULTIPROC_DIR_ENV):
+    os.makedirs(os.environ[MULTIPROC_DIR_ENV], exist_ok=True)
 
 # API 메트릭스
 API_REQUESTS = Counter(
@@ -9,9 +32,21 @@ API_REQUESTS = Counter(
     ["method", "endpoint", "status"],
 )
 
+CLIENT_DISCONNECTS = Counter(
+    "api_client_disconnects_total",
+    "Total number of requests cancelled because the client disconnected",
+    ["endpoint"],
+)
+
 API_REQUEST_DURATION = Histogram(
     "api_request_duration_seconds",
-    "API request duration in seconds",
+    "API request duration in seconds (until the last body chunk for streams)",
+    ["method", "endpoint"],
+)
+
+API_RESPONSE_TTFB = Histogram(
+    "api_response_ttfb_seconds",
+    "Time from request start to the first response body chunk in seconds",
     ["method", "endpoint"],
 )
 
@@ -40,6 +75,130 @@ LLM_API_ERRORS = Counter(
     ["model", "error_type"],
 )
 
+LLM_CACHE_REQUESTS = Counter(
+    "llm_cache_requests_total",
+    "Total number of LLM response cache lookups",
+    ["model", "result"],  # hit, miss, bypass, refresh or error
+)
+
+LLM_CACHE_LATENCY_SAVED = Counter(
+    "llm_cache_latency_saved_seconds_total",
+    "Total LLM latency saved by response cache hits in seconds",
+    ["model"],
+)
+
+LLM_COALESCED_REQUESTS = Counter(
+    "llm_coalesced_requests_total",
+    "Total number of LLM requests served by another in-flight identical request",
+    ["model", "scope"],  # local, redis or stream
+)
+
+LLM_HTTP_CONNECTIONS = Gauge(
+    "llm_http_connections",
+    "Number of pooled LLM HTTP connections",
+    ["state"],  # active or idle
+    multiprocess_mode="livesum",  # 살아 있는 워커 합계
+)
+
+LLM_HTTP_POOL_WAIT = Counter(
+    "llm_http_pool_wait_seconds_total",
+    "Total time spent waiting for a pooled LLM HTTP connection",
+)
+
+LLM_CONCURRENCY_LIMIT = Gauge(
+    "llm_concurrency_limit",
+    "Current adaptive in-flight limit for LLM calls",
+    ["model"],
+    multiprocess_mode="livesum",  # 살아 있는 워커 합계
+)
+
+LLM_IN_FLIGHT = Gauge(
+    "llm_in_flight_requests",
+    "Number of LLM calls currently in flight",
+    ["model"],
+    multiprocess_mode="livesum",  # 살아 있는 워커 합계
+)
+
+LLM_QUEUE_DEPTH = Gauge(
+    "llm_queue_depth",
+    "Number of LLM calls waiting for a concurrency slot",
+    ["model"],
+    multiprocess_mode="livesum",  # 살아 있는 워커 합계
+)
+
+LLM_SHED_REQUESTS = Counter(
+    "llm_shed_requests_total",
+    "Total number of LLM calls rejected by the concurrency limiter",
+    ["model", "reason"],  # queue_full or timeout
+)
+
+LLM_RETRIES = Counter(
+    "llm_retries_total",
+    "Total number of retried LLM calls",
+    ["model", "reason"],  # rate_limit, server_error, timeout or connection
+)
+
+LLM_RETRY_BUDGET_EXHAUSTED = Counter(
+    "llm_retry_budget_exhausted_total",
+    "Total number of retryable LLM errors not retried due to the retry budget",
+    ["model"],
+)
+
+LLM_PROMPT_TOKEN_ESTIMATE_RATIO = Histogram(
+    "llm_prompt_token_estimate_ratio",
+    "Ratio of actual to locally estimated LLM prompt tokens",
+    ["model"],
+    buckets=(0.5, 0.75, 0.9, 1.0, 1.1, 1.25, 1.5, 2.0, 3.0),
+)
+
+LLM_MAX_TOKENS_RESERVED = Histogram(
+    "llm_max_tokens_reserved",
+    "max_tokens reserved per LLM call by the token planner",
+    ["model"],
+    buckets=(256, 512, 1024, 2048, 4096, 8192, 16384),
+)
+
+LLM_TRUNCATED_RESPONSES = Counter(
+    "llm_truncated_responses_total",
+    "Total number of LLM responses cut off by max_tokens",
+    ["model"],
+)
+
+LLM_CANCELLED_CALLS = Counter(
+    "llm_cancelled_calls_total",
+    "Total number of LLM calls cancelled before completion",
+    ["model", "mode"],  # request or stream
+)
+
+LLM_CANCELLED_TOKENS_SAVED = Counter(
+    "llm_cancelled_tokens_saved_total",
+    "Estimated completion tokens not generated due to cancelled LLM calls",
+    ["model"],
+)
+
+# 스트리밍 메트릭스
+SSE_EVENTS_PER_RESPONSE = Histogram(
+    "sse_events_per_response",
+    "Number of SSE events sent per streaming response",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+SSE_DELTAS_PER_RESPONSE = Histogram(
+    "sse_deltas_per_response",
+    "Number of upstream text deltas per streaming response",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+STREAM_RESUMES = Counter(
+    "stream_resumes_total",
+    "Total number of streaming responses resumed with Last-Event-ID",
+)
+
+STREAM_PRODUCERS_ABANDONED = Counter(
+    "stream_producers_abandoned_total",
+    "Total number of stream generations cancelled because no reader remained",
+)
+
 # 함수 실행 메트릭스
 FUNCTION_CALLS = Counter(
     "function_calls_total",
@@ -53,20 +212,152 @@ FUNCTION_ERRORS = Counter(
     ["function_name", "error_type"],
 )
 
+FUNCTION_CANCELLED = Counter(
+    "function_cancelled_total",
+    "Total number of function calls cancelled before completion",
+    ["function_name"],
+)
+
 FUNCTION_DURATION = Histogram(
     "function_duration_seconds",
     "Function execution duration in seconds",
     ["function_name"],
 )
 
+FUNCTION_CACHE_REQUESTS = Counter(
+    "function_cache_requests_total",
+    "Total number of function result cache lookups",
+    ["function_name", "result"],  # local_hit, redis_hit or miss
+)
+
+# 업로드 메트릭스
+UPLOAD_BYTES = Counter(
+    "upload_bytes_total",
+    "Total number of uploaded file bytes stored",
+)
+
+UPLOAD_REJECTED = Counter(
+    "upload_rejected_total",
+    "Total number of rejected uploads",
+    ["reason"],  # size, content_type or signature
+)
+
+# PDF 파싱 메트릭스
+PDF_PARSE_ABORTED = Counter(
+    "pdf_parse_aborted_total",
+    "Total number of page-parallel PDF parses aborted before completion",
+    ["reason"],  # cancelled or error
+)
+
+# PDF 파싱 결과 캐시 메트릭스
+PDF_CACHE_REQUESTS = Counter(
+    "pdf_cache_requests_total",
+    "Total number of parsed PDF page cache lookups",
+    ["result"],  # disk_hit, redis_hit or miss
+)
+
+PDF_CACHE_BYTES_SAVED = Counter(
+    "pdf_cache_bytes_saved_total",
+    "PDF bytes not re-parsed because the parsed pages were cached",
+)
+
+PDF_CACHE_PARSE_SECONDS_SAVED = Counter(
+    "pdf_cache_parse_seconds_saved_total",
+    "Parse time saved by serving parsed PDF pages from the cache",
+)
+
+PDF_CACHE_DISK_BYTES = Gauge(
+    "pdf_cache_disk_bytes",
+    "Size of the local disk tier of the parsed PDF cache",
+    multiprocess_mode="mostrecent",  # 워커들이 같은 디렉터리를 공유
+)
+
+PDF_CACHE_EVICTIONS = Counter(
+    "pdf_cache_evictions_total",
+    "Total number of parsed PDF entries evicted from the local disk tier",
+)
+
+# 청구서 추출 파이프라인 메트릭스
+INVOICE_CHUNKS = Counter(
+    "invoice_chunks_total",
+    "Total number of invoice page chunks sent through LLM extraction",
+    ["result"],  # extracted, empty or invalid
+)
+INVOICE_QUEUE_WAIT = Histogram(
+    "invoice_queue_wait_seconds",
+    "Time invoice page chunks waited for an LLM extraction slot",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
 # Redis 메트릭스
 REDIS_CONNECTIONS = Gauge(
     "redis_connections_total",
     "Total number of Redis connections",
+    multiprocess_mode="livesum",
 )
 
 # 시스템 메트릭스
 MEMORY_USAGE = Gauge(
     "memory_usage_bytes",
     "Memory usage in bytes",
+    multiprocess_mode="liveall",  # 워커(pid)별
 )
+
+
+def multiprocess_dir() -> str | None:
+    """멀티프로세스 메트릭 디렉터리 (단일 프로세스 모드면 None)"""
+    return os.environ.get(MULTIPROC_DIR_ENV) or None
+
+
+def generate_metrics() -> bytes:
+    """Prometheus 노출 형식 메트릭 (멀티프로세스 모드면 모든 워커 합산)"""
+    path = multiprocess_dir()
+    if path is None:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=path)
+    return generate_latest(registry)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def cleanup_dead_workers(path: str | None = None) -> None:
+    """종료된 워커의 live 게이지 파일 정리
+
+    워커 시작 시 호출하면 재시작/교체된 워커의 게이지가 합계에 남지 않습니다.
+    """
+    path = path or multiprocess_dir()
+    if path is None:
+        return
+    pids = {
+        int(os.path.basename(file).rsplit("_", 1)[1].removesuffix(".db"))
+        for file in glob(os.path.join(path, "gauge_live*_*.db"))
+    }
+    for pid in pids:
+        if not _pid_alive(pid):
+            multiprocess.mark_process_dead(pid, path)
+
+
+def update_memory_usage() -> None:
+    """현재 프로세스의 RSS 기록"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except OSError:
+        return
+    MEMORY_USAGE.set(resident_pages * os.sysconf("SC_PAGE_SIZE"))
+
+
+async def monitor_memory_usage(interval: float) -> None:
+    """interval초마다 메모리 사용량 갱신 (워커마다 실행)"""
+    while True:
+        update_memory_usage()
+        await asyncio.sleep(interval)
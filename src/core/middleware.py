@@ -1,47 +1,80 @@
 """API 미들웨어"""
 
 import time
-from typing import Awaitable, Callable
 
 from fastapi import FastAPI, Request, Response
-from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
-from starlette.middleware.base import BaseHTTPMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from structlog import get_logger
 
-from src.core.metrics import API_REQUEST_DURATION, API_REQUESTS
+from src.core.metrics import (
+    API_REQUEST_DURATION,
+    API_REQUESTS,
+    API_RESPONSE_TTFB,
+    generate_metrics,
+)
 
 logger = get_logger()
 
+# 메트릭을 수집하지 않는 시스템 엔드포인트
+EXCLUDED_PATHS = frozenset({"/metrics", "/health"})
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    """Prometheus 메트릭스 수집 미들웨어"""
+# 라우트와 일치하지 않은 요청의 endpoint 레이블 (경로별 시계열 증가 방지)
+UNMATCHED_ENDPOINT = "unmatched"
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        start_time = time.time()
 
-        response = await call_next(request)
+class PrometheusMiddleware:
+    """Prometheus 메트릭스 수집 미들웨어 (순수 ASGI)
 
-        if request.url.path != "/metrics" or request.url.path != "/health":
-            duration = time.time() - start_time
+    요청 경로 대신 라우트 템플릿(/sessions/{session_id} 등)을 endpoint 레이블로
+    사용합니다. 응답을 감싸지 않고 send만 관찰하므로 스트리밍 응답도 그대로
+    전달되며, 첫 본문 청크까지의 시간(TTFB)과 마지막 청크까지의 시간을 따로
+    기록합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+        first_byte_time: float | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, first_byte_time
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body" and first_byte_time is None:
+                first_byte_time = time.perf_counter()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 라우터가 일치한 라우트를 scope에 기록
+            route = scope.get("route")
+            endpoint = getattr(route, "path", UNMATCHED_ENDPOINT)
+            method = scope["method"]
             API_REQUESTS.labels(
-                method=request.method,
-                endpoint=request.url.path,
-                status=response.status_code,
+                method=method, endpoint=endpoint, status=status_code
             ).inc()
-            API_REQUEST_DURATION.labels(
-                method=request.method,
-                endpoint=request.url.path,
-            ).observe(duration)
-
-        return response
+            API_REQUEST_DURATION.labels(method=method, endpoint=endpoint).observe(
+                time.perf_counter() - start_time
+            )
+            if first_byte_time is not None:
+                API_RESPONSE_TTFB.labels(method=method, endpoint=endpoint).observe(
+                    first_byte_time - start_time
+                )
 
 
 async def metrics_endpoint(request: Request) -> Response:
     """Prometheus 메트릭스 엔드포인트"""
     return Response(
-        generate_latest(),
+        generate_metrics(),
         media_type=CONTENT_TYPE_LATEST,
     )
 
@@ -1,18 +1,66 @@
 """FastAPI 애플리케이션"""
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.agent.functions.cache import init_function_cache
+from src.agent.functions.registry import init_function_registry, listen_registry_reloads
 from src.api.system.router import router as system_router
 from src.api.v1.exceptions import register_exception_handlers
 from src.api.v1.router import router as v1_router
 from src.core.config import settings
 from src.core.logging import setup_logging
+from src.core.metrics import cleanup_dead_workers, monitor_memory_usage
 from src.core.middleware import setup_middleware
+from src.services.llm.client import close_openai_client, init_openai_client
+from src.services.llm.singleflight import init_single_flight
+from src.services.pdf.cache import init_document_cache
+from src.services.pdf.pool import close_pdf_pool
+from src.services.redis import close_redis_service, init_redis_service
+from src.services.streams import cancel_stream_producers
 
 # 로깅 설정
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """애플리케이션 수명주기 관리"""
+    # 함수 레지스트리는 요청 경로가 아닌 시작 시점에 한 번만 구성
+    init_function_registry()
+    init_openai_client()
+    redis = init_redis_service()
+    init_single_flight(redis)
+    init_document_cache(redis)
+
+    # 함수 결과 캐시 무효화 메시지 구독
+    function_cache = init_function_cache(redis)
+    invalidation_task = asyncio.create_task(function_cache.listen_invalidations())
+    # 다른 워커에서 요청된 함수 레지스트리 리로드 구독
+    reload_task = asyncio.create_task(listen_registry_reloads(redis))
+
+    # 교체된 워커의 게이지 정리 및 워커별 메모리 사용량 수집
+    cleanup_dead_workers()
+    memory_task = asyncio.create_task(
+        monitor_memory_usage(settings.metrics_memory_interval)
+    )
+    try:
+        yield
+    finally:
+        for task in (invalidation_task, reload_task, memory_task):
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await cancel_stream_producers()
+        close_pdf_pool()
+        await close_openai_client()
+        await close_redis_service()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="Invoice LLM Agent",
@@ -21,6 +69,7 @@ app = FastAPI(
     docs_url=f"{settings.api_prefix}/docs",
     redoc_url=f"{settings.api_prefix}/redoc",
     openapi_url=f"{settings.api_prefix}/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -0,0 +1,192 @@
+"""프로덕션 서버 실행 (pre-fork 멀티 워커)
+
+    python -m src.server
+
+마스터 프로세스가 앱을 미리 import하고 함수 레지스트리를 구성한 뒤 소켓을
+열고 워커를 fork하므로, 모듈과 레지스트리 상태는 copy-on-write로 공유됩니다.
+각 워커는 uvloop/httptools가 설치되어 있으면 사용하고, max_requests개
+(워커별 jitter 추가) 요청을 처리하면 진행 중인 요청을 마친 뒤 종료되어
+마스터가 새 워커로 교체합니다.
+"""
+
+import gc
+import importlib.util
+import os
+import random
+import signal
+import socket
+import sys
+from contextlib import suppress
+from glob import glob
+from types import FrameType
+
+import uvicorn
+from prometheus_client import multiprocess
+from structlog import get_logger
+from uvicorn.config import HTTPProtocolType, LoopSetupType
+
+from src.core.config import settings, worker_count
+from src.core.logging import setup_logging
+from src.core.metrics import multiprocess_dir
+
+logger = get_logger(__name__)
+
+# 워커 종료를 전달하는 신호
+SHUTDOWN_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
+# 앱 시작(lifespan startup)에 실패한 워커의 종료 코드
+WORKER_BOOT_ERROR = 3
+
+
+def event_loop() -> LoopSetupType:
+    """uvicorn 이벤트 루프 구현 (uvloop 설치 시 uvloop)"""
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_protocol() -> HTTPProtocolType:
+    """uvicorn HTTP 파서 구현 (httptools 설치 시 httptools)"""
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def max_requests(limit: int, jitter: int) -> int | None:
+    """워커별 최대 요청 수 (0이면 교체하지 않음)
+
+    워커들이 동시에 교체되지 않도록 0~jitter 사이의 임의 값을 더합니다.
+    """
+    if limit <= 0:
+        return None
+    return limit + random.randint(0, max(jitter, 0))
+
+
+def reset_multiprocess_dir() -> None:
+    """이전 실행의 메트릭 파일 삭제 (워커 fork 전 마스터에서 호출)"""
+    path = multiprocess_dir()
+    if path is None:
+        return
+    os.makedirs(path, exist_ok=True)
+    for file in glob(os.path.join(path, "*.db")):
+        os.remove(file)
+
+
+class Arbiter:
+    """워커 프로세스를 fork하고 종료된 워커를 교체하는 마스터 프로세스"""
+
+    def __init__(self, config: uvicorn.Config, workers: int) -> None:
+        self.config = config
+        self.workers = workers
+        self.children: set[int] = set()
+        self.should_exit = False
+        self.exit_code = 0
+        self.sock: socket.socket | None = None
+
+    def run(self) -> None:
+        self.sock = self.config.bind_socket()
+        for sig in SHUTDOWN_SIGNALS:
+            signal.signal(sig, self._handle_exit)
+
+        # 공유 객체가 GC 참조 갱신으로 워커에 복사되지 않도록 고정
+        gc.freeze()
+        logger.info(
+            "서버 시작",
+            workers=self.workers,
+            loop=self.config.loop,
+            http=self.config.http,
+            max_requests=settings.server_max_requests,
+        )
+        for _ in range(self.workers):
+            self._spawn()
+
+        while self.children:
+            # 신호 처리 후에도 os.wait()는 재시도됨 (PEP 475)
+            pid, status = os.wait()
+            self._reap(pid, status)
+            if not self.should_exit:
+                self._spawn()
+
+        self.sock.close()
+        logger.info("서버 종료", exit_code=self.exit_code)
+
+    def _spawn(self) -> None:
+        assert self.sock is not None
+        pid = os.fork()
+        if pid:
+            self.children.add(pid)
+            return
+
+        # 워커: 마스터의 신호 처리기를 uvicorn 기본 처리로 되돌림
+        for sig in SHUTDOWN_SIGNALS:
+            signal.signal(sig, signal.SIG_DFL)
+        exit_code = 0
+        try:
+            self.config.limit_max_requests = max_requests(
+                settings.server_max_requests, settings.server_max_requests_jitter
+            )
+            server = uvicorn.Server(self.config)
+            server.run(sockets=[self.sock])
+            if not server.started:
+                exit_code = WORKER_BOOT_ERROR
+        except BaseException:
+            logger.exception("워커 실행 실패", pid=os.getpid())
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _reap(self, pid: int, status: int) -> None:
+        self.children.discard(pid)
+        path = multiprocess_dir()
+        if path is not None:
+            multiprocess.mark_process_dead(pid, path)
+        exit_code = os.waitstatus_to_exitcode(status)
+        if self.should_exit:
+            return
+        if exit_code == WORKER_BOOT_ERROR:
+            # 설정 오류 등으로 시작할 수 없으면 재시작을 반복하지 않고 종료
+            logger.error("워커 시작 실패, 서버 종료", pid=pid)
+            self.exit_code = WORKER_BOOT_ERROR
+            self._stop()
+            return
+        logger.info("워커 교체", pid=pid, exit_code=exit_code)
+
+    def _handle_exit(self, signum: int, frame: FrameType | None) -> None:
+        if self.should_exit:
+            return
+        logger.info(
+            "종료 신호 수신, 워커 종료 대기", signal=signal.Signals(signum).name
+        )
+        self._stop()
+
+    def _stop(self) -> None:
+        self.should_exit = True
+        for pid in self.children:
+            with suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+
+def main() -> None:
+    setup_logging()
+    reset_multiprocess_dir()
+
+    # fork 전에 앱과 함수 레지스트리를 구성해 워커가 공유하도록 함
+    from src.agent.functions.registry import init_function_registry
+    from src.main import app
+
+    init_function_registry()
+
+    config = uvicorn.Config(
+        app,
+        host=settings.server_host,
+        port=settings.server_port,
+        loop=event_loop(),
+        http=http_protocol(),
+        backlog=settings.server_backlog,
+        timeout_keep_alive=settings.server_keepalive_timeout,
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+    )
+    config.load()
+    arbiter = Arbiter(config, worker_count(settings.server_workers))
+    arbiter.run()
+    sys.exit(arbiter.exit_code)
+
+
+if __name__ == "__main__":
+    main()
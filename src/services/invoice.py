@@ -0,0 +1,223 @@
+"""PDF 청구서 추출 파이프라인 (페이지 파싱 → 청크별 LLM 추출 → 병합)"""
+
+import asyncio
+import json
+import re
+import time
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+from structlog import get_logger
+
+from src.core.exceptions import AgentError, LLMError
+from src.core.metrics import INVOICE_CHUNKS, INVOICE_QUEUE_WAIT
+from src.services.llm.base import LLMService
+from src.services.pdf.extractor import DocumentStream
+
+logger = get_logger(__name__)
+
+# 첫 번째 값을 사용하는 필드 (문서 머리글)
+HEADER_FIELDS = (
+    "invoice_number",
+    "issue_date",
+    "due_date",
+    "vendor",
+    "customer",
+    "currency",
+)
+
+# 마지막 값을 사용하는 필드 (합계는 보통 마지막 페이지에 있음)
+TOTAL_FIELDS = ("subtotal", "tax", "total")
+
+EXTRACTION_PROMPT = """다음은 청구서 PDF의 {pages} 페이지에서 추출한 텍스트와 표입니다.
+이 페이지들에 나타난 정보만 JSON 객체 하나로 답하세요. 없는 값은 null로 둡니다.
+
+키: {header_fields}, line_items, {total_fields}
+line_items는 description, quantity, unit_price, amount 키를 가진 객체 배열입니다.
+금액과 수량은 숫자로, 날짜는 YYYY-MM-DD 형식으로 답하세요.
+
+{content}"""
+
+CODE_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+@dataclass
+class PageChunk:
+    """LLM 호출 하나로 추출할 연속된 페이지 묶음"""
+
+    index: int
+    pages: list[int] = field(default_factory=list)
+    content: str = ""
+
+
+def format_page(page: dict[str, Any]) -> str:
+    """페이지 결과를 프롬프트용 텍스트로 변환 (표는 탭 구분 행)"""
+    lines = [f"--- page {page['page']} ---"]
+    if page.get("text"):
+        lines.append(page["text"])
+    for table in page.get("tables") or []:
+        lines.append("[table]")
+        lines.extend(
+            "\t".join("" if cell is None else str(cell) for cell in row)
+            for row in table
+        )
+    return "\n".join(lines)
+
+
+def build_prompt(chunk: PageChunk) -> str:
+    """청크 추출 프롬프트"""
+    return EXTRACTION_PROMPT.format(
+        pages=", ".join(str(page) for page in chunk.pages),
+        header_fields=", ".join(HEADER_FIELDS),
+        total_fields=", ".join(TOTAL_FIELDS),
+        content=chunk.content,
+    )
+
+
+def parse_answer(content: str) -> dict[str, Any]:
+    """LLM 응답에서 JSON 객체 추출 (코드 블록 허용, 아니면 ValueError)"""
+    answer = json.loads(CODE_FENCE_PATTERN.sub("", content.strip()))
+    if not isinstance(answer, dict):
+        raise ValueError("Expected a JSON object")
+    return answer
+
+
+def merge_answers(
+    answers: Sequence[tuple[PageChunk, dict[str, Any] | None]],
+    page_errors: Sequence[dict[str, Any]] = (),
+) -> dict[str, Any]:
+    """청크별 추출 결과를 페이지 순서대로 병합
+
+    머리글 필드는 처음 나온 값을, 합계 필드는 마지막에 나온 값을 사용하고,
+    품목은 페이지 순서대로 이어 붙입니다. 응답을 해석하지 못한 청크와
+    파싱에 실패한 페이지(page_errors)는 errors에 페이지 순서로 기록합니다.
+    """
+    merged: dict[str, Any] = {name: None for name in HEADER_FIELDS}
+    line_items: list[dict[str, Any]] = []
+    totals: dict[str, Any] = {name: None for name in TOTAL_FIELDS}
+    errors: list[dict[str, Any]] = list(page_errors)
+
+    for chunk, answer in answers:
+        if answer is None:
+            errors.append({"pages": chunk.pages, "error": "invalid_response"})
+            continue
+        for name in HEADER_FIELDS:
+            if merged[name] is None and answer.get(name) is not None:
+                merged[name] = answer[name]
+        for name in TOTAL_FIELDS:
+            if answer.get(name) is not None:
+                totals[name] = answer[name]
+        items = answer.get("line_items")
+        if isinstance(items, list):
+            line_items.extend(
+                {**item, "pages": chunk.pages}
+                for item in items
+                if isinstance(item, dict)
+            )
+
+    errors.sort(key=lambda error: error["pages"][0])
+    return {**merged, "line_items": line_items, **totals, "errors": errors}
+
+
+class InvoicePipeline:
+    """PDF 페이지를 청크로 묶어 LLM으로 추출하고 결과를 병합
+
+    파싱이 끝난 페이지부터 청크로 묶어 대기열에 넣고, 작업자들이 청크를 꺼내
+    LLM을 동시에 호출하므로 뒤 페이지 파싱과 앞 청크의 LLM 호출이 겹칩니다.
+    대기열 크기가 제한되어 있어 LLM 호출이 밀리면 파싱도 멈추고(파서는 소비된
+    만큼만 다음 범위를 제출), 메모리에는 대기열과 진행 중인 호출의 청크만
+    남습니다. 한 단계가 실패하거나 취소되면 나머지 단계도 취소합니다.
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        chunk_pages: int,
+        concurrency: int,
+        queue_size: int,
+    ) -> None:
+        self.llm_service = llm_service
+        self.chunk_pages = max(1, chunk_pages)
+        self.concurrency = max(1, concurrency)
+        self.queue_size = max(1, queue_size)
+
+    async def run(self, document: DocumentStream) -> dict[str, Any]:
+        """문서 페이지 스트림을 끝까지 소비해 병합된 청구서 정보 반환"""
+        chunks: asyncio.Queue[tuple[PageChunk, float] | None] = asyncio.Queue(
+            maxsize=self.queue_size
+        )
+        answers: dict[int, tuple[PageChunk, dict[str, Any] | None]] = {}
+        page_errors: list[dict[str, Any]] = []
+
+        async def produce() -> None:
+            chunk = PageChunk(index=0)
+            parts: list[str] = []
+            async with aclosing(document.pages) as pages:
+                async for page in pages:
+                    chunk.pages.append(page["page"])
+                    # 파싱에 실패한 페이지(시간 초과 등)는 errors에 기록하고,
+                    # 텍스트가 없는 페이지(스캔 이미지 등)는 제외
+                    if page.get("error"):
+                        page_errors.append(
+                            {"pages": [page["page"]], "error": page["error"]}
+                        )
+                    elif page.get("text") or page.get("tables"):
+                        parts.append(format_page(page))
+                    if len(chunk.pages) >= self.chunk_pages:
+                        chunk.content = "\n\n".join(parts)
+                        await chunks.put((chunk, time.perf_counter()))
+                        chunk, parts = PageChunk(index=chunk.index + 1), []
+            if chunk.pages:
+                chunk.content = "\n\n".join(parts)
+                await chunks.put((chunk, time.perf_counter()))
+            for _ in range(self.concurrency):
+                await chunks.put(None)
+
+        async def extract() -> None:
+            while (item := await chunks.get()) is not None:
+                chunk, queued_at = item
+                INVOICE_QUEUE_WAIT.observe(time.perf_counter() - queued_at)
+                answers[chunk.index] = (chunk, await self._extract(chunk))
+
+        tasks = [asyncio.create_task(produce())] + [
+            asyncio.create_task(extract()) for _ in range(self.concurrency)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return merge_answers([answers[index] for index in sorted(answers)], page_errors)
+
+    async def _extract(self, chunk: PageChunk) -> dict[str, Any] | None:
+        """청크 하나를 LLM으로 추출 (응답을 해석하지 못하면 None)"""
+        if not chunk.content:
+            INVOICE_CHUNKS.labels(result="empty").inc()
+            return {}
+
+        try:
+            response = await self.llm_service.generate(
+                prompt=build_prompt(chunk), streaming=False
+            )
+        except AgentError:
+            raise
+        except Exception as e:
+            logger.error("청구서 추출 LLM 호출 실패", pages=chunk.pages, error=str(e))
+            raise LLMError(str(e)) from e
+
+        if not isinstance(response, dict):
+            raise LLMError("Unexpected response type")
+        try:
+            answer = parse_answer(response["content"])
+        except ValueError as e:
+            logger.warning(
+                "청구서 추출 응답 해석 실패", pages=chunk.pages, error=str(e)
+            )
+            INVOICE_CHUNKS.labels(result="invalid").inc()
+            return None
+
+        INVOICE_CHUNKS.labels(result="extracted").inc()
+        return answer
@@ -1,18 +1,61 @@
 from abc import ABC, abstractmethod
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Sequence
 
-from src.agent.functions.base import AgentFunction
+from src.agent.functions.base import AgentFunction, ToolSet
 
 
 class LLMService(ABC):
     """LLM 서비스 기본 인터페이스"""
 
+    model: str
+    max_tokens: int
+
     @abstractmethod
     async def generate(
         self,
         prompt: str,
-        functions: list[AgentFunction] | None = None,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
         streaming: bool = False,
+        messages: Sequence[dict[str, Any]] | None = None,
     ) -> dict[str, Any] | AsyncIterator[dict[str, Any]]:
-        """LLM 응답 생성"""
+        """LLM 응답 생성 (messages가 있으면 prompt 대신 대화 전체를 전송)"""
         pass
+
+    def plan_max_tokens(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> int:
+        """이 요청에 사용할 max_tokens (캐시된 응답의 재사용 여부 판단에 사용)"""
+        return self.max_tokens
+
+
+def is_truncated(response: dict[str, Any]) -> bool:
+    """max_tokens로 잘린 응답 여부 (캐시하거나 다른 요청과 공유하지 않음)"""
+    return response.get("finish_reason") == "length"
+
+
+def to_tool_set(functions: ToolSet | Sequence[AgentFunction] | None) -> ToolSet | None:
+    """함수 목록을 ToolSet으로 변환 (레지스트리 캐시를 거친 경우 그대로 사용)"""
+    if not functions:
+        return None
+    if isinstance(functions, ToolSet):
+        return functions
+    return ToolSet(functions)
+
+
+async def close_stream(stream: AsyncIterator[Any]) -> None:
+    """스트림을 즉시 닫아 업스트림 연결과 하위 스트림을 정리"""
+    close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+    if close is not None:
+        await close()
+
+
+def build_messages(
+    prompt: str, messages: Sequence[dict[str, Any]] | None = None
+) -> list[dict[str, Any]]:
+    """요청 메시지 목록 구성"""
+    if messages:
+        return list(messages)
+    return [{"role": "user", "content": prompt}]
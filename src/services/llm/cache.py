@@ -0,0 +1,297 @@
+"""LLM 응답 캐시 (Redis)"""
+
+import hashlib
+import json
+import time
+import unicodedata
+from enum import Enum
+from typing import Any, AsyncIterator, Sequence
+
+from openai.types.chat import ChatCompletionMessageToolCall
+from openai.types.chat.chat_completion_message import FunctionCall
+from openai.types.chat.chat_completion_message_tool_call import Function
+from structlog import get_logger
+
+from src.agent.functions.base import AgentFunction, ToolSet
+from src.core.config import settings
+from src.core.metrics import LLM_CACHE_LATENCY_SAVED, LLM_CACHE_REQUESTS
+from src.services.llm.base import LLMService, build_messages, is_truncated, to_tool_set
+from src.services.redis import RedisService
+
+logger = get_logger(__name__)
+
+CACHE_KEY_PREFIX = "llm:response:"
+
+# 캐시된 응답을 스트리밍으로 재생할 때의 청크 크기 (문자 수)
+REPLAY_CHUNK_SIZE = 64
+
+
+class CacheMode(str, Enum):
+    """요청별 캐시 동작"""
+
+    DEFAULT = "default"  # 조회 후 미스 시 저장
+    BYPASS = "bypass"  # 캐시를 사용하지 않음
+    REFRESH = "refresh"  # 조회 없이 새로 생성해 덮어씀
+
+    @classmethod
+    def parse(cls, value: str | None) -> "CacheMode":
+        """헤더 값 파싱 (알 수 없는 값은 기본 동작)"""
+        if value:
+            try:
+                return cls(value.strip().lower())
+            except ValueError:
+                pass
+        return cls.DEFAULT
+
+
+def _normalize(value: Any) -> Any:
+    """키 계산용 정규화 (유니코드 NFC, 공백은 응답에 영향을 주므로 유지)"""
+    if isinstance(value, str):
+        return unicodedata.normalize("NFC", value)
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def build_request_key(
+    model: str,
+    messages: Sequence[dict[str, Any]],
+    tools_hash: str | None,
+    max_tokens: int,
+) -> str:
+    """모델, 메시지, tools 해시, max_tokens로 정규화된 요청 키 생성"""
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": _normalize(list(messages)),
+            "tools": tools_hash,
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def build_generate_key(
+    service: LLMService,
+    prompt: str,
+    tool_set: ToolSet | None,
+    messages: Sequence[dict[str, Any]] | None = None,
+) -> str:
+    """LLMService.generate 호출에 대한 정규화된 요청 키 생성
+
+    요청별로 계획되는 max_tokens는 워커마다, 시간에 따라 달라지므로 키에는
+    서비스에 설정된 상한만 포함합니다.
+    """
+    return build_request_key(
+        service.model,
+        build_messages(prompt, messages),
+        tool_set.schema_hash if tool_set else None,
+        service.max_tokens,
+    )
+
+
+def encode_response(response: dict[str, Any]) -> dict[str, Any]:
+    """LLM 응답을 JSON 직렬화 가능한 형태로 변환"""
+    function_call = response.get("function_call")
+    tool_calls = response.get("tool_calls")
+    return {
+        "content": response.get("content") or "",
+        "function_call": (
+            {"name": function_call.name, "arguments": function_call.arguments}
+            if function_call is not None
+            else None
+        ),
+        "tool_calls": (
+            [
+                {
+                    "id": tool_call.id,
+                    "name": tool_call.function.name,
+                    "arguments": tool_call.function.arguments,
+                }
+                for tool_call in tool_calls
+            ]
+            if tool_calls
+            else None
+        ),
+    }
+
+
+def decode_response(data: dict[str, Any]) -> dict[str, Any]:
+    """직렬화된 응답을 LLM 응답 형태로 복원"""
+    function_call = data.get("function_call")
+    tool_calls = data.get("tool_calls")
+    return {
+        "content": data.get("content") or "",
+        "function_call": (
+            FunctionCall(**function_call) if function_call is not None else None
+        ),
+        "tool_calls": (
+            [
+                ChatCompletionMessageToolCall(
+                    id=tool_call["id"],
+                    type="function",
+                    function=Function(
+                        name=tool_call["name"], arguments=tool_call["arguments"]
+                    ),
+                )
+                for tool_call in tool_calls
+            ]
+            if tool_calls
+            else None
+        ),
+    }
+
+
+async def replay_stream(response: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+    """캐시된 응답을 스트리밍 청크로 재생"""
+    content = response["content"]
+    for start in range(0, len(content), REPLAY_CHUNK_SIZE):
+        yield {"content": content[start : start + REPLAY_CHUNK_SIZE]}
+    for tool_call in response.get("tool_calls") or []:
+        yield {"tool_call": tool_call}
+    if response["function_call"] is not None:
+        yield {"function_call": response["function_call"]}
+
+
+class CachedLLMService(LLMService):
+    """Redis 응답 캐시를 적용한 LLM 서비스"""
+
+    def __init__(
+        self,
+        service: LLMService,
+        redis: RedisService,
+        mode: CacheMode = CacheMode.DEFAULT,
+        ttl: int | None = None,
+    ) -> None:
+        self.service = service
+        self.redis = redis
+        self.mode = mode
+        self.ttl = ttl if ttl is not None else settings.llm_cache_ttl
+        self.model = service.model
+        self.max_tokens = service.max_tokens
+
+    def plan_max_tokens(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> int:
+        return self.service.plan_max_tokens(prompt, functions, messages)
+
+    def cache_key(
+        self,
+        prompt: str,
+        tool_set: ToolSet | None,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> str:
+        """요청 캐시 키"""
+        digest = build_generate_key(self, prompt, tool_set, messages)
+        return f"{CACHE_KEY_PREFIX}{digest}"
+
+    async def generate(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        streaming: bool = False,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> dict[str, Any] | AsyncIterator[dict[str, Any]]:
+        if self.mode is CacheMode.BYPASS:
+            LLM_CACHE_REQUESTS.labels(model=self.model, result="bypass").inc()
+            return await self.service.generate(
+                prompt=prompt,
+                functions=functions,
+                streaming=streaming,
+                messages=messages,
+            )
+
+        tool_set = to_tool_set(functions)
+        key = self.cache_key(prompt, tool_set, messages)
+        max_tokens = self.service.plan_max_tokens(prompt, tool_set, messages)
+
+        if self.mode is CacheMode.DEFAULT:
+            cached = await self._lookup(key, max_tokens)
+            if cached is not None:
+                return replay_stream(cached) if streaming else cached
+        else:
+            LLM_CACHE_REQUESTS.labels(model=self.model, result="refresh").inc()
+
+        # 스트리밍 응답은 저장하지 않고 그대로 전달
+        if streaming:
+            return await self.service.generate(
+                prompt=prompt,
+                functions=tool_set,
+                streaming=streaming,
+                messages=messages,
+            )
+
+        start_time = time.time()
+        response = await self.service.generate(
+            prompt=prompt, functions=tool_set, streaming=streaming, messages=messages
+        )
+        duration = time.time() - start_time
+        # 잘린 응답은 다른 요청에 재사용하지 않음
+        if isinstance(response, dict) and not is_truncated(response):
+            await self._store(key, response, duration, max_tokens)
+        return response
+
+    async def _lookup(self, key: str, max_tokens: int) -> dict[str, Any] | None:
+        """캐시 조회 (Redis 장애나 손상된 항목은 미스로 처리)
+
+        max_tokens보다 작은 예약으로 생성된 항목은 미스로 처리합니다.
+        """
+        start_time = time.time()
+        try:
+            raw = await self.redis.get(key)
+        except Exception as e:
+            logger.warning("LLM 응답 캐시 조회 실패", error=str(e))
+            LLM_CACHE_REQUESTS.labels(model=self.model, result="error").inc()
+            return None
+
+        if raw is None:
+            LLM_CACHE_REQUESTS.labels(model=self.model, result="miss").inc()
+            return None
+
+        try:
+            entry = json.loads(raw)
+            latency = float(entry["latency"])
+            response = decode_response(entry["response"])
+            stored_max_tokens = int(entry.get("max_tokens", 0))
+        except (ValueError, TypeError, KeyError) as e:
+            # 손상된 항목은 미스로 처리 (다음 응답으로 덮어씀)
+            logger.warning("LLM 응답 캐시 항목 해석 실패", error=str(e))
+            LLM_CACHE_REQUESTS.labels(model=self.model, result="error").inc()
+            return None
+
+        if stored_max_tokens < max_tokens:
+            LLM_CACHE_REQUESTS.labels(model=self.model, result="miss").inc()
+            return None
+
+        LLM_CACHE_REQUESTS.labels(model=self.model, result="hit").inc()
+        saved = latency - (time.time() - start_time)
+        if saved > 0:
+            LLM_CACHE_LATENCY_SAVED.labels(model=self.model).inc(saved)
+        return response
+
+    async def _store(
+        self, key: str, response: dict[str, Any], latency: float, max_tokens: int
+    ) -> None:
+        """캐시 저장 (실패해도 응답에는 영향 없음)"""
+        entry = {
+            "response": encode_response(response),
+            "latency": latency,
+            "max_tokens": max_tokens,
+        }
+        try:
+            await self.redis.set(
+                key,
+                json.dumps(entry, separators=(",", ":"), ensure_ascii=False),
+                expire=self.ttl,
+            )
+        except Exception as e:
+            logger.warning("LLM 응답 캐시 저장 실패", error=str(e))
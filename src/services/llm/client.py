@@ -0,0 +1,150 @@
+"""OpenAI HTTP 클라이언트 (워커 단위 공용 커넥션 풀)"""
+
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import httpx
+from openai import AsyncOpenAI
+from structlog import get_logger
+
+from src.core.config import settings
+from src.core.metrics import LLM_HTTP_CONNECTIONS, LLM_HTTP_POOL_WAIT
+
+logger = get_logger(__name__)
+
+# 커넥션을 확보한 뒤에 발생하는 httpcore trace 이벤트 접두사
+_ACQUIRED_EVENT_PREFIXES = ("connection.", "http11.", "http2.")
+
+
+class _PoolResponseStream(httpx.AsyncByteStream):
+    """응답 본문 종료 시 풀 상태를 갱신하는 스트림 래퍼"""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]
+    ) -> None:
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._on_close()
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """커넥션 풀 메트릭을 수집하는 트랜스포트"""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._transport = httpx.AsyncHTTPTransport(**kwargs)
+
+    def update_pool_metrics(self) -> None:
+        """활성/유휴 커넥션 수 갱신"""
+        active = idle = 0
+        for connection in self._transport._pool.connections:
+            if connection.is_closed():
+                continue
+            if connection.is_idle():
+                idle += 1
+            else:
+                active += 1
+        LLM_HTTP_CONNECTIONS.labels(state="active").set(active)
+        LLM_HTTP_CONNECTIONS.labels(state="idle").set(idle)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start_time = time.perf_counter()
+        acquired = False
+        parent_trace: Callable[[str, dict[str, Any]], Awaitable[None]] | None = (
+            request.extensions.get("trace")
+        )
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            # 첫 커넥션 이벤트 시점까지를 풀 대기 시간으로 간주
+            nonlocal acquired
+            if not acquired and event_name.startswith(_ACQUIRED_EVENT_PREFIXES):
+                acquired = True
+                LLM_HTTP_POOL_WAIT.inc(time.perf_counter() - start_time)
+                self.update_pool_metrics()
+            if parent_trace is not None:
+                await parent_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            self.update_pool_metrics()
+            raise
+
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_PoolResponseStream(response.stream, self.update_pool_metrics),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+        self.update_pool_metrics()
+
+
+def create_openai_client() -> AsyncOpenAI:
+    """설정 기반 커넥션 풀을 사용하는 OpenAI 클라이언트 생성"""
+    timeout = httpx.Timeout(
+        settings.openai_read_timeout,
+        connect=settings.openai_connect_timeout,
+        pool=settings.openai_pool_timeout,
+    )
+    transport = InstrumentedTransport(
+        limits=httpx.Limits(
+            max_connections=settings.openai_max_connections,
+            max_keepalive_connections=settings.openai_max_keepalive_connections,
+            keepalive_expiry=settings.openai_keepalive_expiry,
+        ),
+        http2=settings.openai_http2,
+    )
+    http_client = httpx.AsyncClient(transport=transport, timeout=timeout)
+    # 재시도는 RetryingLLMService에서 예산과 함께 처리하므로 SDK 재시도는 끔
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        http_client=http_client,
+        timeout=timeout,
+        max_retries=0,
+    )
+
+
+_client: AsyncOpenAI | None = None
+
+
+def init_openai_client() -> AsyncOpenAI:
+    """워커 공용 OpenAI 클라이언트 초기화 (이미 초기화된 경우 재사용)"""
+    global _client
+    if _client is None:
+        _client = create_openai_client()
+        logger.info(
+            "OpenAI 클라이언트 초기화",
+            max_connections=settings.openai_max_connections,
+            max_keepalive_connections=settings.openai_max_keepalive_connections,
+            http2=settings.openai_http2,
+        )
+    return _client
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """워커 공용 OpenAI 클라이언트 조회"""
+    client = _client
+    if client is None:
+        return init_openai_client()
+    return client
+
+
+async def close_openai_client() -> None:
+    """워커 공용 OpenAI 클라이언트 종료"""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.close()
@@ -0,0 +1,33 @@
+"""LLM 서비스 구성"""
+
+from src.core.config import settings
+from src.services.llm.base import LLMService
+from src.services.llm.cache import CachedLLMService, CacheMode
+from src.services.llm.limiter import LimitedLLMService, get_llm_limiter
+from src.services.llm.retry import RetryingLLMService, get_retry_budget
+from src.services.llm.singleflight import SingleFlightLLMService, get_single_flight
+from src.services.redis import get_redis_service
+
+
+def wrap_llm_service(
+    service: LLMService, cache_mode: CacheMode = CacheMode.DEFAULT
+) -> LLMService:
+    """설정에 따라 제한/재시도/병합/캐시 계층을 적용한 LLM 서비스 구성"""
+    # 업스트림 동시 호출 제한 (병합·캐시로 걸러진 실제 호출에만 적용)
+    if settings.llm_limiter_enabled:
+        service = LimitedLLMService(service, get_llm_limiter(service.model))
+
+    # 일시적 오류 재시도 (시도마다 동시 호출 슬롯을 다시 획득)
+    if settings.llm_retry_max_attempts > 1:
+        service = RetryingLLMService(service, get_retry_budget())
+
+    # 동일한 요청이 동시에 들어오면 업스트림 호출 하나로 병합
+    if settings.llm_singleflight_enabled:
+        service = SingleFlightLLMService(service, get_single_flight())
+
+    # 응답 캐시
+    redis = get_redis_service()
+    if settings.llm_cache_enabled and redis is not None:
+        service = CachedLLMService(service, redis, cache_mode)
+
+    return service
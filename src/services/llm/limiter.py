@@ -0,0 +1,303 @@
+"""LLM 동시 호출 제한 (AIMD)"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import suppress
+from typing import Any, AsyncIterator, Sequence
+
+import openai
+from structlog import get_logger
+
+from src.agent.functions.base import AgentFunction, ToolSet
+from src.core.config import settings
+from src.core.exceptions import ServiceOverloadedError
+from src.core.metrics import (
+    LLM_CONCURRENCY_LIMIT,
+    LLM_IN_FLIGHT,
+    LLM_QUEUE_DEPTH,
+    LLM_SHED_REQUESTS,
+)
+from src.services.llm.base import LLMService, close_stream
+
+logger = get_logger(__name__)
+
+# 과부하 신호로 취급하는 업스트림 상태 코드
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
+# 과부하(429) 시 감소 배율과 지연 증가 시 감소 배율
+OVERLOAD_BACKOFF = 0.5
+LATENCY_BACKOFF = 0.9
+
+# 기준 지연 시간 EWMA 계수
+BASELINE_ALPHA = 0.05
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """업스트림 과부하(429/503) 여부"""
+    return (
+        isinstance(error, openai.APIStatusError)
+        and error.status_code in OVERLOAD_STATUS_CODES
+    )
+
+
+class AdaptiveLimiter:
+    """관측된 지연 시간과 429 비율로 동시 호출 한도를 조정하는 AIMD 리미터
+
+    한도가 찬 상태에서 성공하면 한도를 1/limit씩 늘리고(RTT당 약 1),
+    업스트림 과부하 또는 기준 지연의 tolerance배를 넘는 응답이 관측되면
+    한도를 곱셈으로 줄입니다. 비스트리밍 호출의 소요 시간은 출력 길이에
+    비례하므로 출력 토큰당 시간으로, 스트리밍 호출은 첫 청크까지의 시간으로
+    각각의 기준과 비교합니다. 감소는 기준 지연 시간마다 최대 한 번 적용합니다.
+    한도를 넘는 호출은 제한된 대기열에서 기다리며, 대기열이 가득 찼거나
+    대기 시간이 초과되면 즉시 ServiceOverloadedError(503)로 거절합니다.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        queue_size: int,
+        queue_timeout: float,
+        latency_tolerance: float,
+    ) -> None:
+        self.model = model
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.latency_tolerance = latency_tolerance
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._baseline: float | None = None
+        self._signal_baselines: dict[str, float] = {}
+        self._last_decrease = 0.0
+        self._update_metrics()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """거절 시 안내할 재시도 대기 시간 (초)"""
+        return max(1, math.ceil(self._baseline or 1))
+
+    async def acquire(self) -> None:
+        """호출 슬롯 획득 (대기열 초과 또는 대기 시간 초과 시 503)"""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            self._update_metrics()
+            return
+
+        if len(self._waiters) >= self.queue_size:
+            self._shed("queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._update_metrics()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            # 시간 초과와 같은 반복에서 슬롯을 받았으면 그대로 사용
+            if waiter.done() and not waiter.cancelled():
+                return
+            self._shed("timeout")
+        except asyncio.CancelledError:
+            # 슬롯을 받은 직후 취소되면 반납
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            with suppress(ValueError):
+                self._waiters.remove(waiter)
+            self._update_metrics()
+
+    def release(
+        self,
+        latency: float | None = None,
+        error: BaseException | None = None,
+        completion_tokens: int | None = None,
+    ) -> None:
+        """호출 슬롯 반납 및 한도 조정
+
+        latency는 성공한 호출의 소요 시간이며, completion_tokens가 있으면
+        출력 토큰당 시간으로 환산해 비교합니다. 실패한 호출은 과부하 오류만
+        한도 조정에 반영합니다.
+        """
+        saturated = self._in_flight >= self.limit
+        self._in_flight -= 1
+
+        if error is not None:
+            if is_overload_error(error):
+                self._decrease(OVERLOAD_BACKOFF)
+        elif latency is not None:
+            self._on_latency(latency, completion_tokens, saturated)
+
+        self._wake_waiters()
+        self._update_metrics()
+
+    def _on_latency(
+        self, latency: float, completion_tokens: int | None, saturated: bool
+    ) -> None:
+        # 재시도 안내와 감소 간격에 쓰는 호출 소요 시간 기준
+        if self._baseline is None:
+            self._baseline = latency
+        else:
+            self._baseline += BASELINE_ALPHA * (latency - self._baseline)
+
+        if completion_tokens is None:
+            kind, signal = "first_chunk", latency
+        else:
+            kind, signal = "per_token", latency / max(completion_tokens, 1)
+        baseline = self._signal_baselines.get(kind)
+        if baseline is None:
+            self._signal_baselines[kind] = signal
+            return
+
+        self._signal_baselines[kind] = baseline + BASELINE_ALPHA * (signal - baseline)
+        if signal > baseline * self.latency_tolerance:
+            self._decrease(LATENCY_BACKOFF)
+        elif saturated:
+            # 한도를 다 쓰고 있을 때만 증가 (유휴 상태에서 한도가 부풀지 않도록)
+            self._limit = min(self._limit + 1 / self._limit, float(self.max_limit))
+
+    def _decrease(self, factor: float) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < (self._baseline or 0):
+            return
+        self._last_decrease = now
+        self._limit = max(self._limit * factor, float(self.min_limit))
+        logger.info("LLM 동시 호출 한도 감소", model=self.model, limit=self.limit)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            waiter.set_result(None)
+            self._in_flight += 1
+
+    def _shed(self, reason: str) -> None:
+        LLM_SHED_REQUESTS.labels(model=self.model, reason=reason).inc()
+        raise ServiceOverloadedError(
+            self.retry_after(),
+            details={"limit": self.limit, "queue_depth": self.queue_depth},
+        )
+
+    def _update_metrics(self) -> None:
+        LLM_CONCURRENCY_LIMIT.labels(model=self.model).set(self.limit)
+        LLM_IN_FLIGHT.labels(model=self.model).set(self._in_flight)
+        LLM_QUEUE_DEPTH.labels(model=self.model).set(len(self._waiters))
+
+
+class LimitedLLMService(LLMService):
+    """동시 호출 제한을 적용한 LLM 서비스
+
+    스트리밍 호출은 스트림이 끝날 때까지 슬롯을 점유하며, 지연 시간은 첫
+    청크까지의 시간으로 관측합니다. 비스트리밍 호출은 응답의 출력 토큰 수를
+    함께 전달합니다.
+    """
+
+    def __init__(self, service: LLMService, limiter: AdaptiveLimiter) -> None:
+        self.service = service
+        self.limiter = limiter
+        self.model = service.model
+        self.max_tokens = service.max_tokens
+
+    def plan_max_tokens(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> int:
+        return self.service.plan_max_tokens(prompt, functions, messages)
+
+    async def generate(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        streaming: bool = False,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> dict[str, Any] | AsyncIterator[dict[str, Any]]:
+        if streaming:
+            return self._generate_stream(prompt, functions, messages)
+
+        await self.limiter.acquire()
+        start_time = time.perf_counter()
+        try:
+            response = await self.service.generate(
+                prompt=prompt,
+                functions=functions,
+                streaming=streaming,
+                messages=messages,
+            )
+        except BaseException as e:
+            self.limiter.release(error=e)
+            raise
+        usage = response.get("usage") if isinstance(response, dict) else None
+        self.limiter.release(
+            latency=time.perf_counter() - start_time,
+            completion_tokens=usage["completion_tokens"] if usage else None,
+        )
+        return response
+
+    async def _generate_stream(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        # 스트림을 실제로 소비할 때 슬롯을 획득해 미사용 스트림이 슬롯을 잡지 않도록 함
+        await self.limiter.acquire()
+        start_time = time.perf_counter()
+        latency: float | None = None
+        stream: AsyncIterator[dict[str, Any]] | None = None
+        try:
+            response = await self.service.generate(
+                prompt=prompt, functions=functions, streaming=True, messages=messages
+            )
+            if not isinstance(response, AsyncIterator):
+                raise TypeError("Expected a streaming response")
+            stream = response
+            async for chunk in stream:
+                if latency is None:
+                    latency = time.perf_counter() - start_time
+                yield chunk
+        except BaseException as e:
+            if stream is not None:
+                await close_stream(stream)
+            self.limiter.release(error=e)
+            raise
+        self.limiter.release(latency=latency)
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+
+
+def get_llm_limiter(model: str) -> AdaptiveLimiter:
+    """워커 공용 모델별 리미터 조회 (없으면 설정값으로 생성)"""
+    limiter = _limiters.get(model)
+    if limiter is None:
+        limiter = AdaptiveLimiter(
+            model=model,
+            initial_limit=settings.llm_limiter_initial_limit,
+            min_limit=settings.llm_limiter_min_limit,
+            max_limit=settings.llm_limiter_max_limit,
+            queue_size=settings.llm_limiter_queue_size,
+            queue_timeout=settings.llm_limiter_queue_timeout,
+            latency_tolerance=settings.llm_limiter_latency_tolerance,
+        )
+        _limiters[model] = limiter
+    return limiter
@@ -1,22 +1,30 @@
 """OpenAI API 서비스"""
 
+import asyncio
 import time
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Sequence
 
 from openai import AsyncOpenAI
-from openai.types.chat import ChatCompletionMessageParam
 from openai.types.chat.chat_completion import ChatCompletion
 from structlog import get_logger
 
-from src.agent.functions.base import AgentFunction
+from src.agent.functions.base import AgentFunction, ToolSet
 from src.core.config import settings
 from src.core.metrics import (
     LLM_API_ERRORS,
     LLM_API_LATENCY,
     LLM_API_REQUESTS,
+    LLM_CANCELLED_CALLS,
+    LLM_CANCELLED_TOKENS_SAVED,
+    LLM_MAX_TOKENS_RESERVED,
+    LLM_PROMPT_TOKEN_ESTIMATE_RATIO,
     LLM_TOKEN_USAGE,
+    LLM_TRUNCATED_RESPONSES,
 )
-from src.services.llm.base import LLMService
+from src.services.llm.base import LLMService, build_messages, close_stream, to_tool_set
+from src.services.llm.client import get_openai_client
+from src.services.llm.tokens import estimate_request_tokens, get_token_planner
+from src.services.llm.tool_calls import FunctionCallAssembler, ToolCallAssembler
 
 logger = get_logger(__name__)
 
@@ -24,52 +32,110 @@ logger = get_logger(__name__)
 class OpenAIService(LLMService):
     """OpenAI API 서비스"""
 
-    def __init__(self) -> None:
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+    def __init__(self, client: AsyncOpenAI | None = None) -> None:
+        # 요청마다 커넥션 풀을 새로 만들지 않도록 워커 공용 클라이언트 사용
+        self.client = client if client is not None else get_openai_client()
         self.model = settings.openai_model
         self.max_tokens = settings.openai_max_tokens
+        self.planner = get_token_planner(self.model)
+
+    def _build_params(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None,
+        messages: Sequence[dict[str, Any]] | None,
+    ) -> tuple[dict[str, Any], int]:
+        """요청 파라미터와 입력 토큰 추정치
+
+        max_tokens는 planner가 최근 응답 길이로 정하며, 컨텍스트 창을 넘는
+        입력은 네트워크 호출 전에 ValidationError로 거절됩니다.
+        """
+        chat_messages = build_messages(prompt, messages)
+        tool_set = to_tool_set(functions)
+        estimated_tokens = estimate_request_tokens(
+            chat_messages, tool_set.token_estimate if tool_set else 0
+        )
+        max_tokens = self.planner.plan(estimated_tokens)
+        LLM_MAX_TOKENS_RESERVED.labels(model=self.model).observe(max_tokens)
+
+        params: dict[str, Any] = {
+            "model": self.model,
+            "messages": chat_messages,
+            "max_tokens": max_tokens,
+        }
+        if tool_set:
+            params["tools"] = tool_set.tools
+        return params, estimated_tokens
+
+    def plan_max_tokens(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> int:
+        tool_set = to_tool_set(functions)
+        return self.planner.plan(
+            estimate_request_tokens(
+                build_messages(prompt, messages),
+                tool_set.token_estimate if tool_set else 0,
+            )
+        )
+
+    def _record_usage(
+        self,
+        prompt_tokens: int,
+        completion_tokens: int,
+        estimated_tokens: int,
+        finish_reason: str | None,
+    ) -> None:
+        """토큰 사용량, 추정 오차와 출력 길이 기록"""
+        LLM_TOKEN_USAGE.labels(model=self.model, usage_type="prompt").inc(prompt_tokens)
+        LLM_TOKEN_USAGE.labels(model=self.model, usage_type="completion").inc(
+            completion_tokens
+        )
+        if estimated_tokens > 0:
+            LLM_PROMPT_TOKEN_ESTIMATE_RATIO.labels(model=self.model).observe(
+                prompt_tokens / estimated_tokens
+            )
+        truncated = finish_reason == "length"
+        if truncated:
+            LLM_TRUNCATED_RESPONSES.labels(model=self.model).inc()
+        self.planner.observe(completion_tokens, truncated=truncated)
+
+    def _record_cancel(self, mode: str, generated_tokens: int) -> None:
+        """취소된 호출과 생성하지 않아 절약된 출력 토큰 추정치 기록"""
+        LLM_CANCELLED_CALLS.labels(model=self.model, mode=mode).inc()
+        saved = self.planner.expected_output_tokens() - generated_tokens
+        if saved > 0:
+            LLM_CANCELLED_TOKENS_SAVED.labels(model=self.model).inc(saved)
+        logger.info("LLM 호출 취소", model=self.model, mode=mode)
 
     async def generate(
         self,
         prompt: str,
-        functions: list[AgentFunction] | None = None,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
         streaming: bool = False,
+        messages: Sequence[dict[str, Any]] | None = None,
     ) -> dict[str, Any] | AsyncIterator[dict[str, Any]]:
-        try:
-            if streaming:
-                return self._generate_stream(prompt, functions)
+        if streaming:
+            return self._generate_stream(prompt, functions, messages)
 
+        params, estimated_tokens = self._build_params(prompt, functions, messages)
+        try:
             start_time = time.time()
             LLM_API_REQUESTS.labels(model=self.model).inc()
 
-            messages: list[ChatCompletionMessageParam] = [
-                {"role": "user", "content": prompt}
-            ]
-
-            params: dict[str, Any] = {
-                "model": self.model,
-                "messages": messages,
-                "max_tokens": self.max_tokens,
-            }
-
-            if functions:
-                tools = [
-                    {"type": "function", "function": func.to_dict()}
-                    for func in functions
-                ]
-                params["tools"] = tools
-
             completion: ChatCompletion = await self.client.chat.completions.create(
                 **params
             )
 
             # 토큰 사용량 메트릭 수집
             if completion.usage:
-                LLM_TOKEN_USAGE.labels(model=self.model, usage_type="prompt").inc(
-                    completion.usage.prompt_tokens
-                )
-                LLM_TOKEN_USAGE.labels(model=self.model, usage_type="completion").inc(
-                    completion.usage.completion_tokens
+                self._record_usage(
+                    completion.usage.prompt_tokens,
+                    completion.usage.completion_tokens,
+                    estimated_tokens,
+                    completion.choices[0].finish_reason,
                 )
 
             # 응답 시간 메트릭 수집
@@ -80,8 +146,21 @@ class OpenAIService(LLMService):
             return {
                 "content": message.content or "",
                 "function_call": message.function_call,
+                "tool_calls": message.tool_calls,
+                "finish_reason": completion.choices[0].finish_reason,
+                "usage": (
+                    {
+                        "prompt_tokens": completion.usage.prompt_tokens,
+                        "completion_tokens": completion.usage.completion_tokens,
+                    }
+                    if completion.usage
+                    else None
+                ),
             }
 
+        except asyncio.CancelledError:
+            self._record_cancel("request", 0)
+            raise
         except Exception as e:
             logger.error("OpenAI API 호출 실패", error=str(e))
             LLM_API_ERRORS.labels(
@@ -91,42 +170,65 @@ class OpenAIService(LLMService):
             raise
 
     async def _generate_stream(
-        self, prompt: str, functions: list[AgentFunction] | None = None
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        messages: Sequence[dict[str, Any]] | None = None,
     ) -> AsyncIterator[dict[str, Any]]:
-        messages: list[ChatCompletionMessageParam] = [
-            {"role": "user", "content": prompt}
-        ]
-
-        params: dict[str, Any] = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": self.max_tokens,
-            "stream": True,
-        }
-
-        if functions:
-            tools = [
-                {"type": "function", "function": func.to_dict()} for func in functions
-            ]
-            params["tools"] = tools
-
+        params, estimated_tokens = self._build_params(prompt, functions, messages)
+        params["stream"] = True
+        # 마지막 청크로 토큰 사용량을 받아 추정치와 비교
+        params["stream_options"] = {"include_usage": True}
+
+        stream: Any = None
+        # 스트림 청크는 대부분 토큰 하나이므로 받은 델타 수로 생성량을 근사
+        received_deltas = 0
         try:
             start_time = time.time()
             LLM_API_REQUESTS.labels(model=self.model).inc()
 
             stream = await self.client.chat.completions.create(**params)
 
+            tool_calls = ToolCallAssembler()
+            function_call = FunctionCallAssembler()
+            finish_reason: str | None = None
             async for chunk in stream:
+                if chunk.usage is not None:
+                    self._record_usage(
+                        chunk.usage.prompt_tokens,
+                        chunk.usage.completion_tokens,
+                        estimated_tokens,
+                        finish_reason,
+                    )
+                if not chunk.choices:
+                    continue
+                if chunk.choices[0].finish_reason:
+                    finish_reason = chunk.choices[0].finish_reason
                 delta = chunk.choices[0].delta
+                received_deltas += 1
                 if delta.content:
                     yield {"content": delta.content}
+                if delta.tool_calls:
+                    # 완성된 tool call은 스트림이 끝나기 전에 바로 전달
+                    for tool_call in tool_calls.add(delta.tool_calls):
+                        yield {"tool_call": tool_call}
                 elif delta.function_call:
-                    yield {"function_call": delta.function_call}
+                    function_call.add(delta.function_call)
+
+            for tool_call in tool_calls.finish():
+                yield {"tool_call": tool_call}
+            legacy_call = function_call.finish()
+            if legacy_call is not None:
+                yield {"function_call": legacy_call}
 
             # 응답 시간 메트릭 수집
             duration = time.time() - start_time
             LLM_API_LATENCY.labels(model=self.model).observe(duration)
 
+        except (asyncio.CancelledError, GeneratorExit):
+            # 소비자가 스트림을 버리면 업스트림 생성도 중단
+            self._record_cancel("stream", received_deltas)
+            raise
         except Exception as e:
             logger.error("OpenAI 스트리밍 API 호출 실패", error=str(e))
             LLM_API_ERRORS.labels(
@@ -134,3 +236,6 @@ class OpenAIService(LLMService):
                 error_type=type(e).__name__,
             ).inc()
             raise
+        finally:
+            if stream is not None:
+                await close_stream(stream)
@@ -0,0 +1,243 @@
+"""LLM 호출 재시도 정책"""
+
+import time
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Sequence, TypeVar
+
+import openai
+from structlog import get_logger
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+from tenacity.wait import wait_base
+
+from src.agent.functions.base import AgentFunction, ToolSet
+from src.core.config import settings
+from src.core.metrics import LLM_RETRIES, LLM_RETRY_BUDGET_EXHAUSTED
+from src.services.llm.base import LLMService, close_stream
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# 재시도 가능한 업스트림 상태 코드
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+def retry_reason(error: BaseException) -> str | None:
+    """재시도 가능한 오류의 분류 (재시도 불가능하면 None)"""
+    if isinstance(error, openai.APITimeoutError):
+        return "timeout"
+    if isinstance(error, openai.APIConnectionError):
+        return "connection"
+    if isinstance(error, openai.APIStatusError):
+        if error.status_code not in RETRYABLE_STATUS_CODES:
+            return None
+        if error.status_code == 429:
+            # 할당량 소진은 기다려도 해결되지 않음
+            if getattr(error, "code", None) == "insufficient_quota":
+                return None
+            return "rate_limit"
+        return "server_error"
+    return None
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """업스트림 응답의 Retry-After 값 (초)"""
+    if not isinstance(error, openai.APIStatusError):
+        return None
+    headers = error.response.headers
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(float(retry_after_ms) / 1000, 0.0)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after).timestamp()
+        return max(float(retry_at) - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryBudget:
+    """워커 공용 재시도 예산 (토큰 버킷)
+
+    요청마다 ratio만큼 토큰이 쌓이고 재시도마다 1개를 사용합니다. 장애로
+    대부분의 요청이 실패해도 재시도는 전체 요청의 ratio 비율을 넘지 않아
+    업스트림 장애를 증폭시키지 않습니다.
+    """
+
+    def __init__(self, ratio: float, capacity: float) -> None:
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = capacity
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def deposit(self) -> None:
+        self._tokens = min(self._tokens + self.ratio, self.capacity)
+
+    def try_spend(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class wait_retry_after(wait_base):
+    """Retry-After가 있으면 그 값을, 없으면 대체 전략의 대기 시간을 사용"""
+
+    def __init__(self, fallback: wait_base) -> None:
+        self.fallback = fallback
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        if retry_state.outcome is not None:
+            error = retry_state.outcome.exception()
+            if error is not None:
+                retry_after = retry_after_seconds(error)
+                if retry_after is not None:
+                    return retry_after
+        return self.fallback(retry_state)
+
+
+class RetryingLLMService(LLMService):
+    """재시도 정책을 적용한 LLM 서비스
+
+    스트리밍 호출은 첫 청크를 받기 전까지의 실패(스트림 생성 실패)만
+    재시도합니다. 이미 클라이언트에 전달된 청크가 있으면 재시도하지 않습니다.
+    """
+
+    def __init__(self, service: LLMService, budget: RetryBudget) -> None:
+        self.service = service
+        self.budget = budget
+        self.model = service.model
+        self.max_tokens = service.max_tokens
+
+    def plan_max_tokens(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> int:
+        return self.service.plan_max_tokens(prompt, functions, messages)
+
+    def _should_retry(self, retry_state: RetryCallState) -> bool:
+        outcome = retry_state.outcome
+        error = outcome.exception() if outcome is not None else None
+        if error is None:
+            return False
+        reason = retry_reason(error)
+        if reason is None:
+            return False
+        # tenacity는 중단 조건보다 먼저 호출하므로, 마지막 시도 이후에는
+        # 예산과 메트릭에 반영하지 않음
+        if retry_state.attempt_number >= settings.llm_retry_max_attempts:
+            return False
+
+        # Retry-After가 최대 대기 시간보다 길면 바로 실패로 반환
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None and retry_after > settings.llm_retry_max_delay:
+            return False
+
+        if not self.budget.try_spend():
+            LLM_RETRY_BUDGET_EXHAUSTED.labels(model=self.model).inc()
+            return False
+
+        LLM_RETRIES.labels(model=self.model, reason=reason).inc()
+        logger.warning("LLM 호출 재시도", model=self.model, reason=reason)
+        return True
+
+    def _retrying(self) -> AsyncRetrying:
+        return AsyncRetrying(
+            stop=stop_after_attempt(settings.llm_retry_max_attempts),
+            wait=wait_retry_after(
+                wait_random_exponential(
+                    multiplier=settings.llm_retry_initial_delay,
+                    max=settings.llm_retry_max_delay,
+                )
+            ),
+            retry=self._should_retry,
+            reraise=True,
+        )
+
+    async def _call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        async for attempt in self._retrying():
+            with attempt:
+                return await fn()
+        # reraise=True이므로 도달하지 않음
+        raise AssertionError("unreachable")
+
+    async def generate(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        streaming: bool = False,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> dict[str, Any] | AsyncIterator[dict[str, Any]]:
+        self.budget.deposit()
+        if streaming:
+            return self._generate_stream(prompt, functions, messages)
+        return await self._call(
+            partial(
+                self.service.generate,
+                prompt=prompt,
+                functions=functions,
+                streaming=streaming,
+                messages=messages,
+            )
+        )
+
+    async def _generate_stream(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        async def open_stream() -> (
+            tuple[AsyncIterator[dict[str, Any]], dict[str, Any] | None]
+        ):
+            stream = await self.service.generate(
+                prompt=prompt, functions=functions, streaming=True, messages=messages
+            )
+            if not isinstance(stream, AsyncIterator):
+                raise TypeError("Expected a streaming response")
+            return stream, await anext(stream, None)
+
+        stream, first = await self._call(open_stream)
+        try:
+            if first is None:
+                return
+            yield first
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await close_stream(stream)
+
+
+_retry_budget: RetryBudget | None = None
+
+
+def get_retry_budget() -> RetryBudget:
+    """워커 공용 재시도 예산 조회 (없으면 설정값으로 생성)"""
+    global _retry_budget
+    if _retry_budget is None:
+        _retry_budget = RetryBudget(
+            settings.llm_retry_budget_ratio, settings.llm_retry_budget_capacity
+        )
+    return _retry_budget
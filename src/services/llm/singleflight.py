@@ -0,0 +1,371 @@
+"""동일 LLM 요청 병합 (single-flight)"""
+
+import asyncio
+import json
+import time
+import uuid
+from functools import partial
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Sequence
+
+from structlog import get_logger
+
+from src.agent.functions.base import AgentFunction, ToolSet
+from src.core.config import settings
+from src.core.exceptions import LLMError
+from src.core.metrics import LLM_COALESCED_REQUESTS
+from src.services.llm.base import LLMService, close_stream, is_truncated, to_tool_set
+from src.services.llm.cache import build_generate_key, decode_response, encode_response
+from src.services.redis import RedisService
+
+logger = get_logger(__name__)
+
+LOCK_KEY_PREFIX = "llm:singleflight:lock:"
+RESULT_KEY_PREFIX = "llm:singleflight:result:"
+
+GenerateResult = dict[str, Any] | AsyncIterator[dict[str, Any]]
+
+
+class _Broadcast:
+    """하나의 업스트림 스트림을 여러 구독자에게 분배
+
+    늦게 합류한 구독자는 지금까지 받은 청크부터 재생합니다. 구독자는 subscribe()
+    호출 시점에 등록되며, 모든 구독자가 떠나면 업스트림 수신을 중단합니다.
+    """
+
+    def __init__(self, open_stream: Callable[[], Awaitable[GenerateResult]]) -> None:
+        self._open_stream = open_stream
+        self._chunks: list[dict[str, Any]] = []
+        self._error: BaseException | None = None
+        self._done = False
+        self._subscribers = 0
+        self._condition = asyncio.Condition()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def start(self, on_done: Callable[[], None]) -> None:
+        self._task = asyncio.create_task(self._pump())
+        self._task.add_done_callback(lambda _: on_done())
+
+    async def _pump(self) -> None:
+        stream: GenerateResult | None = None
+        try:
+            stream = await self._open_stream()
+            if not isinstance(stream, AsyncIterator):
+                raise TypeError("Expected a streaming response")
+            async for chunk in stream:
+                async with self._condition:
+                    self._chunks.append(chunk)
+                    self._condition.notify_all()
+        except asyncio.CancelledError:
+            # 남은 구독자 자신의 태스크는 취소되지 않았으므로 일반 오류로 전달
+            self._error = LLMError("Shared LLM stream was cancelled")
+            if isinstance(stream, AsyncIterator):
+                await close_stream(stream)
+            raise
+        except Exception as e:
+            self._error = e
+        finally:
+            async with self._condition:
+                self._done = True
+                self._condition.notify_all()
+
+    def _has_chunks_after(self, index: int) -> bool:
+        return index < len(self._chunks) or self._done
+
+    def subscribe(self) -> "_Subscription":
+        """구독자 등록 후 처음부터 재생하는 스트림 반환"""
+        return _Subscription(self)
+
+    def _unsubscribe(self) -> None:
+        self._subscribers -= 1
+        if self._subscribers == 0 and not self._done and self._task is not None:
+            self._task.cancel()
+
+    async def _iterate(self) -> AsyncGenerator[dict[str, Any], None]:
+        index = 0
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(partial(self._has_chunks_after, index))
+                pending = self._chunks[index:]
+                finished = self._done
+            index += len(pending)
+            for chunk in pending:
+                yield chunk
+            if finished and index >= len(self._chunks):
+                if self._error is not None:
+                    raise self._error
+                return
+
+
+class _Subscription:
+    """_Broadcast 구독자 하나의 스트림
+
+    생성 시점에 구독자로 등록되므로, 아직 읽기 전인 구독자가 있는 동안에는
+    다른 구독자가 모두 떠나도 업스트림 수신이 계속됩니다. 끝까지 읽거나
+    aclose()로 닫으면 등록이 해제됩니다.
+    """
+
+    def __init__(self, broadcast: _Broadcast) -> None:
+        self._broadcast = broadcast
+        self._iterator = broadcast._iterate()
+        self._closed = False
+        broadcast._subscribers += 1
+
+    def __aiter__(self) -> "_Subscription":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return await anext(self._iterator)
+        except BaseException:
+            self._leave()
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            await self._iterator.aclose()
+        finally:
+            self._leave()
+
+    def _leave(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._broadcast._unsubscribe()
+
+
+class SingleFlight:
+    """동일 키 요청을 하나의 업스트림 호출로 병합
+
+    워커 내부에서는 진행 중인 태스크를 공유하고, 워커 간에는 짧은 Redis 락과
+    결과 채널로 리더의 결과를 전달받습니다. 스트리밍 요청은 워커 내부에서만
+    하나의 업스트림 스트림을 공유합니다.
+    """
+
+    def __init__(self, redis: RedisService | None = None) -> None:
+        self.redis = redis
+        self._calls: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        self._waiters: dict[asyncio.Task[dict[str, Any]], int] = {}
+        self._streams: dict[str, _Broadcast] = {}
+
+    async def call(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[GenerateResult]],
+        model: str,
+    ) -> dict[str, Any]:
+        """비스트리밍 호출 병합 (모든 대기자가 떠나면 업스트림 호출 취소)"""
+        task = self._calls.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.create_task(self._call_distributed(key, fn, model))
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._finish_call(key, t))
+        else:
+            LLM_COALESCED_REQUESTS.labels(model=model, scope="local").inc()
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # 한 호출자가 취소되어도 다른 대기자는 결과를 받도록 shield
+            result = await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if self._waiters[task] == 0:
+                del self._waiters[task]
+                if not task.done():
+                    # 새 요청이 취소 중인 호출에 합류하지 않도록 먼저 제거
+                    if self._calls.get(key) is task:
+                        del self._calls[key]
+                    task.cancel()
+
+        if shared:
+            if is_truncated(result):
+                # 잘린 응답은 공유하지 않고 직접 호출
+                return await self._invoke(fn)
+            # 토큰 사용량은 실제 호출한 요청에만 집계되도록 제외
+            return {**result, "usage": None}
+        return result
+
+    def _finish_call(self, key: str, task: asyncio.Task[dict[str, Any]]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # 모든 대기자가 떠난 경우에도 예외 미확인 경고가 남지 않도록 조회
+            task.exception()
+
+    def stream(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[GenerateResult]],
+        model: str,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """스트리밍 호출 병합 (워커 내부 fan-out)"""
+        broadcast = self._streams.get(key)
+        if broadcast is not None and not broadcast.done:
+            LLM_COALESCED_REQUESTS.labels(model=model, scope="stream").inc()
+            return broadcast.subscribe()
+
+        broadcast = _Broadcast(fn)
+        self._streams[key] = broadcast
+        subscription = broadcast.subscribe()
+        broadcast.start(lambda: self._finish_stream(key, broadcast))
+        return subscription
+
+    def _finish_stream(self, key: str, broadcast: _Broadcast) -> None:
+        if self._streams.get(key) is broadcast:
+            del self._streams[key]
+
+    async def _call_distributed(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[GenerateResult]],
+        model: str,
+    ) -> dict[str, Any]:
+        """Redis 락으로 워커 간 리더를 정해 호출"""
+        if self.redis is None:
+            return await self._invoke(fn)
+
+        lock_key = f"{LOCK_KEY_PREFIX}{key}"
+        result_key = f"{RESULT_KEY_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.redis.acquire_lock(
+                lock_key, token, settings.llm_singleflight_lock_ttl
+            )
+        except Exception:
+            return await self._invoke(fn)
+
+        if not acquired:
+            result = await self._wait_for_leader(result_key)
+            if result is not None:
+                LLM_COALESCED_REQUESTS.labels(model=model, scope="redis").inc()
+                return result
+            # 리더 실패 또는 대기 시간 초과 시 직접 호출
+            return await self._invoke(fn)
+
+        # 결과를 발행한 뒤에 락을 해제해야 새 리더가 중복 호출하지 않음
+        try:
+            try:
+                result = await self._invoke(fn)
+            except Exception:
+                await self._publish(result_key, {"error": True})
+                raise
+            if is_truncated(result):
+                # 잘린 응답은 공유하지 않음 (대기 중인 워커는 직접 호출)
+                await self._publish(result_key, {"error": True})
+            else:
+                await self._publish(result_key, {"response": encode_response(result)})
+            return result
+        finally:
+            try:
+                await self.redis.release_lock(lock_key, token)
+            except Exception:
+                pass
+
+    @staticmethod
+    async def _invoke(fn: Callable[[], Awaitable[GenerateResult]]) -> dict[str, Any]:
+        result = await fn()
+        if not isinstance(result, dict):
+            raise TypeError("Expected a non-streaming response")
+        return result
+
+    async def _publish(self, result_key: str, message: dict[str, Any]) -> None:
+        """리더 결과를 짧은 TTL로 저장하고 대기 중인 워커에 발행"""
+        assert self.redis is not None
+        payload = json.dumps(message, ensure_ascii=False)
+        try:
+            await self.redis.set(
+                result_key, payload, expire=settings.llm_singleflight_result_ttl
+            )
+            await self.redis.publish(result_key, payload)
+        except Exception as e:
+            logger.warning("single-flight 결과 발행 실패", error=str(e))
+
+    async def _wait_for_leader(self, result_key: str) -> dict[str, Any] | None:
+        """리더 결과 대기 (실패 또는 시간 초과 시 None)"""
+        assert self.redis is not None
+        deadline = time.monotonic() + settings.llm_singleflight_wait_timeout
+        pubsub = self.redis.client.pubsub()
+        try:
+            await pubsub.subscribe(result_key)
+            # 구독 전에 리더가 이미 결과를 발행했을 수 있으므로 먼저 확인
+            raw = await self.redis.get(result_key)
+            while raw is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=remaining
+                )
+                if message is not None and message["type"] == "message":
+                    raw = message["data"]
+        except Exception as e:
+            logger.warning("single-flight 결과 대기 실패", error=str(e))
+            return None
+        finally:
+            await pubsub.reset()
+
+        data = json.loads(raw)
+        if data.get("error"):
+            return None
+        return decode_response(data["response"])
+
+
+class SingleFlightLLMService(LLMService):
+    """동일 요청 병합을 적용한 LLM 서비스"""
+
+    def __init__(self, service: LLMService, group: SingleFlight) -> None:
+        self.service = service
+        self.group = group
+        self.model = service.model
+        self.max_tokens = service.max_tokens
+
+    def plan_max_tokens(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> int:
+        return self.service.plan_max_tokens(prompt, functions, messages)
+
+    async def generate(
+        self,
+        prompt: str,
+        functions: ToolSet | Sequence[AgentFunction] | None = None,
+        streaming: bool = False,
+        messages: Sequence[dict[str, Any]] | None = None,
+    ) -> dict[str, Any] | AsyncIterator[dict[str, Any]]:
+        tool_set = to_tool_set(functions)
+        key = build_generate_key(self, prompt, tool_set, messages)
+
+        def fn() -> Awaitable[GenerateResult]:
+            return self.service.generate(
+                prompt=prompt,
+                functions=tool_set,
+                streaming=streaming,
+                messages=messages,
+            )
+
+        if streaming:
+            return self.group.stream(key, fn, self.model)
+        return await self.group.call(key, fn, self.model)
+
+
+_single_flight: SingleFlight | None = None
+
+
+def init_single_flight(redis: RedisService | None = None) -> SingleFlight:
+    """워커 공용 single-flight 그룹 초기화"""
+    global _single_flight
+    _single_flight = SingleFlight(redis)
+    return _single_flight
+
+
+def get_single_flight() -> SingleFlight:
+    """워커 공용 single-flight 그룹 조회 (미초기화 시 워커 내부 전용으로 생성)"""
+    group = _single_flight
+    if group is None:
+        return init_single_flight()
+    return group
@@ -0,0 +1,148 @@
+"""오프라인 토큰 수 추정 및 출력 토큰 예산 계획"""
+
+import math
+import re
+from collections import deque
+from typing import Any, Sequence
+
+from src.core.config import settings
+from src.core.exceptions import ValidationError
+
+# 메시지마다 역할/구분자로 추가되는 토큰 수
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# 응답 시작 구분자 토큰 수
+REPLY_OVERHEAD_TOKENS = 3
+
+# 영문 단어 조각의 토큰당 평균 문자 수
+ASCII_CHARS_PER_TOKEN = 6
+
+# 구두점 연속의 토큰당 평균 문자 수
+PUNCTUATION_CHARS_PER_TOKEN = 3
+
+# BPE 토크나이저의 사전 분할 규칙 근사 (단어, 3자리 숫자, 구두점, 공백)
+PRETOKENIZE_PATTERN = re.compile(
+    r"'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+|_+|\s+"
+)
+
+# 출력 토큰 예산 계산에 필요한 최소 관측 수
+MIN_OUTPUT_SAMPLES = 20
+
+
+def _estimate_piece(piece: str) -> int:
+    piece = piece.lstrip(" ")
+    if not piece or piece.isspace() or piece[0].isdigit():
+        return 1
+    if piece[0].isalpha():
+        # 한글 등 비ASCII 문자는 문자당 약 1토큰
+        ascii_chars = sum(1 for char in piece if char.isascii())
+        return math.ceil(ascii_chars / ASCII_CHARS_PER_TOKEN) + (
+            len(piece) - ascii_chars
+        )
+    return math.ceil(len(piece) / PUNCTUATION_CHARS_PER_TOKEN)
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트 토큰 수 추정
+
+    토크나이저 없이 사전 분할 규칙을 근사해 조각별로 계산합니다. 실제 값과의
+    비율은 llm_prompt_token_estimate_ratio 메트릭으로 확인할 수 있습니다.
+    """
+    return sum(_estimate_piece(piece) for piece in PRETOKENIZE_PATTERN.findall(text))
+
+
+def estimate_message_tokens(messages: Sequence[dict[str, Any]]) -> int:
+    """메시지 목록 토큰 수 추정 (tool_calls 포함)"""
+    total = 0
+    for message in messages:
+        total += MESSAGE_OVERHEAD_TOKENS + estimate_tokens(
+            str(message.get("content") or "")
+        )
+        for tool_call in message.get("tool_calls") or []:
+            function = tool_call.get("function") or {}
+            total += estimate_tokens(function.get("name") or "")
+            total += estimate_tokens(function.get("arguments") or "")
+    return total
+
+
+def estimate_request_tokens(
+    messages: Sequence[dict[str, Any]], tools_tokens: int = 0
+) -> int:
+    """요청 전체(메시지 + tools 스키마)의 입력 토큰 수 추정"""
+    return estimate_message_tokens(messages) + tools_tokens + REPLY_OVERHEAD_TOKENS
+
+
+class TokenPlanner:
+    """요청별 max_tokens 계획
+
+    최근 응답의 출력 토큰 수를 관측해 상위 백분위수에 여유 배수를 곱한 만큼만
+    예약합니다. 관측이 부족하면 설정된 최댓값을 사용하며, 응답이 길이 제한으로
+    잘리면 최댓값을 관측한 것으로 기록해 예약량을 빠르게 늘립니다. 입력이
+    컨텍스트 창을 넘으면 네트워크 호출 전에 거절합니다.
+    """
+
+    def __init__(
+        self,
+        context_window: int,
+        max_output_tokens: int,
+        min_output_tokens: int,
+        headroom: float,
+        sample_size: int,
+        percentile: float = 99.0,
+    ) -> None:
+        self.context_window = context_window
+        self.max_output_tokens = max_output_tokens
+        self.min_output_tokens = min_output_tokens
+        self.headroom = headroom
+        self.percentile = percentile
+        self._samples: deque[int] = deque(maxlen=sample_size)
+
+    def _reserve(self) -> int:
+        if len(self._samples) < MIN_OUTPUT_SAMPLES:
+            return self.max_output_tokens
+        ordered = sorted(self._samples)
+        rank = max(math.ceil(self.percentile / 100 * len(ordered)), 1)
+        reserve = math.ceil(ordered[rank - 1] * self.headroom)
+        return min(max(reserve, self.min_output_tokens), self.max_output_tokens)
+
+    def expected_output_tokens(self) -> int:
+        """관측된 출력 토큰 수의 중앙값 (관측이 없으면 0)"""
+        if not self._samples:
+            return 0
+        ordered = sorted(self._samples)
+        return ordered[(len(ordered) - 1) // 2]
+
+    def plan(self, prompt_tokens: int) -> int:
+        """입력 토큰 추정치로 max_tokens 결정"""
+        available = self.context_window - prompt_tokens
+        if available < self.min_output_tokens:
+            raise ValidationError(
+                "Request exceeds the model context window",
+                details={
+                    "estimated_tokens": prompt_tokens,
+                    "context_window": self.context_window,
+                },
+            )
+        return min(self._reserve(), available)
+
+    def observe(self, completion_tokens: int, truncated: bool = False) -> None:
+        """실제 출력 토큰 수 기록"""
+        self._samples.append(self.max_output_tokens if truncated else completion_tokens)
+
+
+_planners: dict[str, TokenPlanner] = {}
+
+
+def get_token_planner(model: str) -> TokenPlanner:
+    """워커 공용 모델별 planner 조회 (없으면 설정값으로 생성)"""
+    planner = _planners.get(model)
+    if planner is None:
+        planner = TokenPlanner(
+            context_window=settings.openai_context_window,
+            max_output_tokens=settings.openai_max_tokens,
+            min_output_tokens=settings.openai_min_output_tokens,
+            headroom=settings.openai_output_headroom,
+            sample_size=settings.openai_output_sample_size,
+        )
+        _planners[model] = planner
+    return planner
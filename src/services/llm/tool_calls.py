@@ -0,0 +1,85 @@
+"""스트리밍 tool call 조립"""
+
+from typing import Iterable
+
+from openai.types.chat import ChatCompletionMessageToolCall
+from openai.types.chat.chat_completion_chunk import (
+    ChoiceDeltaFunctionCall,
+    ChoiceDeltaToolCall,
+)
+from openai.types.chat.chat_completion_message import FunctionCall
+from openai.types.chat.chat_completion_message_tool_call import Function
+
+
+class _PendingToolCall:
+    def __init__(self) -> None:
+        self.id = ""
+        self.name = ""
+        self.arguments: list[str] = []
+
+    def build(self) -> ChatCompletionMessageToolCall:
+        return ChatCompletionMessageToolCall(
+            id=self.id,
+            type="function",
+            function=Function(name=self.name, arguments="".join(self.arguments)),
+        )
+
+
+class ToolCallAssembler:
+    """tool_calls 델타를 index별로 조립
+
+    OpenAI는 여러 tool call을 index 순서대로 이어서 스트리밍하므로, 다음 index의
+    델타가 도착하면 이전 호출의 arguments는 완성된 것입니다. 완성된 호출은 즉시
+    반환되어 나머지 스트림을 받는 동안 함수를 실행할 수 있습니다.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[int, _PendingToolCall] = {}
+
+    def add(
+        self, deltas: Iterable[ChoiceDeltaToolCall]
+    ) -> list[ChatCompletionMessageToolCall]:
+        """델타를 반영하고 이번에 완성된 호출 반환"""
+        completed: list[ChatCompletionMessageToolCall] = []
+        for delta in deltas:
+            completed.extend(self._complete_before(delta.index))
+            call = self._pending.setdefault(delta.index, _PendingToolCall())
+            if delta.id:
+                call.id = delta.id
+            if delta.function is not None:
+                if delta.function.name:
+                    call.name += delta.function.name
+                if delta.function.arguments:
+                    call.arguments.append(delta.function.arguments)
+        return completed
+
+    def finish(self) -> list[ChatCompletionMessageToolCall]:
+        """스트림 종료 시 남은 호출 반환"""
+        return self._complete_before(None)
+
+    def _complete_before(
+        self, index: int | None
+    ) -> list[ChatCompletionMessageToolCall]:
+        done = sorted(i for i in self._pending if index is None or i < index)
+        return [self._pending.pop(i).build() for i in done]
+
+
+class FunctionCallAssembler:
+    """레거시 function_call 델타 조립"""
+
+    def __init__(self) -> None:
+        self._name = ""
+        self._arguments: list[str] = []
+        self._started = False
+
+    def add(self, delta: ChoiceDeltaFunctionCall) -> None:
+        self._started = True
+        if delta.name:
+            self._name += delta.name
+        if delta.arguments:
+            self._arguments.append(delta.arguments)
+
+    def finish(self) -> FunctionCall | None:
+        if not self._started:
+            return None
+        return FunctionCall(name=self._name, arguments="".join(self._arguments))
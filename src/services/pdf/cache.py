@@ -0,0 +1,292 @@
+"""파싱된 PDF 캐시 (콘텐츠 주소 기반, 로컬 디스크 + Redis)"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Sequence
+
+from structlog import get_logger
+
+from src.core.config import settings
+from src.core.metrics import (
+    PDF_CACHE_DISK_BYTES,
+    PDF_CACHE_EVICTIONS,
+    PDF_CACHE_REQUESTS,
+)
+from src.services.pdf.parser import PARSER_VERSION
+from src.services.redis import RedisService
+
+logger = get_logger(__name__)
+
+CACHE_KEY_PREFIX = "pdf:parsed:"
+
+# 문서 정보(페이지 수)를 저장하는 페이지 번호
+META_PAGE = 0
+
+# 파일 해시 계산 시 읽기 단위
+HASH_CHUNK_SIZE = 1 << 20
+
+# 디스크 용량 초과 시 이 비율까지 오래된 항목 제거
+DISK_LOW_WATERMARK = 0.9
+
+# 원자적 저장에 쓰는 임시 파일 접미사 (크기 계산과 제거 대상에서 제외)
+TEMP_SUFFIX = ".tmp"
+
+
+def hash_file(path: str | Path) -> str:
+    """파일 내용의 SHA-256 (동기, 스레드에서 호출)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def encode_entry(value: Any) -> bytes:
+    """캐시 항목을 압축 JSON으로 인코딩"""
+    payload = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    return zlib.compress(payload.encode())
+
+
+def decode_entry(data: bytes) -> Any:
+    """압축 JSON 캐시 항목 디코딩"""
+    return json.loads(zlib.decompress(data))
+
+
+class DiskCache:
+    """크기 제한 로컬 디스크 캐시
+
+    같은 노드의 워커들이 디렉터리를 공유합니다. 항목은 임시 파일에 쓴 뒤
+    이름을 바꿔 원자적으로 저장하고, 조회 시 수정 시각을 갱신해 최근 사용
+    순서를 기록합니다. 전체 크기가 max_bytes를 넘으면 디렉터리를 다시 확인해
+    오래 사용하지 않은 항목부터 제거합니다. 모든 메서드는 파일 I/O를 하므로
+    스레드에서 호출하며, 추정 크기와 제거는 잠금으로 보호합니다.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        # 마지막 확인 이후 쓴 양을 더한 추정 크기 (None이면 아직 확인 전)
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # 읽은 직후 다른 워커가 제거
+            pass
+        return data
+
+    def set(self, key: str, data: bytes) -> None:
+        # 다른 스레드가 쓴 파일이 처음 확인한 크기에 중복 반영되지 않도록 쓰기 전에 확인
+        with self._lock:
+            if self._size is None:
+                self._size = self.usage()
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 같은 키를 여러 스레드/워커가 동시에 써도 임시 파일이 겹치지 않도록 함
+        temp = tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f"{path.name}.", suffix=TEMP_SUFFIX, delete=False
+        )
+        try:
+            with temp:
+                temp.write(data)
+            os.replace(temp.name, path)
+        except BaseException:
+            Path(temp.name).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._size = (self._size or 0) + len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.glob("*/*"):
+            # 쓰는 중인 임시 파일은 제외
+            if path.name.endswith(TEMP_SUFFIX):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def usage(self) -> int:
+        """디스크 사용량 (바이트)"""
+        size = sum(size for _, size, _ in self._entries())
+        PDF_CACHE_DISK_BYTES.set(size)
+        return size
+
+    def evict(self) -> None:
+        """오래 사용하지 않은 항목부터 제거해 용량 제한 이하로 유지"""
+        with self._lock:
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        target = self.max_bytes * DISK_LOW_WATERMARK
+        evicted = 0
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+            evicted += 1
+
+        self._size = size
+        PDF_CACHE_DISK_BYTES.set(size)
+        PDF_CACHE_EVICTIONS.inc(evicted)
+        if evicted:
+            logger.info("PDF 캐시 디스크 항목 제거", evicted=evicted, size=size)
+
+
+class DocumentCache:
+    """페이지 단위 PDF 파싱 결과 2단 캐시
+
+    키는 파일 내용의 SHA-256과 파서 버전이므로 경로나 업로드 횟수와 무관하게
+    같은 문서는 한 번만 파싱합니다. 1단은 노드 로컬 디스크, 2단은 워커/노드 간
+    공유되는 Redis이며, Redis 적중 항목은 디스크에 다시 채웁니다. 페이지 수는
+    META_PAGE 항목에 저장합니다.
+    """
+
+    def __init__(
+        self, disk: DiskCache | None, redis: RedisService | None, ttl: int
+    ) -> None:
+        self.disk = disk
+        self.redis = redis
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(digest: str, page: int) -> str:
+        return f"{digest}-{PARSER_VERSION}-{page}"
+
+    async def get_page_count(self, digest: str) -> int | None:
+        """캐시된 문서의 페이지 수 (없으면 None)"""
+        entry = (await self.get_pages(digest, [META_PAGE])).get(META_PAGE)
+        return None if entry is None else int(entry["page_count"])
+
+    async def get_pages(
+        self, digest: str, pages: Sequence[int]
+    ) -> dict[int, dict[str, Any]]:
+        """캐시된 페이지 결과 조회 (페이지 번호 -> 결과)"""
+        keys = {page: self._key(digest, page) for page in pages}
+        found: dict[int, bytes] = {}
+
+        if self.disk is not None:
+            disk = self.disk
+            values = await asyncio.to_thread(
+                lambda: [disk.get(key) for key in keys.values()]
+            )
+            for page, value in zip(keys, values, strict=True):
+                if value is not None:
+                    found[page] = value
+            PDF_CACHE_REQUESTS.labels(result="disk_hit").inc(len(found))
+
+        missing = [page for page in keys if page not in found]
+        if missing and self.redis is not None:
+            try:
+                values = await self.redis.get_many_bytes(
+                    [CACHE_KEY_PREFIX + keys[page] for page in missing]
+                )
+            except Exception as e:
+                logger.warning("PDF 캐시 조회 실패", error=str(e))
+                values = [None] * len(missing)
+            redis_hits = {
+                page: value
+                for page, value in zip(missing, values, strict=True)
+                if value is not None
+            }
+            PDF_CACHE_REQUESTS.labels(result="redis_hit").inc(len(redis_hits))
+            if redis_hits and self.disk is not None:
+                await self._write_disk(
+                    {keys[page]: value for page, value in redis_hits.items()}
+                )
+            found.update(redis_hits)
+
+        PDF_CACHE_REQUESTS.labels(result="miss").inc(len(keys) - len(found))
+
+        pages_found = {}
+        for page, value in found.items():
+            try:
+                pages_found[page] = decode_entry(value)
+            except Exception as e:
+                logger.warning("PDF 캐시 항목 디코딩 실패", page=page, error=str(e))
+        return pages_found
+
+    async def set_pages(
+        self, digest: str, page_count: int, pages: Sequence[dict[str, Any]]
+    ) -> None:
+        """문서 페이지 수와 페이지 결과 저장 (시간 초과 등 오류 페이지 제외)"""
+        values = {
+            self._key(digest, META_PAGE): encode_entry({"page_count": page_count})
+        }
+        for page in pages:
+            if "error" not in page:
+                values[self._key(digest, page["page"])] = encode_entry(page)
+
+        if self.disk is not None:
+            await self._write_disk(values)
+        if self.redis is not None:
+            try:
+                await self.redis.set_many(
+                    {CACHE_KEY_PREFIX + key: value for key, value in values.items()},
+                    expire=self.ttl,
+                )
+            except Exception as e:
+                logger.warning("PDF 캐시 저장 실패", error=str(e))
+
+    async def _write_disk(self, values: dict[str, bytes]) -> None:
+        disk = self.disk
+        assert disk is not None
+
+        def write() -> None:
+            for key, value in values.items():
+                disk.set(key, value)
+
+        try:
+            await asyncio.to_thread(write)
+        except OSError as e:
+            logger.warning("PDF 캐시 디스크 저장 실패", error=str(e))
+
+
+_document_cache: DocumentCache | None = None
+
+
+def init_document_cache(redis: RedisService | None = None) -> DocumentCache:
+    """워커 공용 PDF 캐시 초기화 (pdf_cache_max_bytes가 0이면 디스크 단계 미사용)"""
+    global _document_cache
+    disk = None
+    if settings.pdf_cache_max_bytes > 0:
+        disk = DiskCache(settings.pdf_cache_dir, settings.pdf_cache_max_bytes)
+    _document_cache = DocumentCache(disk, redis, settings.pdf_cache_ttl)
+    return _document_cache
+
+
+def get_document_cache() -> DocumentCache:
+    """워커 공용 PDF 캐시 조회 (미초기화 시 디스크 전용으로 생성)"""
+    cache = _document_cache
+    if cache is None:
+        return init_document_cache()
+    return cache
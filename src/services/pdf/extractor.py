@@ -0,0 +1,223 @@
+"""PDF 추출 (파싱 결과 캐시 + 페이지 범위별 병렬 파싱)"""
+
+import asyncio
+import math
+import tempfile
+import uuid
+from collections import deque
+from contextlib import aclosing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncGenerator, Sequence
+
+from src.core.config import settings
+from src.core.metrics import (
+    PDF_CACHE_BYTES_SAVED,
+    PDF_CACHE_PARSE_SECONDS_SAVED,
+    PDF_PARSE_ABORTED,
+)
+from src.services.pdf.cache import get_document_cache, hash_file
+from src.services.pdf.parser import PARTS, document_info, parse_pages, select_pages
+from src.services.pdf.pool import pdf_pool_size, run_in_pdf_pool
+
+# 취소 파일을 페이지 시간 제한보다 이만큼 더 유지 (초)
+CANCEL_FILE_GRACE = 1.0
+
+
+def select_parts(page: dict[str, Any], include: Sequence[str]) -> dict[str, Any]:
+    """페이지 결과에서 요청하지 않은 추출 항목 제외"""
+    return {
+        key: value for key, value in page.items() if key not in PARTS or key in include
+    }
+
+
+def has_parts(page: dict[str, Any], include: Sequence[str]) -> bool:
+    """캐시된 페이지 결과에 요청한 추출 항목이 모두 있는지 (실패한 페이지는 참)"""
+    return "error" in page or all(part in page for part in include)
+
+
+def split_pages(
+    pages: Sequence[int], workers: int, max_pages_per_task: int
+) -> list[list[int]]:
+    """페이지 목록을 워커 수에 맞춰 연속된 범위로 분할 (범위당 최대 페이지 수 제한)
+
+    범위를 작게 유지하면 페이지마다 파싱 시간이 달라도 워커 사이에 작업이
+    고르게 나뉩니다.
+    """
+    size = max(1, min(max_pages_per_task, math.ceil(len(pages) / max(workers, 1))))
+    return [list(pages[i : i + size]) for i in range(0, len(pages), size)]
+
+
+async def iter_parsed_pages(
+    path: Path, pages: Sequence[int], include: Sequence[str] = PARTS
+) -> AsyncGenerator[dict[str, Any], None]:
+    """페이지 범위별로 프로세스 풀에서 동시에 파싱해 페이지 순서대로 반환
+
+    각 작업은 파일을 직접 열어 파싱하므로 문서 내용은 프로세스 간에 전달되지
+    않습니다. 동시에 제출하는 범위는 풀 워커 수까지이며 앞 범위를 소비해야
+    다음 범위를 제출하므로, 소비가 느려도 쌓이는 결과는 그만큼으로 제한됩니다.
+    문서 메모리 상한은 동시 작업 수로 나눠 각 작업에 적용합니다. 소비가
+    중단되거나 한 범위가 실패하면 대기 중인 범위는 취소하고, 실행 중인 범위는
+    취소 파일을 확인해 다음 페이지 전에 중단합니다.
+    """
+    workers = pdf_pool_size()
+    chunks = split_pages(pages, workers, settings.pdf_pages_per_task)
+    window = min(len(chunks), workers)
+    memory = None
+    if settings.pdf_document_memory_limit > 0 and window:
+        memory = settings.pdf_document_memory_limit // window
+    cancel_file = Path(tempfile.gettempdir()) / f"pdf-cancel-{uuid.uuid4().hex}"
+
+    remaining = iter(chunks)
+    tasks: deque[asyncio.Future[list[dict[str, Any]]]] = deque()
+
+    def submit() -> None:
+        chunk = next(remaining, None)
+        if chunk is None:
+            return
+        tasks.append(
+            asyncio.ensure_future(
+                run_in_pdf_pool(
+                    parse_pages,
+                    str(path),
+                    chunk,
+                    include,
+                    settings.pdf_page_timeout,
+                    memory,
+                    str(cancel_file),
+                )
+            )
+        )
+
+    try:
+        for _ in range(window):
+            submit()
+        while tasks:
+            results = await tasks.popleft()
+            submit()
+            for page in results:
+                yield page
+    except BaseException as e:
+        reason = "error" if isinstance(e, Exception) else "cancelled"
+        PDF_PARSE_ABORTED.labels(reason=reason).inc()
+        cancel_file.touch()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # 실행 중인 작업은 페이지 시간 제한 안에 취소 파일을 확인
+        asyncio.get_running_loop().call_later(
+            settings.pdf_page_timeout + CANCEL_FILE_GRACE, cancel_file.unlink, True
+        )
+        raise
+
+
+async def parse_pages_parallel(
+    path: Path, pages: Sequence[int], include: Sequence[str] = PARTS
+) -> list[dict[str, Any]]:
+    """페이지 범위별로 동시에 파싱한 전체 결과 (페이지 순서)"""
+    async with aclosing(iter_parsed_pages(path, pages, include)) as parsed:
+        return [page async for page in parsed]
+
+
+@dataclass
+class DocumentStream:
+    """페이지 결과를 준비되는 대로 받는 PDF 추출 결과"""
+
+    sha256: str
+    page_count: int
+    numbers: list[int]  # 반환할 페이지 번호 (순서대로)
+    truncated: bool
+    pages: AsyncGenerator[dict[str, Any], None]
+
+
+async def stream_pdf_document(
+    path: Path,
+    pages: Sequence[int] | None,
+    include: Sequence[str],
+    digest: str | None = None,
+) -> DocumentStream:
+    """PDF 페이지별 추출 결과를 페이지 순서대로 스트리밍
+
+    문서 정보 확인과 캐시 조회까지만 마치고 반환하며, 캐시에 없는 페이지는
+    스트림을 소비하는 동안 범위별로 파싱해 캐시에 저장합니다. digest는 이미
+    계산된 파일의 SHA-256이며(업로드 중 계산 등), 없으면 파일을 읽어
+    계산합니다. 페이지 스트림은 끝까지 소비하거나 aclose()로 닫아야 합니다.
+
+    단어 좌표처럼 비용이 큰 항목은 요청할 때만 추출합니다. 캐시된 페이지에
+    요청한 항목이 없으면 기존 항목과 함께 다시 파싱해 캐시를 교체하므로, 캐시
+    항목은 지금까지 요청된 항목을 모두 담습니다.
+    """
+    cache = get_document_cache()
+    if digest is None:
+        digest = await asyncio.to_thread(hash_file, path)
+
+    cached_count = await cache.get_page_count(digest)
+    if cached_count is None:
+        info = await run_in_pdf_pool(document_info, str(path))
+        page_count = int(info["page_count"])
+    else:
+        page_count = cached_count
+
+    numbers = select_pages(pages, page_count)
+    truncated = len(numbers) > settings.pdf_max_pages
+    numbers = numbers[: settings.pdf_max_pages]
+
+    found = await cache.get_pages(digest, numbers) if cached_count is not None else {}
+    stale = [page for page in found.values() if not has_parts(page, include)]
+    for page in stale:
+        del found[page["page"]]
+    parts = tuple(
+        part for part in PARTS if part in include or any(part in page for page in stale)
+    )
+    hits = [found[number] for number in numbers if number in found]
+    if hits:
+        size = await asyncio.to_thread(lambda: path.stat().st_size)
+        PDF_CACHE_BYTES_SAVED.inc(size * len(hits) / page_count)
+        PDF_CACHE_PARSE_SECONDS_SAVED.inc(sum(page["duration"] for page in hits))
+
+    missing = [number for number in numbers if number not in found]
+
+    async def iter_pages(digest: str) -> AsyncGenerator[dict[str, Any], None]:
+        async with aclosing(iter_parsed_pages(path, missing, parts)) as parsed:
+            batch: list[dict[str, Any]] = []
+            for number in numbers:
+                if number in found:
+                    yield {**select_parts(found.pop(number), include), "cached": True}
+                    continue
+                page = await anext(parsed)
+                batch.append(page)
+                if len(batch) >= settings.pdf_pages_per_task:
+                    await cache.set_pages(digest, page_count, batch)
+                    batch = []
+                yield {**select_parts(page, include), "cached": False}
+            if batch:
+                await cache.set_pages(digest, page_count, batch)
+
+    return DocumentStream(
+        sha256=digest,
+        page_count=page_count,
+        numbers=numbers,
+        truncated=truncated,
+        pages=iter_pages(digest),
+    )
+
+
+async def extract_pdf_document(
+    path: Path,
+    pages: Sequence[int] | None,
+    include: Sequence[str],
+    digest: str | None = None,
+) -> dict[str, Any]:
+    """PDF 페이지별 추출 결과 (같은 내용의 문서는 캐시에서 조회)
+
+    각 페이지 결과의 cached는 캐시에서 가져왔는지 여부입니다.
+    """
+    document = await stream_pdf_document(path, pages, include, digest)
+    async with aclosing(document.pages) as stream:
+        results = [page async for page in stream]
+    return {
+        "sha256": document.sha256,
+        "page_count": document.page_count,
+        "pages": results,
+        "truncated": document.truncated,
+    }
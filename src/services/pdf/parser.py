@@ -0,0 +1,174 @@
+"""PDF 파싱 (프로세스 풀 워커에서 실행)
+
+이 모듈의 함수는 동기식이며 CPU를 많이 사용하므로 이벤트 루프에서 직접
+호출하지 않고 src.services.pdf.pool을 통해 워커 프로세스에서 실행합니다.
+워커 프로세스가 빨리 시작되도록 앱 모듈(설정, 메트릭 등)은 import하지 않습니다.
+"""
+
+import os
+import resource
+import signal
+import time
+from contextlib import contextmanager
+from types import FrameType
+from typing import Any, Iterator, Sequence
+
+import pdfplumber
+from pdfplumber.page import Page
+
+# 파싱 결과 형식이 바뀌면 올림 (캐시 키에 포함)
+PARSER_VERSION = "1"
+
+# 추출 가능한 항목
+PARTS = ("text", "words", "tables")
+
+# 기본 추출 항목 (단어 좌표는 결과가 커서 요청 시에만 포함)
+DEFAULT_PARTS = ("text", "tables")
+
+# 좌표 반올림 자릿수
+COORDINATE_DIGITS = 2
+
+
+class PageTimeoutError(Exception):
+    """페이지 파싱 시간 초과"""
+
+
+class MemoryLimitError(ValueError):
+    """문서 파싱 메모리 제한 초과"""
+
+
+@contextmanager
+def page_deadline(seconds: float) -> Iterator[None]:
+    """seconds초가 지나면 PageTimeoutError 발생 (워커 프로세스 메인 스레드 전용)
+
+    순수 Python 코드인 pdfminer 파싱 루프를 중단시키므로 시간이 초과된
+    페이지가 워커를 계속 점유하지 않습니다.
+    """
+
+    def _raise(signum: int, frame: FrameType | None) -> None:
+        raise PageTimeoutError
+
+    previous = signal.signal(signal.SIGALRM, _raise)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _address_space() -> int:
+    """현재 프로세스의 가상 메모리 크기 (바이트)"""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+
+
+@contextmanager
+def memory_limit(limit: int | None) -> Iterator[None]:
+    """블록 안에서 추가로 할당할 수 있는 메모리를 limit바이트로 제한
+
+    현재 가상 메모리 크기에 limit을 더한 값으로 RLIMIT_AS를 잠시 낮추므로,
+    초과하는 할당은 MemoryError가 되고 워커 프로세스는 계속 사용할 수 있습니다.
+    """
+    if not limit or not os.path.exists("/proc/self/statm"):
+        yield
+        return
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    cap = _address_space() + limit
+    if hard != resource.RLIM_INFINITY:
+        cap = min(cap, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (cap, hard))
+    try:
+        yield
+    finally:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _word(word: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "text": word["text"],
+        "x0": round(word["x0"], COORDINATE_DIGITS),
+        "top": round(word["top"], COORDINATE_DIGITS),
+        "x1": round(word["x1"], COORDINATE_DIGITS),
+        "bottom": round(word["bottom"], COORDINATE_DIGITS),
+    }
+
+
+def parse_page(page: Page, include: Sequence[str]) -> dict[str, Any]:
+    """페이지에서 요청한 항목 추출"""
+    result: dict[str, Any] = {
+        "page": page.page_number,
+        "width": round(page.width, COORDINATE_DIGITS),
+        "height": round(page.height, COORDINATE_DIGITS),
+    }
+    try:
+        if "text" in include:
+            result["text"] = page.extract_text() or ""
+        if "words" in include:
+            result["words"] = [_word(word) for word in page.extract_words()]
+        if "tables" in include:
+            result["tables"] = page.extract_tables()
+    finally:
+        # 페이지 객체 캐시 해제 (큰 문서에서 메모리 누적 방지)
+        page.close()
+    return result
+
+
+def _open(path: str) -> pdfplumber.PDF:
+    try:
+        return pdfplumber.open(path)
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Invalid PDF file: {e}") from None
+
+
+def select_pages(pages: Sequence[int] | None, page_count: int) -> list[int]:
+    """요청 페이지 번호 목록 (없으면 전체, 범위 밖 번호는 ValueError)"""
+    numbers = list(pages) if pages else list(range(1, page_count + 1))
+    invalid = [number for number in numbers if not 1 <= number <= page_count]
+    if invalid:
+        raise ValueError(f"Page out of range (1-{page_count}): {invalid}")
+    return numbers
+
+
+def document_info(path: str) -> dict[str, Any]:
+    """문서 정보 (페이지 수)"""
+    with _open(path) as pdf:
+        return {"page_count": len(pdf.pages)}
+
+
+def parse_pages(
+    path: str,
+    pages: Sequence[int],
+    include: Sequence[str],
+    page_timeout: float,
+    memory: int | None = None,
+    cancel_file: str | None = None,
+) -> list[dict[str, Any]]:
+    """파일을 직접 열어 지정한 페이지들을 순서대로 파싱
+
+    페이지 범위 단위로 여러 워커에서 동시에 호출됩니다. 시간이 초과된 페이지는
+    error가 표시된 결과로 대체되고, 각 페이지 결과에는 파싱 시간(duration, 초)이
+    포함됩니다. memory는 이 호출에서 추가로 쓸 수 있는 메모리 상한이며,
+    cancel_file이 생기면 다음 페이지로 넘어가기 전에 중단합니다.
+    """
+    results = []
+    with _open(path) as pdf, memory_limit(memory):
+        for number in pages:
+            if cancel_file is not None and os.path.exists(cancel_file):
+                break
+            start = time.perf_counter()
+            try:
+                with page_deadline(page_timeout):
+                    result = parse_page(pdf.pages[number - 1], include)
+            except PageTimeoutError:
+                result = {"page": number, "error": "timeout"}
+            except MemoryError:
+                raise MemoryLimitError(
+                    f"Memory limit exceeded while parsing page {number}"
+                ) from None
+            result["duration"] = round(time.perf_counter() - start, 4)
+            results.append(result)
+    return results
@@ -0,0 +1,156 @@
+"""PDF 파싱 프로세스 풀"""
+
+import asyncio
+import fcntl
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from structlog import get_logger
+
+from src.core.config import settings, worker_count
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# 노드 공용 파싱 슬롯 잠금 파일 위치
+SLOT_DIR = Path(tempfile.gettempdir()) / "pdf-parse-slots"
+
+# 빈 슬롯을 다시 확인하는 주기 (초)
+SLOT_POLL_INTERVAL = 0.02
+
+_pool: ProcessPoolExecutor | None = None
+_slots: "ParseSlots | None" = None
+
+
+def pdf_pool_size() -> int:
+    """서버 워커별 파싱 워커 수 (미설정 시 사용 가능한 CPU 수)
+
+    문서 하나가 모든 코어로 나눠 파싱할 수 있도록 서버 워커마다 CPU 수만큼
+    쓸 수 있고, 노드 전체의 동시 파싱은 ParseSlots가 CPU 수로 제한합니다.
+    """
+    return settings.pdf_workers or worker_count()
+
+
+class ParseSlots:
+    """같은 노드의 모든 프로세스가 공유하는 파싱 슬롯
+
+    슬롯마다 잠금 파일을 두고 flock으로 점유하므로 서버 워커와 배치 CLI가
+    함께 슬롯 수 이상 동시에 파싱하지 않으며, 프로세스가 비정상 종료되어도
+    잠금은 운영체제가 해제합니다.
+    """
+
+    def __init__(self, directory: Path, count: int) -> None:
+        self.directory = directory
+        self.count = count
+        self._files: list[int] | None = None
+        self._held: set[int] = set()
+        # 작업 완료 콜백은 풀의 관리 스레드에서 반납
+        self._lock = threading.Lock()
+
+    def _open(self) -> None:
+        with self._lock:
+            if self._files is not None:
+                return
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._files = [
+                os.open(self.directory / f"{index}.lock", os.O_RDWR | os.O_CREAT)
+                for index in range(self.count)
+            ]
+
+    def try_acquire(self) -> int | None:
+        """빈 슬롯 점유 (없으면 None)"""
+        with self._lock:
+            assert self._files is not None
+            for index, fd in enumerate(self._files):
+                if index in self._held:
+                    continue
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue
+                self._held.add(index)
+                return index
+        return None
+
+    async def acquire(self) -> int:
+        """슬롯이 빌 때까지 기다려 점유"""
+        if self._files is None:
+            await asyncio.to_thread(self._open)
+        while (index := self.try_acquire()) is None:
+            await asyncio.sleep(SLOT_POLL_INTERVAL)
+        return index
+
+    def release(self, index: int) -> None:
+        """슬롯 반납"""
+        with self._lock:
+            assert self._files is not None
+            fcntl.flock(self._files[index], fcntl.LOCK_UN)
+            self._held.discard(index)
+
+
+def get_parse_slots() -> ParseSlots:
+    """노드 공용 파싱 슬롯 조회 (사용 가능한 CPU 수만큼)"""
+    global _slots
+    if _slots is None:
+        _slots = ParseSlots(SLOT_DIR, worker_count())
+    return _slots
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """PDF 파싱 프로세스 풀 조회 (첫 사용 시 생성)
+
+    서버 워커는 이벤트 루프와 스레드를 가진 채 fork되므로 파싱 워커는 spawn으로
+    시작하며, 필요할 때 하나씩 생성됩니다. 워커는 pdf_worker_max_tasks개 작업
+    후 교체되어 파서 캐시로 인한 메모리 증가를 제한합니다.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=pdf_pool_size(),
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=settings.pdf_worker_max_tasks,
+        )
+        logger.info("PDF 파싱 프로세스 풀 생성", max_workers=pdf_pool_size())
+    return _pool
+
+
+async def run_in_pdf_pool(function: Callable[..., T], *args: Any) -> T:
+    """노드 공용 파싱 슬롯을 얻어 워커 프로세스에서 동기 함수 실행
+
+    슬롯은 작업이 실제로 끝날 때 반납하므로, 호출이 취소되어도 실행 중인
+    작업은 끝날 때까지 슬롯을 점유합니다. 워커가 비정상 종료되면(메모리 부족
+    등) 풀을 버리고 다음 호출에서 새로 만듭니다.
+    """
+    global _pool
+    slots = get_parse_slots()
+    slot = await slots.acquire()
+    try:
+        pool = get_pdf_pool()
+        future: Future[T] = pool.submit(function, *args)
+    except BaseException:
+        slots.release(slot)
+        raise
+    future.add_done_callback(lambda _: slots.release(slot))
+    try:
+        return await asyncio.wrap_future(future)
+    except BrokenProcessPool:
+        logger.error("PDF 파싱 워커 비정상 종료, 프로세스 풀 재생성")
+        if _pool is pool:
+            _pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+def close_pdf_pool() -> None:
+    """프로세스 풀 종료 (대기 중인 작업 취소)"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
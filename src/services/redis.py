@@ -1,8 +1,9 @@
 """Redis 서비스"""
 
-from typing import Any
+from typing import Any, cast
 
 import redis.asyncio as redis
+from redis.client import NEVER_DECODE
 from structlog import get_logger
 
 from src.core.config import settings
@@ -10,6 +11,14 @@ from src.core.metrics import REDIS_CONNECTIONS
 
 logger = get_logger(__name__)
 
+# 토큰이 일치할 때만 락을 해제하는 스크립트
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 class RedisService:
     """Redis 서비스"""
@@ -39,6 +48,28 @@ class RedisService:
             logger.error("Redis GET 실패", key=key, error=str(e))
             raise
 
+    async def get_bytes(self, key: str) -> bytes | None:
+        """키에 해당하는 값을 디코딩 없이 조회 (압축된 값 등)"""
+        try:
+            value = await self.client.execute_command(
+                "GET", key, **{NEVER_DECODE: True}
+            )
+            return cast(bytes | None, value)
+        except Exception as e:
+            logger.error("Redis GET 실패", key=key, error=str(e))
+            raise
+
+    async def get_many_bytes(self, keys: list[str]) -> list[bytes | None]:
+        """여러 키의 값을 디코딩 없이 한 번에 조회 (MGET)"""
+        try:
+            values = await self.client.execute_command(
+                "MGET", *keys, **{NEVER_DECODE: True}
+            )
+            return cast(list[bytes | None], values)
+        except Exception as e:
+            logger.error("Redis MGET 실패", keys=len(keys), error=str(e))
+            raise
+
     async def set(
         self,
         key: str,
@@ -52,6 +83,17 @@ class RedisService:
             logger.error("Redis SET 실패", key=key, error=str(e))
             raise
 
+    async def set_many(self, values: dict[str, Any], expire: int | None = None) -> None:
+        """여러 키-값 쌍을 한 번의 왕복으로 저장"""
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.set(key, value, ex=expire)
+                await pipe.execute()
+        except Exception as e:
+            logger.error("Redis SET 실패", keys=len(values), error=str(e))
+            raise
+
     async def delete(self, key: str) -> None:
         """키-값 쌍 삭제"""
         try:
@@ -59,3 +101,102 @@ class RedisService:
         except Exception as e:
             logger.error("Redis DELETE 실패", key=key, error=str(e))
             raise
+
+    async def delete_pattern(self, pattern: str) -> None:
+        """패턴과 일치하는 모든 키 삭제"""
+        try:
+            async for key in self.client.scan_iter(match=pattern):
+                await self.client.unlink(key)
+        except Exception as e:
+            logger.error("Redis 패턴 삭제 실패", pattern=pattern, error=str(e))
+            raise
+
+    async def acquire_lock(self, key: str, token: str, expire: float) -> bool:
+        """만료 시간이 있는 락 획득 (SET NX PX)"""
+        try:
+            acquired = await self.client.set(
+                key, token, nx=True, px=max(int(expire * 1000), 1)
+            )
+            return bool(acquired)
+        except Exception as e:
+            logger.error("Redis 락 획득 실패", key=key, error=str(e))
+            raise
+
+    async def release_lock(self, key: str, token: str) -> None:
+        """소유한 락 해제"""
+        try:
+            await self.client.eval(RELEASE_LOCK_SCRIPT, 1, key, token)
+        except Exception as e:
+            logger.error("Redis 락 해제 실패", key=key, error=str(e))
+            raise
+
+    async def exists(self, key: str) -> bool:
+        """키 존재 여부"""
+        try:
+            return bool(await self.client.exists(key))
+        except Exception as e:
+            logger.error("Redis EXISTS 실패", key=key, error=str(e))
+            raise
+
+    async def append_stream(self, key: str, fields: dict[str, str], expire: int) -> str:
+        """Redis Stream에 항목 추가 및 만료 시간 갱신 (XADD + EXPIRE)"""
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.xadd(key, fields)
+                pipe.expire(key, expire)
+                entry_id, _ = await pipe.execute()
+            return cast(str, entry_id)
+        except Exception as e:
+            logger.error("Redis XADD 실패", key=key, error=str(e))
+            raise
+
+    async def read_stream(
+        self, key: str, last_id: str, block: float
+    ) -> list[tuple[str, dict[str, str]]]:
+        """last_id 이후 항목 조회 (없으면 최대 block초 대기, XREAD)"""
+        try:
+            response = await self.client.xread(
+                {key: last_id}, block=max(int(block * 1000), 1)
+            )
+        except Exception as e:
+            logger.error("Redis XREAD 실패", key=key, error=str(e))
+            raise
+        if not response:
+            return []
+        _, entries = response[0]
+        return cast(list[tuple[str, dict[str, str]]], entries)
+
+    async def publish(self, channel: str, message: str) -> None:
+        """채널에 메시지 발행"""
+        try:
+            await self.client.publish(channel, message)
+        except Exception as e:
+            logger.error("Redis PUBLISH 실패", channel=channel, error=str(e))
+            raise
+
+
+_redis_service: RedisService | None = None
+
+
+def init_redis_service() -> RedisService | None:
+    """워커 공용 Redis 서비스 초기화 (Redis 설정이 없으면 None)"""
+    global _redis_service
+    if _redis_service is None:
+        if settings.redis_host is None or settings.redis_port is None:
+            logger.info("Redis 미설정, Redis 기반 기능 비활성화")
+            return None
+        _redis_service = RedisService()
+    return _redis_service
+
+
+def get_redis_service() -> RedisService | None:
+    """워커 공용 Redis 서비스 조회"""
+    return _redis_service
+
+
+async def close_redis_service() -> None:
+    """워커 공용 Redis 서비스 종료"""
+    global _redis_service
+    if _redis_service is not None:
+        service, _redis_service = _redis_service, None
+        await service.close()
@@ -0,0 +1,199 @@
+"""재개 가능한 스트리밍 응답 저장소 (Redis Streams)"""
+
+import asyncio
+import json
+import math
+import re
+import time
+from contextlib import suppress
+from typing import AsyncIterator
+
+from structlog import get_logger
+
+from src.core.config import settings
+from src.core.exceptions import AgentError, ValidationError
+from src.core.metrics import STREAM_PRODUCERS_ABANDONED, STREAM_RESUMES
+from src.services.llm.base import close_stream
+from src.services.redis import RedisService, get_redis_service
+
+logger = get_logger(__name__)
+
+STREAM_KEY_PREFIX = "agent:stream:"
+READERS_KEY_SUFFIX = ":readers"
+
+# 스트림 시작/종료 표시 항목의 event 값 (구독자에게 전달하지 않음)
+OPEN_EVENT = "open"
+END_EVENT = "end"
+
+# 처음부터 읽을 때의 마지막 ID
+STREAM_START_ID = "0-0"
+
+EVENT_ID_PATTERN = re.compile(r"^\d+-\d+$")
+
+# 실행 중인 생성 태스크 (GC 방지 및 종료 시 정리)
+_producers: set[asyncio.Task[None]] = set()
+
+
+class StreamStore:
+    """스트리밍 응답 청크를 Redis Stream에 기록하고 구독자에게 재생
+
+    생성은 요청과 분리된 태스크에서 실행되어 연결이 끊겨도 계속되며, 재연결한
+    클라이언트는 Last-Event-ID 이후 항목부터 이어 받습니다. 다른 구독자도 같은
+    스트림을 처음부터 읽을 수 있습니다. 구독자는 읽는 동안 block_timeout마다
+    구독 표시를 갱신하며, 표시가 reader_grace초 동안 없으면 아무도 받지 않는
+    생성을 취소합니다.
+    """
+
+    def __init__(
+        self,
+        redis: RedisService,
+        ttl: int,
+        block_timeout: float,
+        reader_grace: int,
+    ) -> None:
+        self.redis = redis
+        self.ttl = ttl
+        self.block_timeout = block_timeout
+        self.reader_grace = reader_grace
+
+    @staticmethod
+    def _key(stream_id: str) -> str:
+        return f"{STREAM_KEY_PREFIX}{stream_id}"
+
+    def _readers_key(self, stream_id: str) -> str:
+        return self._key(stream_id) + READERS_KEY_SUFFIX
+
+    async def _append(self, stream_id: str, event: dict[str, str]) -> str:
+        return await self.redis.append_stream(self._key(stream_id), event, self.ttl)
+
+    async def _touch_reader(self, stream_id: str) -> None:
+        # 읽기 대기 한 번보다 길게 유지해 읽는 동안 표시가 끊기지 않도록 함
+        await self.redis.set(
+            self._readers_key(stream_id),
+            "1",
+            expire=max(1, math.ceil(self.block_timeout * 2)),
+        )
+
+    async def start(
+        self, stream_id: str, events: AsyncIterator[dict[str, str]]
+    ) -> None:
+        """스트림을 만들고 요청과 분리된 생성 태스크 시작"""
+        # 첫 청크 전에도 구독/재개할 수 있도록 스트림을 먼저 만들고,
+        # 첫 구독자가 붙기 전에 취소되지 않도록 구독 표시 선점
+        await self._append(stream_id, {"event": OPEN_EVENT})
+        await self._touch_reader(stream_id)
+        task = asyncio.create_task(self._produce(stream_id, events))
+        _producers.add(task)
+        task.add_done_callback(_producers.discard)
+
+    async def _produce(
+        self, stream_id: str, events: AsyncIterator[dict[str, str]]
+    ) -> None:
+        producer = asyncio.current_task()
+        assert producer is not None
+        watcher = asyncio.create_task(self._watch_readers(stream_id, producer))
+        try:
+            async for event in events:
+                await self._append(stream_id, event)
+            await self._append(stream_id, {"event": END_EVENT})
+        except asyncio.CancelledError:
+            await self._finish_with_error(
+                stream_id, AgentError("Stream cancelled", code="STREAM_CANCELLED")
+            )
+            raise
+        except AgentError as e:
+            await self._finish_with_error(stream_id, e)
+        except Exception as e:
+            logger.error("스트림 생성 실패", stream_id=stream_id, error=str(e))
+            await self._finish_with_error(stream_id, AgentError(str(e)))
+        finally:
+            watcher.cancel()
+            with suppress(asyncio.CancelledError):
+                await watcher
+            with suppress(Exception):
+                await close_stream(events)
+
+    async def _finish_with_error(self, stream_id: str, error: AgentError) -> None:
+        with suppress(Exception):
+            await self._append(
+                stream_id,
+                {
+                    "event": "error",
+                    "data": json.dumps(error.detail, ensure_ascii=False),
+                },
+            )
+            await self._append(stream_id, {"event": END_EVENT})
+
+    async def _watch_readers(
+        self, stream_id: str, producer: asyncio.Task[object]
+    ) -> None:
+        """구독 표시가 reader_grace초 동안 없으면 생성 태스크 취소"""
+        missing_since: float | None = None
+        while True:
+            await asyncio.sleep(self.block_timeout)
+            if await self.redis.exists(self._readers_key(stream_id)):
+                missing_since = None
+                continue
+            now = time.monotonic()
+            if missing_since is None:
+                missing_since = now
+            if now - missing_since >= self.reader_grace:
+                STREAM_PRODUCERS_ABANDONED.inc()
+                logger.info("구독자 없는 스트림 생성 취소", stream_id=stream_id)
+                producer.cancel()
+                return
+
+    def read(
+        self, stream_id: str, last_event_id: str | None = None
+    ) -> AsyncIterator[dict[str, str]]:
+        """last_event_id 이후 항목을 재생하고 종료 표시까지 실시간 항목 전달"""
+        if last_event_id is not None:
+            if not EVENT_ID_PATTERN.match(last_event_id):
+                raise ValidationError("Invalid Last-Event-ID")
+            STREAM_RESUMES.inc()
+        return self._read(stream_id, last_event_id or STREAM_START_ID)
+
+    async def _read(
+        self, stream_id: str, last_id: str
+    ) -> AsyncIterator[dict[str, str]]:
+        key = self._key(stream_id)
+
+        while True:
+            await self._touch_reader(stream_id)
+            entries = await self.redis.read_stream(key, last_id, self.block_timeout)
+            if not entries and not await self.redis.exists(key):
+                # 생성 태스크 없이 만료된 스트림
+                return
+            for entry_id, fields in entries:
+                last_id = entry_id
+                if fields.get("event") == END_EVENT:
+                    return
+                if fields.get("event") == OPEN_EVENT:
+                    continue
+                yield {"id": entry_id, **fields}
+
+    async def exists(self, stream_id: str) -> bool:
+        """스트림 존재 여부"""
+        return await self.redis.exists(self._key(stream_id))
+
+
+async def cancel_stream_producers() -> None:
+    """종료 시 실행 중인 생성 태스크 취소 (구독자에게 취소 이벤트 전달)"""
+    for task in list(_producers):
+        task.cancel()
+    for task in list(_producers):
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+def get_stream_store() -> StreamStore | None:
+    """스트림 저장소 조회 (Redis 미설정 또는 비활성화 시 None)"""
+    redis = get_redis_service()
+    if redis is None or not settings.stream_resume_enabled:
+        return None
+    return StreamStore(
+        redis,
+        ttl=settings.stream_ttl,
+        block_timeout=settings.stream_block_timeout,
+        reader_grace=settings.stream_reader_grace,
+    )
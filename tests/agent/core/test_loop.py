@@ -0,0 +1,135 @@
+"""Agent 루프 테스트"""
+
+import asyncio
+import json
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.agent.core.base import Agent
+from src.agent.core.types import AgentRequest
+from src.agent.functions.base import AgentFunction, ToolSet
+from src.core.exceptions import AgentError, FunctionNotFoundError
+from tests.helpers.mock_data import create_mock_tool_call
+
+
+class SlowFunction(AgentFunction):
+    """지정한 시간만큼 대기하는 함수"""
+
+    name = "slow_function"
+    description = "느린 함수입니다."
+    parameters = {
+        "type": "object",
+        "properties": {"delay": {"type": "number", "description": "대기 시간"}},
+    }
+
+    async def execute(self, **kwargs: Any) -> Any:
+        await asyncio.sleep(kwargs["delay"])
+        return kwargs["delay"]
+
+
+def create_agent(responses: list[dict[str, Any]]) -> tuple[Agent, AsyncMock]:
+    llm_service = MagicMock()
+    llm_service.generate = AsyncMock(side_effect=responses)
+    registry = MagicMock()
+    registry.get_tool_set = MagicMock(return_value=ToolSet([SlowFunction()]))
+    registry.get_function = MagicMock(return_value=SlowFunction())
+    return Agent(llm_service, registry), llm_service.generate
+
+
+def tool_calls_response(*delays: float) -> dict[str, Any]:
+    return {
+        "content": "",
+        "tool_calls": [
+            create_mock_tool_call("slow_function", {"delay": delay}, f"call_{i}")
+            for i, delay in enumerate(delays)
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_calls() -> None:
+    """한 턴의 tool call은 동시에 실행"""
+    agent, generate = create_agent(
+        [tool_calls_response(0.2, 0.2, 0.2), {"content": "완료"}]
+    )
+
+    start_time = time.perf_counter()
+    response = await agent.run(AgentRequest(input="조회", functions=["slow_function"]))
+
+    assert response.result == "완료"
+    assert time.perf_counter() - start_time < 0.5
+    messages = generate.call_args.kwargs["messages"]
+    assert [message["role"] for message in messages] == [
+        "user",
+        "assistant",
+        "tool",
+        "tool",
+        "tool",
+    ]
+    assert [message["tool_call_id"] for message in messages[2:]] == [
+        "call_0",
+        "call_1",
+        "call_2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_multi_step_loop() -> None:
+    """최종 답변이 나올 때까지 반복"""
+    agent, generate = create_agent(
+        [tool_calls_response(0), tool_calls_response(0), {"content": "완료"}]
+    )
+
+    response = await agent.run(AgentRequest(input="조회"))
+
+    assert response.result == "완료"
+    assert generate.await_count == 3
+    # 첫 단계는 프롬프트만으로 호출
+    assert generate.await_args_list[0].kwargs["messages"] is None
+
+
+@pytest.mark.asyncio
+async def test_max_steps_exceeded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """최대 단계 수를 넘으면 에러"""
+    monkeypatch.setattr("src.core.config.settings.agent_max_steps", 2)
+    agent, _ = create_agent([tool_calls_response(0), tool_calls_response(0)])
+
+    with pytest.raises(AgentError) as exc_info:
+        await agent.run(AgentRequest(input="조회"))
+    assert exc_info.value.detail["code"] == "MAX_STEPS_EXCEEDED"  # type: ignore[index]
+    # 마지막 단계에서 요청된 함수는 실행하지 않음
+    assert agent.registry.get_function.call_count == 1  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_tool_call_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """호출별 시간 제한 초과는 해당 호출의 오류 결과로 전달"""
+    monkeypatch.setattr("src.core.config.settings.agent_tool_timeout", 0.05)
+    agent, generate = create_agent([tool_calls_response(0, 10), {"content": "완료"}])
+
+    response = await agent.run(AgentRequest(input="조회"))
+
+    assert response.result == "완료"
+    first, second = generate.call_args.kwargs["messages"][2:]
+    assert json.loads(first["content"]) == 0
+    assert second["tool_call_id"] == "call_1"
+    assert json.loads(second["content"]) == {"error": "Timed out after 0.05s"}
+
+
+@pytest.mark.asyncio
+async def test_tool_call_failure_continues() -> None:
+    """함수 실행이 실패해도 오류를 tool 메시지로 전달하고 계속 진행"""
+    agent, generate = create_agent([tool_calls_response(0), {"content": "완료"}])
+    agent.registry.get_function = MagicMock(  # type: ignore[method-assign]
+        side_effect=FunctionNotFoundError("slow_function")
+    )
+
+    response = await agent.run(AgentRequest(input="조회"))
+
+    assert response.result == "완료"
+    message = generate.call_args.kwargs["messages"][-1]
+    assert message["role"] == "tool"
+    assert "error" in json.loads(message["content"])
@@ -0,0 +1,79 @@
+"""대화 세션 테스트"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.agent.core.base import Agent
+from src.agent.core.session import (
+    SessionStore,
+    decode_history,
+    encode_history,
+    fit_history,
+)
+from src.agent.core.types import AgentRequest
+from src.core.exceptions import ValidationError
+from tests.helpers.mock_data import MockRedisService
+
+
+def test_encode_history_roundtrip() -> None:
+    """압축 인코딩 왕복 및 크기 테스트"""
+    history = [
+        {"role": "user", "content": "인보이스 금액을 확인해줘 " * 20},
+        {"role": "assistant", "content": "총액은 1,000원입니다. " * 20},
+    ]
+
+    data = encode_history(history)
+
+    assert decode_history(data) == history
+    assert len(data) < len(json.dumps(history, ensure_ascii=False).encode())
+
+
+def test_fit_history_drops_oldest_turns() -> None:
+    """예산을 넘으면 오래된 턴부터 제외"""
+    history = [
+        {"role": "user", "content": "a" * 400},
+        {"role": "assistant", "content": "b" * 400},
+        {"role": "user", "content": "c" * 40},
+        {"role": "assistant", "content": "d" * 40},
+    ]
+
+    assert fit_history(history, 10_000) == history
+    assert fit_history(history, 50) == history[2:]
+    assert fit_history(history, 1) == []
+
+
+@pytest.mark.asyncio
+async def test_agent_session_history() -> None:
+    """세션 이력을 다음 요청의 메시지에 포함"""
+    redis = MockRedisService()
+    sessions = SessionStore(redis, ttl=60, max_messages=10)  # type: ignore[arg-type]
+    llm_service = MagicMock()
+    llm_service.generate = AsyncMock(
+        side_effect=[{"content": "첫 답변"}, {"content": "두 번째 답변"}]
+    )
+    agent = Agent(llm_service, MagicMock(), sessions)
+
+    first = await agent.run(AgentRequest(input="첫 질문", session_id="s1"))
+    second = await agent.run(AgentRequest(input="두 번째 질문", session_id="s1"))
+
+    assert first.session_id == second.session_id == "s1"
+    # 이력이 없는 첫 요청은 프롬프트만으로 호출
+    assert llm_service.generate.await_args_list[0].kwargs["messages"] is None
+    assert llm_service.generate.await_args_list[1].kwargs["messages"] == [
+        {"role": "user", "content": "첫 질문"},
+        {"role": "assistant", "content": "첫 답변"},
+        {"role": "user", "content": "두 번째 질문"},
+    ]
+    assert len(await sessions.load("s1")) == 4
+    assert list(redis.expires.values()) == [60]
+
+
+@pytest.mark.asyncio
+async def test_agent_session_without_redis() -> None:
+    """Redis가 없으면 세션 요청은 검증 에러"""
+    agent = Agent(MagicMock(), MagicMock())
+
+    with pytest.raises(ValidationError):
+        await agent.run(AgentRequest(input="질문", session_id="s1"))
@@ -0,0 +1,115 @@
+"""함수 결과 캐시 테스트"""
+
+import json
+from typing import Any, Generator
+from unittest.mock import patch
+
+import pytest
+
+from src.agent.functions import cache as cache_module
+from src.agent.functions.base import AgentFunction
+from src.agent.functions.cache import INVALIDATION_CHANNEL, FunctionResultCache
+from src.agent.functions.calculate import CalculateFunction
+from tests.helpers.mock_data import MockRedisService
+
+
+class CountingFunction(AgentFunction):
+    """호출 횟수를 기록하는 캐시 가능 함수"""
+
+    name = "counting_function"
+    description = "테스트 함수입니다."
+    parameters = {"type": "object", "properties": {}}
+    cache_ttl = 60
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def execute(self, **kwargs: Any) -> Any:
+        self.calls += 1
+        return {"calls": self.calls, **kwargs}
+
+
+@pytest.fixture
+def function_cache() -> Generator[FunctionResultCache, None, None]:
+    """워커 공용 캐시 교체 fixture"""
+    cache = FunctionResultCache(max_size=2, redis=MockRedisService())
+    with patch.object(cache_module, "_function_cache", cache):
+        yield cache
+
+
+@pytest.mark.asyncio
+async def test_cacheable_function_memoized(function_cache: FunctionResultCache) -> None:
+    """캐시 가능한 함수 결과 재사용 테스트"""
+    function = CountingFunction()
+
+    first = await function(invoice_id="A")
+    second = await function(invoice_id="A")
+    third = await function(invoice_id="B")
+
+    assert first == second == {"calls": 1, "invoice_id": "A"}
+    assert third == {"calls": 2, "invoice_id": "B"}
+    assert function.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_shared_across_workers() -> None:
+    """Redis 캐시를 통한 워커 간 결과 공유 테스트"""
+    redis = MockRedisService()
+    worker1 = FunctionResultCache(max_size=10, redis=redis)
+    worker2 = FunctionResultCache(max_size=10, redis=redis)
+
+    await worker1.set("calculate", "key", {"result": 4}, ttl=60)
+    hit, value = await worker2.get("calculate", "key")
+
+    assert hit
+    assert value == {"result": 4}
+    assert redis.expires["agent:function:calculate:key"] == 60
+
+
+@pytest.mark.asyncio
+async def test_corrupt_redis_entry_is_miss() -> None:
+    """Redis 항목을 해석할 수 없으면 캐시 미스로 처리"""
+    redis = MockRedisService()
+    cache = FunctionResultCache(max_size=10, redis=redis)
+
+    for raw in ["{not json", json.dumps({"value": 1})]:
+        await redis.set("agent:function:calculate:key", raw)
+        assert await cache.get("calculate", "key") == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_local_lru_bounded(function_cache: FunctionResultCache) -> None:
+    """로컬 LRU 크기 제한 테스트"""
+    function_cache.redis = None
+    for key in ["a", "b", "c"]:
+        await function_cache.set("calculate", key, key, ttl=60)
+
+    assert (await function_cache.get("calculate", "a"))[0] is False
+    assert (await function_cache.get("calculate", "c")) == (True, "c")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_publishes(function_cache: FunctionResultCache) -> None:
+    """무효화 전파 테스트"""
+    await function_cache.set("calculate", "a", 1, ttl=60)
+    await function_cache.set("calculate", "b", 2, ttl=60)
+
+    await function_cache.invalidate("calculate")
+
+    assert (await function_cache.get("calculate", "a"))[0] is False
+    assert function_cache.redis.store == {}
+    channel, message = function_cache.redis.published[0]
+    assert channel == INVALIDATION_CHANNEL
+    assert json.loads(message) == {"function_name": "calculate", "key": None}
+
+
+@pytest.mark.asyncio
+async def test_calculate_is_cacheable(function_cache: FunctionResultCache) -> None:
+    """계산 함수 결과 캐시 테스트"""
+    function = CalculateFunction()
+
+    with patch.object(CalculateFunction, "execute", wraps=function.execute) as execute:
+        assert await function(expression="2 + 2") == {"result": 4}
+        assert await function(expression="2 + 2") == {"result": 4}
+
+    execute.assert_called_once()
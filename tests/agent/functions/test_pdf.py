@@ -0,0 +1,83 @@
+"""PDF 추출 함수 테스트"""
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src.agent.functions.modules.pdf import extract_pdf
+from src.agent.functions.registry import FunctionRegistry
+from src.core.config import settings
+from src.core.metrics import FUNCTION_DURATION
+from src.services.pdf.cache import init_document_cache
+from src.services.pdf.pool import close_pdf_pool
+from tests.helpers.pdf import write_pdf
+
+
+@pytest.fixture
+def storage(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setattr(settings, "pdf_storage_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "pdf_workers", 1)
+    monkeypatch.setattr(settings, "pdf_cache_dir", str(tmp_path / "cache"))
+    init_document_cache()
+    yield tmp_path
+    close_pdf_pool()
+
+
+def count_page_observations() -> float:
+    for metric in FUNCTION_DURATION.collect():
+        for sample in metric.samples:
+            if (
+                sample.name.endswith("_count")
+                and sample.labels["function_name"] == "extract_pdf_page"
+            ):
+                return sample.value
+    return 0
+
+
+@pytest.mark.asyncio
+async def test_extract_pdf_in_worker_process(storage: Path) -> None:
+    write_pdf(
+        storage / "invoice.pdf",
+        [["Invoice No. INV-001"], ["Page two"]],
+        [["Item", "Amount"], ["Widget", "1200"]],
+    )
+    before = count_page_observations()
+
+    result = await extract_pdf(path="invoice.pdf")
+
+    assert result["path"] == "invoice.pdf"
+    assert result["page_count"] == 2
+    assert "INV-001" in result["pages"][0]["text"]
+    assert result["pages"][0]["tables"] == [[["Item", "Amount"], ["Widget", "1200"]]]
+    assert "words" not in result["pages"][0]
+    assert count_page_observations() - before == 2
+
+    # 같은 내용의 문서는 다시 파싱하지 않음
+    (storage / "copy.pdf").write_bytes((storage / "invoice.pdf").read_bytes())
+    cached = await extract_pdf(path="copy.pdf", include=["text"])
+
+    assert cached["sha256"] == result["sha256"]
+    assert all(page["cached"] for page in cached["pages"])
+    assert "tables" not in cached["pages"][0]
+    assert count_page_observations() - before == 2
+
+
+@pytest.mark.asyncio
+async def test_extract_pdf_rejects_path_outside_storage(storage: Path) -> None:
+    with pytest.raises(ValueError):
+        await extract_pdf(path="../outside.pdf")
+
+
+@pytest.mark.asyncio
+async def test_extract_pdf_rejects_unknown_part(storage: Path) -> None:
+    write_pdf(storage / "invoice.pdf", [["Invoice"]])
+
+    with pytest.raises(ValueError):
+        await extract_pdf(path="invoice.pdf", include=["images"])
+
+
+def test_registry_loads_pdf_function() -> None:
+    registry = FunctionRegistry.load_functions()
+
+    assert registry.get_function("extract_pdf") is not None
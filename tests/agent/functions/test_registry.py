@@ -1,8 +1,21 @@
+import asyncio
+import json
+import os
+from unittest.mock import patch
+
 import pytest
 
-from src.agent.core.exceptions import FunctionNotFoundError
-from src.agent.functions.base import AgentFunction
-from src.agent.functions.registry import FunctionRegistry
+from src.agent.core.exceptions import AgentError, FunctionNotFoundError
+from src.agent.functions import registry as registry_module
+from src.agent.functions.base import AgentFunction, ToolSet
+from src.agent.functions.registry import (
+    RELOAD_CHANNEL,
+    FunctionRegistry,
+    get_function_registry,
+    listen_registry_reloads,
+    reload_function_registry,
+)
+from tests.helpers.mock_data import MockPubSub, MockRedisService
 
 
 class TestFunction(AgentFunction):
@@ -55,3 +68,108 @@ def test_list_functions(registry):
     assert len(functions) == 2
     assert function1 in functions
     assert function2 in functions
+
+
+def test_frozen_registry_rejects_register(registry):
+    """동결된 레지스트리 등록 거부 테스트"""
+    registry.register(TestFunction())
+    registry.freeze()
+
+    assert registry.frozen
+    with pytest.raises(AgentError):
+        registry.register(TestFunction())
+
+
+def test_metadata_precomputed(registry):
+    """메타데이터 사전 계산 테스트"""
+    function = TestFunction()
+    registry.register(function)
+
+    metadata = registry.get_metadata("test_function")
+    assert metadata is registry.get_metadata("test_function")
+    assert metadata.name == function.name
+    assert metadata.parameters == function.parameters
+
+
+@pytest.mark.asyncio
+async def test_reload_swaps_snapshot(monkeypatch):
+    """핫 리로드 시 스냅샷 교체 테스트"""
+    old = FunctionRegistry().freeze()
+    new = FunctionRegistry()
+    new.register(TestFunction())
+    new.freeze()
+    monkeypatch.setattr(registry_module, "_registry", old)
+
+    with patch.object(FunctionRegistry, "load_functions", return_value=new) as load:
+        assert get_function_registry() is old
+        result = await reload_function_registry()
+
+    load.assert_called_once_with(True)
+    assert result is new
+    assert get_function_registry() is new
+
+
+@pytest.mark.asyncio
+async def test_reload_propagates_to_other_workers(monkeypatch):
+    """리로드 메시지를 받은 다른 워커도 스냅샷 교체 (보낸 워커는 다시 읽지 않음)"""
+    redis = MockRedisService()
+    new = FunctionRegistry().freeze()
+    monkeypatch.setattr(registry_module, "_registry", FunctionRegistry().freeze())
+
+    with patch.object(FunctionRegistry, "load_functions", return_value=new) as load:
+        await reload_function_registry(redis)
+    channel, message = redis.published[0]
+    assert channel == RELOAD_CHANNEL
+    assert json.loads(message) == {"pid": os.getpid()}
+    load.assert_called_once()
+
+    class ReloadPubSub(MockPubSub):
+        async def listen(self):
+            yield {"type": "subscribe", "data": 1}
+            # 자신이 보낸 메시지는 무시하고 다른 워커가 보낸 메시지만 반영
+            yield {"type": "message", "data": message}
+            yield {"type": "message", "data": json.dumps({"pid": os.getpid() + 1})}
+            await asyncio.Event().wait()
+
+    redis.client.pubsub = ReloadPubSub
+    other = FunctionRegistry()
+    other.register(TestFunction())
+    other.freeze()
+    with patch.object(FunctionRegistry, "load_functions", return_value=other) as load:
+        task = asyncio.create_task(listen_registry_reloads(redis))
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    load.assert_called_once_with(True)
+    assert get_function_registry() is other
+
+
+def test_tool_set_cached_and_canonical(registry):
+    """함수 조합별 tools 페이로드 캐시 및 정규화 테스트"""
+    function1 = TestFunction()
+    function2 = type(
+        "TestFunction2",
+        (TestFunction,),
+        {"name": "a_function"},
+    )()
+    registry.register(function1)
+    registry.register(function2)
+
+    tool_set = registry.get_tool_set(["test_function", "a_function"])
+
+    assert registry.get_tool_set(["a_function", "test_function"]) is tool_set
+    assert tool_set.names == ("a_function", "test_function")
+    assert tool_set.tools[0]["function"]["name"] == "a_function"
+    assert registry.get_tool_set(None) is None
+
+
+def test_tool_set_hash_stable():
+    """동일한 함수 조합의 해시 일관성 테스트"""
+    tool_set1 = ToolSet([TestFunction()])
+    tool_set2 = ToolSet([TestFunction(), TestFunction()])
+
+    assert tool_set1.schema_hash == tool_set2.schema_hash
+    assert tool_set1.tools == tool_set2.tools
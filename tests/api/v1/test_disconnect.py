@@ -0,0 +1,53 @@
+"""클라이언트 연결 종료 감지 테스트"""
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.api.v1.disconnect import cancel_on_disconnect
+from src.core.exceptions import AgentError
+
+
+def create_request(disconnect_after: float) -> MagicMock:
+    """disconnect_after초 뒤 http.disconnect를 받는 요청"""
+
+    async def receive() -> dict[str, Any]:
+        await asyncio.sleep(disconnect_after)
+        return {"type": "http.disconnect"}
+
+    request = MagicMock()
+    request.receive = receive
+    return request
+
+
+@pytest.mark.asyncio
+async def test_returns_result_before_disconnect() -> None:
+    """작업이 먼저 끝나면 결과 반환"""
+
+    async def work() -> str:
+        return "done"
+
+    assert await cancel_on_disconnect(create_request(1.0), work(), "chat") == "done"
+
+
+@pytest.mark.asyncio
+async def test_cancels_work_on_disconnect() -> None:
+    """연결이 끊기면 진행 중인 작업을 취소하고 499 반환"""
+    cancelled = asyncio.Event()
+
+    async def work() -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "done"
+
+    with pytest.raises(AgentError) as exc_info:
+        await cancel_on_disconnect(create_request(0.01), work(), "chat")
+
+    assert exc_info.value.status_code == 499
+    assert exc_info.value.detail["code"] == "CLIENT_DISCONNECTED"
+    assert cancelled.is_set()
@@ -0,0 +1,59 @@
+"""SSE 이벤트 병합 테스트"""
+
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+
+from src.api.v1.sse import coalesce_events
+
+
+async def stream(
+    *items: str | dict[str, str] | float,
+) -> AsyncIterator[str | dict[str, str]]:
+    """float 항목은 해당 시간(초)만큼 대기"""
+    for item in items:
+        if isinstance(item, float):
+            await asyncio.sleep(item)
+        else:
+            yield item
+
+
+async def collect(
+    events: AsyncIterator[str | dict[str, str]], window: float = 0.05
+) -> list[str]:
+    return [
+        event["data"]
+        async for event in coalesce_events(events, window=window, max_bytes=8)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_first_delta_sent_immediately_then_coalesced() -> None:
+    """첫 델타는 바로, 이후 델타는 창 안에서 병합"""
+    assert await collect(stream("a", "b", "c", "d")) == ["a", "bcd"]
+
+
+@pytest.mark.asyncio
+async def test_flush_on_byte_threshold() -> None:
+    """버퍼가 max_bytes 이상이면 바로 전송"""
+    assert await collect(stream("a", "1234", "5678", "9")) == ["a", "12345678", "9"]
+
+
+@pytest.mark.asyncio
+async def test_flush_on_window_without_next_delta() -> None:
+    """다음 델타가 늦으면 창이 끝날 때 버퍼 전송"""
+    assert await collect(stream("a", "b", 0.2, "c")) == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_standalone_events_keep_order() -> None:
+    """독립 이벤트 앞의 버퍼를 먼저 전송"""
+    events = stream("a", "b", {"data": "result"}, "c")
+    assert await collect(events) == ["a", "b", "result", "c"]
+
+
+@pytest.mark.asyncio
+async def test_zero_window_disables_coalescing() -> None:
+    """window가 0이면 델타마다 이벤트 전송"""
+    assert await collect(stream("a", "b", "c"), window=0) == ["a", "b", "c"]
@@ -0,0 +1,164 @@
+"""멀티파트 업로드 스트리밍 테스트"""
+
+import hashlib
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from fastapi import Request
+
+from src.api.v1 import upload as upload_module
+from src.api.v1.upload import MultipartUpload, store_upload
+from src.core.exceptions import (
+    PayloadTooLargeError,
+    UnsupportedMediaTypeError,
+    ValidationError,
+)
+
+BOUNDARY = "test-boundary"
+CHUNK_SIZE = 64 * 1024
+
+
+def body_parts(content: Iterator[bytes], field: str = "file") -> Iterator[bytes]:
+    """파일 필드 하나와 일반 필드 하나를 가진 멀티파트 본문 조각"""
+    yield (
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="note"\r\n\r\n'
+        "hello\r\n"
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="a.pdf"\r\n'
+        "Content-Type: application/pdf\r\n\r\n"
+    ).encode()
+    yield from content
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def make_request(
+    chunks: Iterator[bytes],
+    content_length: int | None = None,
+    content_type: str = f"multipart/form-data; boundary={BOUNDARY}",
+) -> Request:
+    headers = [(b"content-type", content_type.encode())]
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode()))
+    pending = iter(chunks)
+
+    async def receive() -> dict[str, Any]:
+        chunk = next(pending, None)
+        if chunk is None:
+            return {"type": "http.request", "body": b"", "more_body": False}
+        return {"type": "http.request", "body": chunk, "more_body": True}
+
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": headers}
+    return Request(scope, receive)
+
+
+def pdf_content(size: int) -> Iterator[bytes]:
+    """%PDF- 로 시작하는 size바이트 내용을 청크로 생성"""
+    yield b"%PDF-"
+    remaining = size - 5
+    block = b"0123456789abcdef" * (CHUNK_SIZE // 16)
+    while remaining > 0:
+        yield block[: min(remaining, CHUNK_SIZE)]
+        remaining -= CHUNK_SIZE
+
+
+def expected_digest(size: int) -> str:
+    digest = hashlib.sha256()
+    for chunk in pdf_content(size):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_receive_upload(tmp_path: Path) -> None:
+    upload = MultipartUpload("file", 1 << 20, tmp_path, signature=b"%PDF-")
+
+    result = await upload.receive(make_request(body_parts(pdf_content(200_000))))
+
+    assert result.size == 200_000
+    assert result.filename == "a.pdf"
+    assert result.sha256 == expected_digest(200_000)
+    assert result.path.stat().st_size == 200_000
+
+    stored = await store_upload(result, tmp_path / "stored" / f"{result.sha256}.pdf")
+    assert stored.exists()
+    assert [path.name for path in tmp_path.glob("*.part")] == []
+
+
+@pytest.mark.asyncio
+async def test_receive_upload_buffer_stays_bounded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """업로드 크기와 무관하게 메모리에 모이는 데이터는 쓰기 버퍼 수준으로 유지"""
+    size = 32 * 1024 * 1024
+    writes: list[int] = []
+    original_write = upload_module._FileSink.write
+
+    def write(self: Any, chunks: list[bytes]) -> None:
+        writes.append(sum(len(chunk) for chunk in chunks))
+        original_write(self, chunks)
+
+    monkeypatch.setattr(upload_module._FileSink, "write", write)
+    upload = MultipartUpload("file", size, tmp_path, signature=b"%PDF-")
+
+    result = await upload.receive(make_request(body_parts(pdf_content(size))))
+
+    assert result.size == size == sum(writes)
+    assert len(writes) > 10
+    assert max(writes) < upload_module.WRITE_BUFFER_SIZE + CHUNK_SIZE
+
+
+@pytest.mark.asyncio
+async def test_rejects_declared_oversized_body(tmp_path: Path) -> None:
+    upload = MultipartUpload("file", 1000, tmp_path)
+    chunks_read = []
+
+    def chunks() -> Iterator[bytes]:
+        chunks_read.append(True)
+        yield b""
+
+    with pytest.raises(PayloadTooLargeError):
+        await upload.receive(make_request(chunks(), content_length=10 * 1024 * 1024))
+    # 본문을 읽기 전에 거절
+    assert chunks_read == []
+
+
+@pytest.mark.asyncio
+async def test_rejects_oversized_stream_and_cleans_up(tmp_path: Path) -> None:
+    upload = MultipartUpload("file", 100_000, tmp_path)
+
+    with pytest.raises(PayloadTooLargeError):
+        await upload.receive(make_request(body_parts(pdf_content(1_000_000))))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_rejects_unexpected_signature(tmp_path: Path) -> None:
+    upload = MultipartUpload("file", 1 << 20, tmp_path, signature=b"%PDF-")
+
+    with pytest.raises(UnsupportedMediaTypeError):
+        await upload.receive(make_request(body_parts(iter([b"GIF89a" * 100]))))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_rejects_non_multipart(tmp_path: Path) -> None:
+    upload = MultipartUpload("file", 1 << 20, tmp_path)
+
+    with pytest.raises(UnsupportedMediaTypeError):
+        await upload.receive(
+            make_request(iter([b"{}"]), content_type="application/json")
+        )
+
+
+@pytest.mark.asyncio
+async def test_rejects_missing_file_field(tmp_path: Path) -> None:
+    upload = MultipartUpload("file", 1 << 20, tmp_path)
+
+    with pytest.raises(ValidationError):
+        await upload.receive(make_request(body_parts(pdf_content(100), field="other")))
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,132 @@
+"""JSONL 일괄 처리 CLI 테스트"""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.agent.core.base import Agent
+from src.agent.functions.base import ToolSet
+from src.cli import bulk
+from src.cli.bulk import BulkRunner, agent_context, percentile
+from src.services.llm.cache import CacheMode
+from src.services.pdf import cache as pdf_cache
+from tests.conftest import MockFunction
+from tests.helpers.mock_data import MockRedisService
+
+
+def create_agent() -> tuple[Agent, AsyncMock]:
+    llm_service = MagicMock()
+    llm_service.generate = AsyncMock(
+        return_value={
+            "content": "응답",
+            "function_call": None,
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+        }
+    )
+    registry = MagicMock()
+    registry.get_tool_set = MagicMock(return_value=ToolSet([MockFunction()]))
+    return Agent(llm_service, registry), llm_service.generate
+
+
+def write_jsonl(path: Path, records: list[dict]) -> None:
+    path.write_text(
+        "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records),
+        encoding="utf-8",
+    )
+
+
+def read_jsonl(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_percentile() -> None:
+    """nearest-rank 백분위수 테스트"""
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile([], 50) is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_run(tmp_path: Path) -> None:
+    """결과, 체크포인트, 통계 기록 테스트"""
+    input_path = tmp_path / "input.jsonl"
+    output_path = tmp_path / "output.jsonl"
+    checkpoint_path = tmp_path / "output.checkpoint"
+    write_jsonl(
+        input_path,
+        [
+            {"request_id": "a", "input": "첫 번째"},
+            {"request_id": "b", "input": "두 번째"},
+            {"request_id": "c"},  # input 누락
+        ],
+    )
+    agent, generate = create_agent()
+
+    stats = await BulkRunner(agent, 2).run(input_path, output_path, checkpoint_path)
+
+    results = {record["id"]: record for record in read_jsonl(output_path)}
+    assert results["a"]["result"] == "응답"
+    assert results["a"]["usage"] == {"prompt_tokens": 10, "completion_tokens": 5}
+    assert results["c"]["error"]["code"] == "VALIDATION_ERROR"
+    assert set(checkpoint_path.read_text().split()) == {"a", "b", "c"}
+    assert generate.await_count == 2
+    assert stats.succeeded == 2
+    assert stats.failed == 1
+    assert stats.summary()["tokens"]["total"] == 30
+
+
+@pytest.mark.asyncio
+async def test_bulk_resume(tmp_path: Path) -> None:
+    """체크포인트에 있는 레코드는 다시 호출하지 않음"""
+    input_path = tmp_path / "input.jsonl"
+    output_path = tmp_path / "output.jsonl"
+    checkpoint_path = tmp_path / "output.checkpoint"
+    write_jsonl(
+        input_path,
+        [{"request_id": "a", "input": "첫 번째"}, {"input": "두 번째"}],
+    )
+    checkpoint_path.write_text("a\n")
+    agent, generate = create_agent()
+
+    stats = await BulkRunner(agent, 4).run(input_path, output_path, checkpoint_path)
+
+    assert stats.skipped == 1
+    assert generate.await_count == 1
+    assert [record["id"] for record in read_jsonl(output_path)] == ["line-2"]
+    assert checkpoint_path.read_text().split() == ["a", "line-2"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_failed_items_not_checkpointed(tmp_path: Path) -> None:
+    """실패한 레코드는 재시작 시 다시 처리되도록 체크포인트에서 제외"""
+    input_path = tmp_path / "input.jsonl"
+    output_path = tmp_path / "output.jsonl"
+    checkpoint_path = tmp_path / "output.checkpoint"
+    write_jsonl(input_path, [{"request_id": "a", "input": "첫 번째"}])
+    agent, generate = create_agent()
+    generate.side_effect = RuntimeError("upstream error")
+
+    stats = await BulkRunner(agent, 1).run(input_path, output_path, checkpoint_path)
+
+    assert stats.failed == 1
+    assert read_jsonl(output_path)[0]["error"]["code"] == "LLM_ERROR"
+    assert checkpoint_path.read_text() == ""
+
+
+@pytest.mark.asyncio
+async def test_agent_context_uses_redis_document_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis = MockRedisService()
+    monkeypatch.setattr(bulk, "init_redis_service", lambda: redis)
+    monkeypatch.setattr(bulk, "close_redis_service", AsyncMock())
+    monkeypatch.setattr(bulk, "init_openai_client", MagicMock())
+    monkeypatch.setattr(bulk, "close_openai_client", AsyncMock())
+    monkeypatch.setattr(pdf_cache, "_document_cache", None)
+
+    async with agent_context(CacheMode.BYPASS):
+        # API 서버 lifespan과 같이 Redis 단계가 붙은 PDF 캐시를 사용
+        assert pdf_cache.get_document_cache().redis is redis
@@ -9,7 +9,8 @@ import pytest_asyncio
 from fastapi import FastAPI
 from httpx import AsyncClient
 
-from src.agent.functions.base import AgentFunction
+from src.agent.functions.base import AgentFunction, ToolSet
+from src.agent.functions.registry import get_function_registry
 from src.main import app
 
 
@@ -57,13 +58,14 @@ def mock_llm_service() -> Generator[MagicMock, None, None]:
 
 
 @pytest.fixture
-def mock_function_registry() -> Generator[MagicMock, None, None]:
+def mock_function_registry(test_app: FastAPI) -> Generator[MagicMock, None, None]:
     """함수 레지스트리 Mock fixture"""
-    with patch("src.api.v1.routes.agent.FunctionRegistry") as mock:
-        registry = MagicMock()
-        registry.get_function = MagicMock(return_value=MockFunction())
-        mock.load_functions.return_value = registry
-        yield registry
+    registry = MagicMock()
+    registry.get_function = MagicMock(return_value=MockFunction())
+    registry.get_tool_set = MagicMock(return_value=ToolSet([MockFunction()]))
+    test_app.dependency_overrides[get_function_registry] = lambda: registry
+    yield registry
+    test_app.dependency_overrides.pop(get_function_registry, None)
 
 
 @pytest.fixture(autouse=True)
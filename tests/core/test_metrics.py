@@ -0,0 +1,52 @@
+"""멀티프로세스 메트릭 수집 테스트"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.core.metrics import MULTIPROC_DIR_ENV, cleanup_dead_workers, generate_metrics
+
+WORKER_SCRIPT = """
+from prometheus_client import Counter, Gauge
+Counter("test_worker_requests", "test", ["worker"]).labels(worker="a").inc(3)
+Gauge("test_worker_in_flight", "test", multiprocess_mode="livesum").set(2)
+"""
+
+
+def run_worker(path: Path) -> int:
+    """별도 프로세스에서 메트릭을 기록하고 종료된 pid 반환"""
+    process = subprocess.run(
+        [sys.executable, "-c", WORKER_SCRIPT],
+        env={**os.environ, MULTIPROC_DIR_ENV: str(path)},
+        check=True,
+    )
+    assert process.returncode == 0
+    return int(next(path.glob("gauge_livesum_*.db")).stem.rsplit("_", 1)[1])
+
+
+def test_generate_metrics_aggregates_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """공유 디렉터리의 워커 값을 합산해 노출"""
+    run_worker(tmp_path)
+    monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+
+    output = generate_metrics().decode()
+    assert 'test_worker_requests_total{worker="a"} 3.0' in output
+
+
+def test_cleanup_dead_workers(tmp_path: Path) -> None:
+    """종료된 워커의 live 게이지 파일만 삭제"""
+    dead_pid = run_worker(tmp_path)
+    live_file = tmp_path / f"gauge_livesum_{os.getpid()}.db"
+    live_file.write_bytes(b"")
+
+    cleanup_dead_workers(str(tmp_path))
+
+    assert not (tmp_path / f"gauge_livesum_{dead_pid}.db").exists()
+    assert live_file.exists()
+    # 카운터는 종료된 워커의 값도 유지
+    assert list(tmp_path.glob("counter_*.db"))
@@ -0,0 +1,86 @@
+"""Prometheus 미들웨어 테스트"""
+
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+from src.core.middleware import PrometheusMiddleware
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str) -> dict[str, str]:
+        return {"id": item_id}
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[str]:
+            yield "first"
+            await asyncio.sleep(0.05)
+            yield "second"
+
+        return StreamingResponse(chunks())
+
+    return app
+
+
+def sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_labels_by_route_template() -> None:
+    """요청 경로가 아닌 라우트 템플릿으로 집계"""
+    labels = {"method": "GET", "endpoint": "/items/{item_id}", "status": "200"}
+    before = sample("api_requests_total", **labels)
+
+    async with AsyncClient(app=create_app(), base_url="http://test") as client:
+        await client.get("/items/1")
+        await client.get("/items/2")
+        await client.get("/unknown/path")
+
+    assert sample("api_requests_total", **labels) == before + 2
+    assert (
+        sample("api_requests_total", method="GET", endpoint="unmatched", status="404")
+        >= 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_skips_system_endpoints() -> None:
+    """시스템 엔드포인트는 집계하지 않음"""
+    async with AsyncClient(app=create_app(), base_url="http://test") as client:
+        await client.get("/health")
+
+    assert (
+        sample("api_requests_total", method="GET", endpoint="/health", status="200")
+        == 0
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_ttfb_and_duration() -> None:
+    """스트리밍 응답은 첫 바이트 시간과 전체 시간을 따로 기록"""
+    labels = {"method": "GET", "endpoint": "/stream"}
+    ttfb_before = sample("api_response_ttfb_seconds_sum", **labels)
+    duration_before = sample("api_request_duration_seconds_sum", **labels)
+
+    async with AsyncClient(app=create_app(), base_url="http://test") as client:
+        response = await client.get("/stream")
+    assert response.text == "firstsecond"
+
+    ttfb = sample("api_response_ttfb_seconds_sum", **labels) - ttfb_before
+    duration = sample("api_request_duration_seconds_sum", **labels) - duration_before
+    assert duration - ttfb >= 0.04
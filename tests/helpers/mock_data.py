@@ -1,8 +1,14 @@
 """테스트용 Mock 데이터 생성 헬퍼"""
 
+import asyncio
+import json
+from fnmatch import fnmatch
 from typing import Any, AsyncGenerator
 from unittest.mock import MagicMock
 
+from openai.types.chat import ChatCompletionMessageToolCall
+from openai.types.chat.chat_completion_message_tool_call import Function
+
 
 def create_mock_llm_response(content: str = "테스트 응답") -> dict[str, Any]:
     """LLM 응답 Mock 데이터 생성"""
@@ -22,6 +28,21 @@ def create_mock_function_call(
     return mock_function_call
 
 
+def create_mock_tool_call(
+    function_name: str = "test_function",
+    arguments: dict[str, Any] | None = None,
+    call_id: str = "call_0",
+) -> ChatCompletionMessageToolCall:
+    """Tool Call Mock 데이터 생성"""
+    if arguments is None:
+        arguments = {"param": "test_value"}
+    return ChatCompletionMessageToolCall(
+        id=call_id,
+        type="function",
+        function=Function(name=function_name, arguments=json.dumps(arguments)),
+    )
+
+
 async def create_mock_stream() -> AsyncGenerator[dict[str, Any], None]:
     """Mock 스트림 생성기"""
     yield {"content": "청크 1"}
@@ -40,3 +61,91 @@ async def create_mock_function_stream(
     mock_function_call = create_mock_function_call(function_name, arguments)
     yield {"function_call": mock_function_call}
     yield {"content": "청크 2"}
+
+
+class MockPubSub:
+    """테스트용 pub/sub (메시지 없음)"""
+
+    async def subscribe(self, *channels: str) -> None:
+        pass
+
+    async def get_message(
+        self, ignore_subscribe_messages: bool = False, timeout: float = 0.0
+    ) -> None:
+        return None
+
+    async def reset(self) -> None:
+        pass
+
+
+class MockRedisService:
+    """테스트용 인메모리 Redis 서비스"""
+
+    def __init__(self) -> None:
+        self.store: dict[str, Any] = {}
+        self.expires: dict[str, int | None] = {}
+        self.published: list[tuple[str, str]] = []
+        self.client = MagicMock()
+        self.client.pubsub = MockPubSub
+
+    async def acquire_lock(self, key: str, token: str, expire: float) -> bool:
+        if key in self.store:
+            return False
+        self.store[key] = token
+        return True
+
+    async def release_lock(self, key: str, token: str) -> None:
+        if self.store.get(key) == token:
+            del self.store[key]
+
+    async def get(self, key: str) -> Any:
+        return self.store.get(key)
+
+    async def get_bytes(self, key: str) -> bytes | None:
+        return self.store.get(key)
+
+    async def get_many_bytes(self, keys: list[str]) -> list[bytes | None]:
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, expire: int | None = None) -> None:
+        self.store[key] = value
+        self.expires[key] = expire
+
+    async def set_many(self, values: dict[str, Any], expire: int | None = None) -> None:
+        for key, value in values.items():
+            await self.set(key, value, expire)
+
+    async def delete(self, key: str) -> None:
+        self.store.pop(key, None)
+        self.expires.pop(key, None)
+
+    async def delete_pattern(self, pattern: str) -> None:
+        for key in [k for k in self.store if fnmatch(k, pattern)]:
+            await self.delete(key)
+
+    async def publish(self, channel: str, message: str) -> None:
+        self.published.append((channel, message))
+
+    async def exists(self, key: str) -> bool:
+        return key in self.store
+
+    async def append_stream(self, key: str, fields: dict[str, str], expire: int) -> str:
+        entries = self.store.setdefault(key, [])
+        entry_id = f"{len(entries) + 1}-0"
+        entries.append((entry_id, dict(fields)))
+        self.expires[key] = expire
+        return entry_id
+
+    async def read_stream(
+        self, key: str, last_id: str, block: float
+    ) -> list[tuple[str, dict[str, str]]]:
+        deadline = asyncio.get_running_loop().time() + block
+        while True:
+            entries = [
+                entry
+                for entry in self.store.get(key, [])
+                if int(entry[0].split("-")[0]) > int(last_id.split("-")[0])
+            ]
+            if entries or asyncio.get_running_loop().time() >= deadline:
+                return entries
+            await asyncio.sleep(0.001)
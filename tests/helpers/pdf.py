@@ -0,0 +1,93 @@
+"""테스트용 PDF 생성 헬퍼"""
+
+from pathlib import Path
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+
+# 표 셀 크기와 위치 (포인트)
+CELL_WIDTH = 120
+CELL_HEIGHT = 24
+TABLE_LEFT = 72
+TABLE_TOP = 500
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _text(x: float, y: float, text: str) -> str:
+    return f"BT /F1 11 Tf {x} {y} Td ({_escape(text)}) Tj ET"
+
+
+def _content(lines: list[str], table: list[list[str]] | None) -> bytes:
+    commands = [_text(72, 720 - 16 * i, line) for i, line in enumerate(lines)]
+    if table:
+        rows, columns = len(table), len(table[0])
+        bottom = TABLE_TOP - rows * CELL_HEIGHT
+        right = TABLE_LEFT + columns * CELL_WIDTH
+        for row in range(rows + 1):
+            y = TABLE_TOP - row * CELL_HEIGHT
+            commands.append(f"{TABLE_LEFT} {y} m {right} {y} l S")
+        for column in range(columns + 1):
+            x = TABLE_LEFT + column * CELL_WIDTH
+            commands.append(f"{x} {TABLE_TOP} m {x} {bottom} l S")
+        for row, cells in enumerate(table):
+            for column, cell in enumerate(cells):
+                commands.append(
+                    _text(
+                        TABLE_LEFT + column * CELL_WIDTH + 4,
+                        TABLE_TOP - (row + 1) * CELL_HEIGHT + 8,
+                        cell,
+                    )
+                )
+    return "\n".join(commands).encode("latin-1")
+
+
+def make_pdf(pages: list[list[str]], table: list[list[str]] | None = None) -> bytes:
+    """페이지별 텍스트 줄(과 페이지마다 같은 격자 표)을 담은 PDF 생성"""
+    objects: list[bytes] = []
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for page_id, lines in zip(page_ids, pages, strict=True):
+        objects.append(
+            (
+                f"<< /Type /Page /Parent 2 0 R "
+                f"/MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+                f"/Resources << /Font << /F1 3 0 R >> >> "
+                f"/Contents {page_id + 1} 0 R >>"
+            ).encode()
+        )
+        content = _content(lines, table)
+        objects.append(
+            f"<< /Length {len(content)} >>\nstream\n".encode()
+            + content
+            + b"\nendstream"
+        )
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode()
+    output += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    return bytes(output)
+
+
+def write_pdf(
+    path: Path, pages: list[list[str]], table: list[list[str]] | None = None
+) -> Path:
+    """PDF 파일 생성 후 경로 반환"""
+    path.write_bytes(make_pdf(pages, table))
+    return path
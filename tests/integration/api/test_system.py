@@ -0,0 +1,50 @@
+"""시스템 API 테스트"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.config import settings
+from tests.helpers.assertions import assert_valid_response_format
+
+
+@pytest.mark.asyncio
+async def test_reload_functions_requires_admin_key(
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """관리자 키 없는 리로드 요청 거부 테스트"""
+    monkeypatch.setattr(settings, "admin_api_key", "secret")
+
+    response = await async_client.post(
+        "/admin/functions/reload",
+        headers={"X-Admin-API-Key": "wrong"},
+    )
+
+    assert response.status_code == 403
+    assert_valid_response_format(response.json())
+
+
+@pytest.mark.asyncio
+async def test_reload_functions(
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """함수 레지스트리 리로드 테스트"""
+    monkeypatch.setattr(settings, "admin_api_key", "secret")
+    registry = MagicMock()
+    registry.list_functions.return_value = [MagicMock()]
+    registry.list_functions.return_value[0].name = "test_function"
+
+    with patch(
+        "src.api.system.router.reload_function_registry",
+        AsyncMock(return_value=registry),
+    ):
+        response = await async_client.post(
+            "/admin/functions/reload",
+            headers={"X-Admin-API-Key": "secret"},
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok", "functions": ["test_function"]}
@@ -1,5 +1,6 @@
 """Agent API 테스트"""
 
+import json
 from typing import Any, AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -8,9 +9,11 @@ import pytest_asyncio
 from fastapi import FastAPI
 from httpx import AsyncClient
 
-from src.agent.functions.base import AgentFunction
+from src.agent.functions.base import AgentFunction, ToolSet
+from src.agent.functions.registry import get_function_registry
 from src.main import app
 from tests.helpers.assertions import assert_valid_response_format
+from tests.helpers.mock_data import create_mock_tool_call
 
 
 class MockFunction(AgentFunction):
@@ -51,13 +54,14 @@ def mock_llm_service() -> Generator[MagicMock, None, None]:
 
 
 @pytest.fixture
-def mock_function_registry() -> Generator[MagicMock, None, None]:
+def mock_function_registry(test_app: FastAPI) -> Generator[MagicMock, None, None]:
     """함수 레지스트리 Mock fixture"""
-    with patch("src.api.v1.routes.agent.FunctionRegistry") as mock:
-        registry = MagicMock()
-        registry.get_function = MagicMock(return_value=MockFunction())
-        mock.load_functions.return_value = registry
-        yield registry
+    registry = MagicMock()
+    registry.get_function = MagicMock(return_value=MockFunction())
+    registry.get_tool_set = MagicMock(return_value=ToolSet([MockFunction()]))
+    test_app.dependency_overrides[get_function_registry] = lambda: registry
+    yield registry
+    test_app.dependency_overrides.pop(get_function_registry, None)
 
 
 @pytest.mark.asyncio
@@ -85,11 +89,11 @@ async def test_chat_with_function_call(
     mock_llm_service: MagicMock,
     mock_function_registry: MagicMock,
 ) -> None:
-    """Function Calling 테스트"""
-    mock_function_call = MagicMock()
-    mock_function_call.name = "test_function"
-    mock_function_call.arguments = '{"param": "test_value"}'
-    mock_llm_service.generate.return_value = {"function_call": mock_function_call}
+    """Function Calling 테스트 (함수 결과를 모델에 전달 후 최종 답변)"""
+    mock_llm_service.generate.side_effect = [
+        {"content": "", "tool_calls": [create_mock_tool_call()]},
+        {"content": "최종 답변", "tool_calls": None},
+    ]
 
     response = await async_client.post(
         "/api/v1/agent/chat",
@@ -102,4 +106,13 @@ async def test_chat_with_function_call(
     assert response.status_code == 200
     data = response.json()
     assert_valid_response_format(data)
-    assert data["result"] == {"param": "test_value"}
+    assert data["result"] == "최종 답변"
+
+    # 두 번째 호출에 tool 결과가 포함되어야 함
+    messages = mock_llm_service.generate.call_args.kwargs["messages"]
+    assert messages[1]["tool_calls"][0]["id"] == "call_0"
+    assert messages[2] == {
+        "role": "tool",
+        "tool_call_id": "call_0",
+        "content": json.dumps({"param": "test_value"}),
+    }
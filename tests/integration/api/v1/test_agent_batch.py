@@ -0,0 +1,77 @@
+"""Agent 배치 API 테스트"""
+
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.exceptions import LLMError
+
+
+async def generate_by_prompt(prompt: str, **kwargs: Any) -> dict[str, Any]:
+    """프롬프트별 Mock 응답 생성"""
+    if prompt == "실패":
+        raise LLMError("API 호출 실패")
+    return {"content": f"응답: {prompt}", "function_call": None}
+
+
+@pytest.mark.asyncio
+async def test_chat_batch_ordered(
+    async_client: AsyncClient,
+    mock_llm_service: MagicMock,
+) -> None:
+    """입력 순서 배치 응답 및 항목별 에러 테스트"""
+    mock_llm_service.generate.side_effect = generate_by_prompt
+
+    response = await async_client.post(
+        "/api/v1/agent/chat/batch",
+        json={
+            "items": [{"input": "첫번째"}, {"input": "실패"}, {"input": "세번째"}],
+            "concurrency": 2,
+        },
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["index"] for item in results] == [0, 1, 2]
+    assert results[0]["result"] == "응답: 첫번째"
+    assert results[1]["result"] is None
+    assert results[1]["error"]["code"] == "LLM_ERROR"
+    assert results[2]["result"] == "응답: 세번째"
+
+
+@pytest.mark.asyncio
+async def test_chat_batch_stream(
+    async_client: AsyncClient,
+    mock_llm_service: MagicMock,
+) -> None:
+    """NDJSON 배치 스트리밍 테스트"""
+    mock_llm_service.generate.side_effect = generate_by_prompt
+
+    response = await async_client.post(
+        "/api/v1/agent/chat/batch",
+        json={"items": [{"input": "a"}, {"input": "b"}], "stream": True},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(item["result"] for item in items) == ["응답: a", "응답: b"]
+
+
+@pytest.mark.asyncio
+async def test_chat_batch_too_many_items(
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """배치 항목 수 제한 테스트"""
+    monkeypatch.setattr("src.core.config.settings.batch_max_items", 1)
+
+    response = await async_client.post(
+        "/api/v1/agent/chat/batch",
+        json={"items": [{"input": "a"}, {"input": "b"}]},
+    )
+
+    assert response.status_code == 422
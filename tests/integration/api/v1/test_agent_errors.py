@@ -5,8 +5,9 @@ from unittest.mock import MagicMock
 import pytest
 from httpx import AsyncClient
 
-from src.core.exceptions import FunctionNotFoundError, LLMError
+from src.core.exceptions import FunctionNotFoundError, LLMError, ServiceOverloadedError
 from tests.helpers.assertions import assert_valid_response_format
+from tests.helpers.mock_data import create_mock_tool_call
 
 
 @pytest.mark.asyncio
@@ -37,13 +38,32 @@ async def test_invalid_input_too_long(async_client: AsyncClient) -> None:
     assert data["error"] is not None
 
 
+@pytest.mark.asyncio
+async def test_input_over_token_limit(
+    async_client: AsyncClient,
+    mock_llm_service: MagicMock,
+) -> None:
+    """토큰 한도를 넘는 입력은 LLM 호출 없이 거절"""
+    response = await async_client.post(
+        "/api/v1/agent/chat",
+        json={"input": "가" * 5000},
+    )
+
+    assert response.status_code == 422
+    data = response.json()
+    assert_valid_response_format(data)
+    assert data["code"] == "VALIDATION_ERROR"
+    assert data["details"]["estimated_tokens"] > data["details"]["max_tokens"]
+    mock_llm_service.generate.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_nonexistent_function(
     async_client: AsyncClient,
     mock_function_registry: MagicMock,
 ) -> None:
     """존재하지 않는 함수 호출 테스트"""
-    mock_function_registry.get_function.side_effect = FunctionNotFoundError(
+    mock_function_registry.get_tool_set.side_effect = FunctionNotFoundError(
         "test_function"
     )
 
@@ -68,10 +88,10 @@ async def test_function_execution_error(
     mock_function_registry: MagicMock,
 ) -> None:
     """함수 실행 에러 테스트"""
-    mock_function_call = MagicMock()
-    mock_function_call.name = "test_function"
-    mock_function_call.arguments = '{"param": "test_value"}'
-    mock_llm_service.generate.return_value = {"function_call": mock_function_call}
+    mock_llm_service.generate.return_value = {
+        "content": "",
+        "tool_calls": [create_mock_tool_call()],
+    }
 
     mock_function = MagicMock()
     mock_function.execute.side_effect = Exception("함수 실행 실패")
@@ -108,3 +128,44 @@ async def test_llm_service_error(
     data = response.json()
     assert_valid_response_format(data)
     assert data["error"] is not None
+
+
+@pytest.mark.asyncio
+async def test_service_overloaded(
+    async_client: AsyncClient,
+    mock_llm_service: MagicMock,
+) -> None:
+    """과부하로 거절된 요청은 Retry-After와 함께 503 반환"""
+    mock_llm_service.generate.side_effect = ServiceOverloadedError(3)
+
+    response = await async_client.post(
+        "/api/v1/agent/chat",
+        json={"input": "테스트 메시지"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+    data = response.json()
+    assert_valid_response_format(data)
+    assert data["code"] == "SERVICE_OVERLOADED"
+
+
+@pytest.mark.asyncio
+async def test_korean_input_within_previous_length_limit(
+    async_client: AsyncClient,
+    mock_llm_service: MagicMock,
+    mock_function_registry: MagicMock,
+) -> None:
+    """이전 문자 수 상한(4096자) 안의 한글 입력은 토큰 한도로 거절하지 않음"""
+    mock_llm_service.generate.return_value = {
+        "content": "응답",
+        "function_call": None,
+        "tool_calls": None,
+    }
+
+    response = await async_client.post(
+        "/api/v1/agent/chat",
+        json={"input": "가" * 4096},
+    )
+
+    assert response.status_code == 200
@@ -9,7 +9,8 @@ from fastapi import FastAPI
 from httpx import AsyncClient
 from sse_starlette.sse import AppStatus
 
-from src.agent.functions.base import AgentFunction
+from src.agent.functions.base import AgentFunction, ToolSet
+from src.agent.functions.registry import get_function_registry
 from src.main import app
 
 
@@ -51,13 +52,14 @@ def mock_llm_service() -> Generator[MagicMock, None, None]:
 
 
 @pytest.fixture
-def mock_function_registry() -> Generator[MagicMock, None, None]:
+def mock_function_registry(test_app: FastAPI) -> Generator[MagicMock, None, None]:
     """함수 레지스트리 Mock fixture"""
-    with patch("src.api.v1.routes.agent.FunctionRegistry") as mock:
-        registry = MagicMock()
-        registry.get_function = MagicMock(return_value=MockFunction())
-        mock.load_functions.return_value = registry
-        yield registry
+    registry = MagicMock()
+    registry.get_function = MagicMock(return_value=MockFunction())
+    registry.get_tool_set = MagicMock(return_value=ToolSet([MockFunction()]))
+    test_app.dependency_overrides[get_function_registry] = lambda: registry
+    yield registry
+    test_app.dependency_overrides.pop(get_function_registry, None)
 
 
 async def mock_stream() -> AsyncGenerator[dict[str, Any], None]:
@@ -100,19 +102,16 @@ async def test_chat_stream_response(
     async for line in response.aiter_lines():
         if line.startswith("data: "):
             chunks.append(line[6:])
-            if len(chunks) == 3:  # 모든 청크를 받으면 중단
-                break
 
-    assert len(chunks) == 3
-    assert chunks[0] == "청크 1"
-    assert chunks[1] == "청크 2"
-    assert chunks[2] == "청크 3"
+    # 첫 청크는 바로, 이후 청크는 병합되어 전달
+    assert chunks == ["청크 1", "청크 2청크 3"]
 
     # LLM 서비스 호출 검증
     mock_llm_service.generate.assert_called_once_with(
         prompt="테스트 메시지",
         functions=None,
         streaming=True,
+        messages=None,
     )
 
 
@@ -159,17 +158,19 @@ async def test_chat_stream_with_function_call(
             if len(chunks) == 3:  # 모든 청크를 받으면 중단
                 break
 
+    # 함수는 호출이 완성되는 즉시 실행되고, 결과는 준비된 뒤 전달
     assert len(chunks) == 3
     assert chunks[0] == "청크 1"
-    assert chunks[1] == str({"param": "test_value"})
-    assert chunks[2] == "청크 2"
+    assert chunks[1] == "청크 2"
+    assert chunks[2] == str({"param": "test_value"})
 
     # LLM 서비스 호출 검증
     mock_llm_service.generate.assert_called_once_with(
         prompt="테스트 메시지",
-        functions=[mock_function_registry.get_function.return_value],
+        functions=mock_function_registry.get_tool_set.return_value,
         streaming=True,
+        messages=None,
     )
 
     # 함수 레지스트리 호출 검증
-    mock_function_registry.get_function.assert_called_with("test_function")
+    mock_function_registry.get_tool_set.assert_called_with(["test_function"])
@@ -0,0 +1,139 @@
+"""문서 업로드 API 테스트"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.config import settings
+from src.services.pdf import cache as cache_module
+from src.services.pdf import extractor
+from tests.helpers.pdf import make_pdf
+
+
+@pytest.fixture
+def storage(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(settings, "pdf_storage_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "pdf_cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setattr(cache_module, "_document_cache", None)
+
+    async def run_in_process(function: Any, *args: Any) -> Any:
+        return function(*args)
+
+    monkeypatch.setattr(extractor, "run_in_pdf_pool", run_in_process)
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_upload_document(async_client: AsyncClient, storage: Path) -> None:
+    content = make_pdf([["Invoice No. INV-001"]])
+
+    response = await async_client.post(
+        "/api/v1/documents",
+        files={"file": ("invoice.pdf", content, "application/pdf")},
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    digest = hashlib.sha256(content).hexdigest()
+    assert data["document_id"] == digest
+    assert data["path"] == f"uploads/{digest}.pdf"
+    assert data["filename"] == "invoice.pdf"
+    assert data["size"] == len(content)
+    assert data["extraction"] is None
+    assert (storage / data["path"]).read_bytes() == content
+
+
+@pytest.mark.asyncio
+async def test_upload_and_extract(async_client: AsyncClient, storage: Path) -> None:
+    content = make_pdf([["Invoice No. INV-001"], ["Total 1,200"]])
+
+    response = await async_client.post(
+        "/api/v1/documents",
+        params={"extract": "true"},
+        files={"file": ("invoice.pdf", content, "application/pdf")},
+    )
+
+    assert response.status_code == 201
+    extraction = response.json()["extraction"]
+    assert extraction["sha256"] == hashlib.sha256(content).hexdigest()
+    assert extraction["page_count"] == 2
+    assert "INV-001" in extraction["pages"][0]["text"]
+
+
+@pytest.mark.asyncio
+async def test_upload_too_large(
+    async_client: AsyncClient, storage: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "upload_max_bytes", 1000)
+
+    response = await async_client.post(
+        "/api/v1/documents",
+        files={"file": ("invoice.pdf", b"%PDF-" + b"0" * 200_000, "application/pdf")},
+    )
+
+    assert response.status_code == 413
+    assert response.json()["code"] == "PAYLOAD_TOO_LARGE"
+
+
+@pytest.mark.asyncio
+async def test_upload_not_pdf(async_client: AsyncClient, storage: Path) -> None:
+    response = await async_client.post(
+        "/api/v1/documents",
+        files={"file": ("invoice.pdf", b"not a pdf", "application/pdf")},
+    )
+
+    assert response.status_code == 415
+    assert not list((storage / "uploads").iterdir())
+
+
+@pytest.mark.asyncio
+async def test_extract_invoice(
+    async_client: AsyncClient,
+    storage: Path,
+    mock_llm_service: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "invoice_chunk_pages", 1)
+    content = make_pdf([["Invoice No. INV-001", "Widget 1,000"], ["Total 1,200"]])
+    upload = await async_client.post(
+        "/api/v1/documents",
+        files={"file": ("invoice.pdf", content, "application/pdf")},
+    )
+    document_id = upload.json()["document_id"]
+
+    async def generate(prompt: str, **kwargs: Any) -> dict[str, Any]:
+        if "INV-001" in prompt:
+            answer = {
+                "invoice_number": "INV-001",
+                "line_items": [{"description": "Widget", "amount": 1000}],
+            }
+        else:
+            answer = {"total": 1200}
+        return {"content": json.dumps(answer)}
+
+    mock_llm_service.generate.side_effect = generate
+
+    response = await async_client.post(f"/api/v1/documents/{document_id}/invoice")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["pages"] == [1, 2]
+    assert data["invoice"]["invoice_number"] == "INV-001"
+    assert data["invoice"]["line_items"][0]["description"] == "Widget"
+    assert data["invoice"]["total"] == 1200
+    assert mock_llm_service.generate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_extract_invoice_unknown_document(
+    async_client: AsyncClient, storage: Path
+) -> None:
+    response = await async_client.post(f"/api/v1/documents/{'0' * 64}/invoice")
+
+    assert response.status_code == 404
+    assert response.json()["code"] == "DOCUMENT_NOT_FOUND"
@@ -0,0 +1,188 @@
+"""LLM 응답 캐시 테스트"""
+
+import json
+import unicodedata
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.llm.cache import (
+    CachedLLMService,
+    CacheMode,
+    build_generate_key,
+    build_request_key,
+    replay_stream,
+)
+from src.services.llm.openai import OpenAIService
+from src.services.llm.tokens import MIN_OUTPUT_SAMPLES, TokenPlanner
+from tests.helpers.mock_data import MockRedisService, create_mock_function_call
+
+
+def create_mock_service(response: dict[str, Any]) -> MagicMock:
+    """Mock LLM 서비스 생성"""
+    service = MagicMock()
+    service.model = "gpt-test"
+    service.max_tokens = 100
+    service.plan_max_tokens = MagicMock(return_value=100)
+    service.generate = AsyncMock(return_value=response)
+    return service
+
+
+def test_request_key_normalized() -> None:
+    """요청 키 정규화 테스트"""
+    key1 = build_request_key("m", [{"role": "user", "content": "안녕"}], None, 10)
+    key2 = build_request_key("m", [{"content": "안녕", "role": "user"}], None, 10)
+    key3 = build_request_key("m", [{"role": "user", "content": "안녕"}], None, 20)
+    # 유니코드 정규화(NFD/NFC)만 같게 취급하고 공백은 그대로 구분
+    key4 = build_request_key(
+        "m",
+        [{"role": "user", "content": unicodedata.normalize("NFD", "안녕")}],
+        None,
+        10,
+    )
+    key5 = build_request_key("m", [{"role": "user", "content": " 안녕 "}], None, 10)
+
+    assert key1 == key2 == key4
+    assert key1 != key3
+    assert key1 != key5
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_llm() -> None:
+    """캐시 적중 시 LLM 호출 생략 테스트"""
+    redis = MockRedisService()
+    inner = create_mock_service(
+        {"content": "응답", "function_call": None, "tool_calls": None}
+    )
+    service = CachedLLMService(inner, redis, ttl=60)
+
+    first = await service.generate("질문")
+    second = await service.generate("질문")
+
+    assert (
+        first
+        == second
+        == {"content": "응답", "function_call": None, "tool_calls": None}
+    )
+    inner.generate.assert_called_once()
+    assert list(redis.expires.values()) == [60]
+
+
+@pytest.mark.asyncio
+async def test_cache_bypass_and_refresh() -> None:
+    """bypass, refresh 모드 테스트"""
+    redis = MockRedisService()
+    inner = create_mock_service({"content": "응답", "function_call": None})
+
+    bypass = CachedLLMService(inner, redis, CacheMode.BYPASS)
+    await bypass.generate("질문")
+    assert redis.store == {}
+
+    refresh = CachedLLMService(inner, redis, CacheMode.parse("Refresh"))
+    await refresh.generate("질문")
+    await refresh.generate("질문")
+    assert len(redis.store) == 1
+    assert inner.generate.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_response_replayed_as_stream() -> None:
+    """캐시된 응답의 스트리밍 재생 테스트"""
+    redis = MockRedisService()
+    function_call = create_mock_function_call()
+    function_call.arguments = '{"param": "test_value"}'
+    inner = create_mock_service({"content": "가" * 100, "function_call": function_call})
+    service = CachedLLMService(inner, redis)
+    await service.generate("질문")
+
+    stream = await service.generate("질문", streaming=True)
+
+    assert isinstance(stream, AsyncIterator)
+    chunks = [chunk async for chunk in stream]
+    assert "".join(chunk.get("content", "") for chunk in chunks) == "가" * 100
+    assert chunks[-1]["function_call"].name == "test_function"
+    assert chunks[-1]["function_call"].arguments == '{"param": "test_value"}'
+    inner.generate.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_replay_stream_chunks() -> None:
+    """재생 청크 분할 테스트"""
+    chunks = [
+        chunk
+        async for chunk in replay_stream({"content": "a" * 130, "function_call": None})
+    ]
+
+    assert [len(chunk["content"]) for chunk in chunks] == [64, 64, 2]
+
+
+def test_cache_key_independent_of_planner_state() -> None:
+    """워커마다 planner 관측 상태가 달라도 같은 요청은 같은 키"""
+    warm, cold = OpenAIService(client=MagicMock()), OpenAIService(client=MagicMock())
+    warm.planner, cold.planner = (
+        TokenPlanner(
+            context_window=8000,
+            max_output_tokens=4000,
+            min_output_tokens=100,
+            headroom=1.5,
+            sample_size=100,
+        )
+        for _ in range(2)
+    )
+    for _ in range(MIN_OUTPUT_SAMPLES):
+        warm.planner.observe(200)
+
+    assert warm.plan_max_tokens("질문") != cold.plan_max_tokens("질문")
+    assert build_generate_key(warm, "질문", None) == build_generate_key(
+        cold, "질문", None
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_requires_enough_max_tokens() -> None:
+    """더 작은 예약으로 생성된 항목은 재사용하지 않고, 큰 예약의 항목은 재사용"""
+    redis = MockRedisService()
+    inner = create_mock_service({"content": "응답", "function_call": None})
+    service = CachedLLMService(inner, redis, ttl=60)
+
+    inner.plan_max_tokens.return_value = 256
+    await service.generate("질문")
+    inner.plan_max_tokens.return_value = 512
+    await service.generate("질문")
+    assert inner.generate.await_count == 2
+
+    inner.plan_max_tokens.return_value = 300
+    await service.generate("질문")
+    assert inner.generate.await_count == 2
+    assert len(redis.store) == 1
+
+
+@pytest.mark.asyncio
+async def test_truncated_response_not_cached() -> None:
+    """max_tokens로 잘린 응답은 저장하지 않음"""
+    redis = MockRedisService()
+    inner = create_mock_service(
+        {"content": "잘린 응", "function_call": None, "finish_reason": "length"}
+    )
+    service = CachedLLMService(inner, redis, ttl=60)
+
+    await service.generate("질문")
+    await service.generate("질문")
+
+    assert inner.generate.await_count == 2
+    assert not redis.store
+
+
+@pytest.mark.asyncio
+async def test_corrupt_entry_is_miss() -> None:
+    """해석할 수 없는 캐시 항목은 미스로 처리하고 새 응답으로 덮어씀"""
+    redis = MockRedisService()
+    inner = create_mock_service({"content": "응답", "function_call": None})
+    service = CachedLLMService(inner, redis, ttl=60)
+    key = service.cache_key("질문", None)
+    redis.store[key] = "{not json"
+
+    assert (await service.generate("질문"))["content"] == "응답"
+    assert inner.generate.await_count == 1
+    assert json.loads(redis.store[key])["response"]["content"] == "응답"
@@ -0,0 +1,62 @@
+"""OpenAI 공용 클라이언트 테스트"""
+
+from typing import Generator
+
+import httpx
+import pytest
+
+from src.core.config import settings
+from src.core.metrics import LLM_HTTP_POOL_WAIT
+from src.services.llm import client as client_module
+from src.services.llm.client import (
+    InstrumentedTransport,
+    close_openai_client,
+    get_openai_client,
+)
+
+
+@pytest.fixture
+def reset_client() -> Generator[None, None, None]:
+    """공용 클라이언트 초기화 fixture"""
+    client_module._client = None
+    yield
+    client_module._client = None
+
+
+@pytest.mark.asyncio
+async def test_client_shared_per_worker(
+    reset_client: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """워커 공용 클라이언트 재사용 및 설정 반영 테스트"""
+    monkeypatch.setattr(settings, "openai_api_key", "test_dummy_key")
+    monkeypatch.setattr(settings, "openai_connect_timeout", 1.5)
+
+    client = get_openai_client()
+
+    assert get_openai_client() is client
+    assert client.timeout.connect == 1.5
+
+    await close_openai_client()
+    assert client_module._client is None
+
+
+@pytest.mark.asyncio
+async def test_transport_records_pool_wait() -> None:
+    """커넥션 확보 시점까지의 대기 시간 기록 테스트"""
+    transport = InstrumentedTransport()
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        await request.extensions["trace"]("connection.connect_tcp.started", {})
+        return httpx.Response(200, stream=httpx.ByteStream(b"ok"))
+
+    transport._transport.handle_async_request = handle  # type: ignore[method-assign]
+    before = LLM_HTTP_POOL_WAIT._value.get()
+
+    response = await transport.handle_async_request(
+        httpx.Request("GET", "https://api.openai.com/v1/models")
+    )
+    body = await response.aread()
+
+    assert body == b"ok"
+    assert LLM_HTTP_POOL_WAIT._value.get() > before
+    await transport.aclose()
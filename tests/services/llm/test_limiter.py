@@ -0,0 +1,170 @@
+"""LLM 동시 호출 제한 테스트"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import openai
+import pytest
+
+from src.core.exceptions import ServiceOverloadedError
+from src.services.llm.limiter import AdaptiveLimiter, LimitedLLMService
+
+
+def create_limiter(**kwargs: float) -> AdaptiveLimiter:
+    options = {
+        "initial_limit": 2,
+        "min_limit": 1,
+        "max_limit": 10,
+        "queue_size": 1,
+        "queue_timeout": 1.0,
+        "latency_tolerance": 2.0,
+    }
+    options.update(kwargs)
+    return AdaptiveLimiter(model="test-model", **options)  # type: ignore[arg-type]
+
+
+def create_rate_limit_error() -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, request=request)
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+@pytest.mark.asyncio
+async def test_queue_full_sheds_with_retry_after() -> None:
+    """대기열이 가득 차면 Retry-After와 함께 즉시 거절"""
+    limiter = create_limiter()
+    await limiter.acquire()
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+
+    with pytest.raises(ServiceOverloadedError) as exc_info:
+        await limiter.acquire()
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "1"}
+
+    # 슬롯이 반납되면 대기 중인 호출이 이어서 실행
+    limiter.release(latency=0.1)
+    await waiter
+    assert limiter.in_flight == 2
+    assert limiter.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_sheds() -> None:
+    """대기 시간이 초과되면 거절"""
+    limiter = create_limiter(initial_limit=1, queue_timeout=0.01)
+    await limiter.acquire()
+
+    with pytest.raises(ServiceOverloadedError):
+        await limiter.acquire()
+    assert limiter.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_granted_at_timeout_is_kept(monkeypatch: pytest.MonkeyPatch) -> None:
+    """대기 시간 초과와 같은 반복에서 슬롯을 받으면 거절하지 않고 사용"""
+    limiter = create_limiter(initial_limit=1)
+    await limiter.acquire()
+
+    async def grant_then_timeout(waiter: asyncio.Future[None], timeout: float) -> None:
+        limiter.release(latency=0.1)
+        assert waiter.done()
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(asyncio, "wait_for", grant_then_timeout)
+    await limiter.acquire()
+    monkeypatch.undo()
+
+    assert limiter.in_flight == 1
+    limiter.release(latency=0.1)
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_additive_increase_when_saturated() -> None:
+    """한도를 다 쓰는 동안 성공할 때만 한도 증가"""
+    limiter = create_limiter(initial_limit=1)
+    for _ in range(2):
+        await limiter.acquire()
+        limiter.release(latency=1.0)
+    assert limiter.limit == 2
+
+    # 한도 미만으로 사용하면 증가하지 않음
+    await limiter.acquire()
+    limiter.release(latency=1.0)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_multiplicative_decrease_on_rate_limit() -> None:
+    """429 응답 시 한도 절반으로 감소"""
+    limiter = create_limiter(initial_limit=8)
+    await limiter.acquire()
+    limiter.release(error=create_rate_limit_error())
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_decrease_on_latency_spike() -> None:
+    """기준 지연 대비 급증하면 한도 감소"""
+    limiter = create_limiter(initial_limit=10)
+    await limiter.acquire()
+    limiter.release(latency=0.0)
+    await limiter.acquire()
+    limiter.release(latency=1.0)
+    assert limiter.limit == 9
+
+
+@pytest.mark.asyncio
+async def test_limited_service_releases_on_error() -> None:
+    """실패한 호출도 슬롯을 반납"""
+    inner = MagicMock()
+    inner.model = "test-model"
+    inner.max_tokens = 100
+    inner.generate = AsyncMock(side_effect=create_rate_limit_error())
+    limiter = create_limiter(initial_limit=4)
+    service = LimitedLLMService(inner, limiter)
+
+    with pytest.raises(openai.RateLimitError):
+        await service.generate(prompt="테스트")
+    assert limiter.in_flight == 0
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_latency_normalized_by_completion_tokens() -> None:
+    """긴 응답으로 늘어난 소요 시간은 출력 토큰당 시간으로 비교"""
+    limiter = create_limiter(initial_limit=10)
+    await limiter.acquire()
+    limiter.release(latency=0.5, completion_tokens=50)
+    await limiter.acquire()
+    limiter.release(latency=20.0, completion_tokens=2000)
+    assert limiter.limit == 10
+
+    # 토큰당 시간이 급증하면 감소
+    await limiter.acquire()
+    limiter.release(latency=5.0, completion_tokens=50)
+    assert limiter.limit == 9
+
+
+@pytest.mark.asyncio
+async def test_limited_service_passes_completion_tokens() -> None:
+    """비스트리밍 응답의 출력 토큰 수를 리미터에 전달"""
+    inner = MagicMock()
+    inner.model = "test-model"
+    inner.max_tokens = 100
+    inner.generate = AsyncMock(
+        return_value={
+            "content": "응답",
+            "usage": {"prompt_tokens": 10, "completion_tokens": 42},
+        }
+    )
+    limiter = create_limiter()
+    limiter.release = MagicMock(wraps=limiter.release)  # type: ignore[method-assign]
+    service = LimitedLLMService(inner, limiter)
+
+    await service.generate(prompt="테스트")
+    assert limiter.release.call_args.kwargs["completion_tokens"] == 42
@@ -1,9 +1,13 @@
 """OpenAI 서비스 테스트"""
 
 from typing import Any, AsyncGenerator, AsyncIterator, Generator
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from openai.types.chat.chat_completion_chunk import (
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
 
 from src.agent.functions.base import AgentFunction
 from src.services.llm.openai import OpenAIService
@@ -47,12 +51,10 @@ def create_mock_client(response: Any) -> MagicMock:
 @pytest.fixture
 def openai_service() -> Generator[OpenAIService, None, None]:
     """OpenAI 서비스 fixture"""
-    with patch("src.services.llm.openai.AsyncOpenAI") as mock:
-        mock.chat = MagicMock()
-        mock.chat.completions = MagicMock()
-        service = OpenAIService()
-        service.client = mock
-        yield service
+    mock = MagicMock()
+    mock.chat = MagicMock()
+    mock.chat.completions = MagicMock()
+    yield OpenAIService(client=mock)
 
 
 @pytest.mark.asyncio
@@ -75,6 +77,7 @@ async def test_generate_simple_response(
     assert isinstance(response, dict)
     assert response["content"] == "테스트 응답"
     assert response["function_call"] is None
+    assert response["usage"] == {"prompt_tokens": 10, "completion_tokens": 5}
 
 
 @pytest.mark.asyncio
@@ -116,12 +119,15 @@ async def test_generate_streaming_response(
 ) -> None:
     """스트리밍 응답 테스트"""
     # Mock 스트림 청크 생성
-    mock_delta1 = MagicMock(content="청크 1", function_call=None)
-    mock_delta2 = MagicMock(content="청크 2", function_call=None)
+    mock_delta1 = MagicMock(content="청크 1", function_call=None, tool_calls=None)
+    mock_delta2 = MagicMock(content="청크 2", function_call=None, tool_calls=None)
     chunks = [
-        MagicMock(choices=[MagicMock(delta=mock_delta1)]),
-        MagicMock(choices=[MagicMock(delta=mock_delta2)]),
+        MagicMock(choices=[MagicMock(delta=mock_delta1, finish_reason=None)]),
+        MagicMock(choices=[MagicMock(delta=mock_delta2, finish_reason="stop")]),
+        MagicMock(choices=[], usage=create_mock_usage(10, 2, 12)),
     ]
+    for chunk in chunks[:2]:
+        chunk.usage = None
 
     async def mock_stream() -> AsyncGenerator[MagicMock, None]:
         for chunk in chunks:
@@ -140,3 +146,89 @@ async def test_generate_streaming_response(
     assert len(responses) == 2
     assert responses[0]["content"] == "청크 1"
     assert responses[1]["content"] == "청크 2"
+    params = openai_service.client.chat.completions.create.call_args.kwargs
+    assert params["stream_options"] == {"include_usage": True}
+
+
+def create_tool_call_chunk(
+    index: int, arguments: str, name: str | None = None, call_id: str | None = None
+) -> MagicMock:
+    """tool_calls 델타 청크 생성"""
+    delta = MagicMock(
+        content=None,
+        function_call=None,
+        tool_calls=[
+            ChoiceDeltaToolCall(
+                index=index,
+                id=call_id,
+                type="function" if call_id else None,
+                function=ChoiceDeltaToolCallFunction(name=name, arguments=arguments),
+            )
+        ],
+    )
+    return MagicMock(choices=[MagicMock(delta=delta, finish_reason=None)], usage=None)
+
+
+@pytest.mark.asyncio
+async def test_generate_streaming_tool_calls(
+    openai_service: OpenAIService,
+) -> None:
+    """tool_calls 델타 조립 테스트"""
+    received: list[Any] = []
+    chunks = [
+        create_tool_call_chunk(0, "", name="test_function", call_id="call_0"),
+        create_tool_call_chunk(0, '{"param": '),
+        create_tool_call_chunk(0, '"a"}'),
+        create_tool_call_chunk(1, '{"param"', name="test_function", call_id="call_1"),
+        create_tool_call_chunk(1, ': "b"}'),
+    ]
+
+    async def mock_stream() -> AsyncGenerator[MagicMock, None]:
+        for chunk in chunks:
+            received.append(chunk)
+            yield chunk
+
+    openai_service.client = create_mock_client(mock_stream())
+
+    result = await openai_service.generate("테스트 프롬프트", streaming=True)
+    assert isinstance(result, AsyncIterator)
+
+    first = await anext(result)
+    # 첫 호출은 다음 index의 델타가 도착하자마자 완성되어 전달
+    assert len(received) == 4
+    assert first["tool_call"].id == "call_0"
+    assert first["tool_call"].function.name == "test_function"
+    assert first["tool_call"].function.arguments == '{"param": "a"}'
+
+    rest = [response async for response in result]
+    assert len(rest) == 1
+    assert rest[0]["tool_call"].id == "call_1"
+    assert rest[0]["tool_call"].function.arguments == '{"param": "b"}'
+
+
+@pytest.mark.asyncio
+async def test_generate_streaming_closed_by_consumer(
+    openai_service: OpenAIService,
+) -> None:
+    """소비자가 스트림을 닫으면 업스트림 스트림도 즉시 닫힘"""
+    closed = False
+
+    async def mock_stream() -> AsyncGenerator[MagicMock, None]:
+        nonlocal closed
+        try:
+            for content in ["청크 1", "청크 2"]:
+                delta = MagicMock(content=content, function_call=None, tool_calls=None)
+                yield MagicMock(
+                    choices=[MagicMock(delta=delta, finish_reason=None)], usage=None
+                )
+        finally:
+            closed = True
+
+    openai_service.client = create_mock_client(mock_stream())
+
+    result = await openai_service.generate("테스트 프롬프트", streaming=True)
+    assert isinstance(result, AsyncGenerator)
+    assert (await anext(result))["content"] == "청크 1"
+    await result.aclose()
+
+    assert closed
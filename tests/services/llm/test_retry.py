@@ -0,0 +1,154 @@
+"""LLM 재시도 정책 테스트"""
+
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import openai
+import pytest
+
+from src.core.metrics import LLM_RETRIES
+from src.services.llm.retry import (
+    RetryBudget,
+    RetryingLLMService,
+    retry_after_seconds,
+    retry_reason,
+)
+
+
+def create_status_error(
+    status_code: int, headers: dict[str, str] | None = None, body: Any = None
+) -> openai.APIStatusError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status_code, request=request, headers=headers)
+    error_class = {
+        400: openai.BadRequestError,
+        429: openai.RateLimitError,
+    }.get(status_code, openai.InternalServerError)
+    return error_class("error", response=response, body=body)
+
+
+def create_service(
+    side_effect: Any, budget: RetryBudget | None = None
+) -> tuple[RetryingLLMService, AsyncMock]:
+    inner = MagicMock()
+    inner.model = "test-model"
+    inner.max_tokens = 100
+    inner.generate = AsyncMock(side_effect=side_effect)
+    service = RetryingLLMService(inner, budget or RetryBudget(0.1, 10))
+    return service, inner.generate
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("src.core.config.settings.llm_retry_initial_delay", 0)
+
+
+def test_retry_reason() -> None:
+    """재시도 가능 오류 분류 테스트"""
+    assert retry_reason(create_status_error(429)) == "rate_limit"
+    assert retry_reason(create_status_error(503)) == "server_error"
+    assert retry_reason(create_status_error(400)) is None
+    assert (
+        retry_reason(create_status_error(429, body={"code": "insufficient_quota"}))
+        is None
+    )
+    request = httpx.Request("POST", "https://api.openai.com")
+    assert retry_reason(openai.APITimeoutError(request)) == "timeout"
+    assert retry_reason(ValueError()) is None
+
+
+def test_retry_after_seconds() -> None:
+    """Retry-After 헤더 파싱 테스트"""
+    assert retry_after_seconds(create_status_error(429, {"retry-after": "2"})) == 2
+    assert (
+        retry_after_seconds(create_status_error(429, {"retry-after-ms": "1500"})) == 1.5
+    )
+    assert retry_after_seconds(create_status_error(429)) is None
+
+
+@pytest.mark.asyncio
+async def test_retry_then_success() -> None:
+    """일시적 오류 후 재시도 성공"""
+    response = {"content": "응답", "function_call": None}
+    service, generate = create_service(
+        [
+            create_status_error(503),
+            create_status_error(429, {"retry-after": "0"}),
+            response,
+        ]
+    )
+
+    assert await service.generate(prompt="테스트") == response
+    assert generate.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error() -> None:
+    """재시도 불가능한 오류는 즉시 전달"""
+    service, generate = create_service(create_status_error(400))
+
+    with pytest.raises(openai.BadRequestError):
+        await service.generate(prompt="테스트")
+    assert generate.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_long_retry_after_not_retried() -> None:
+    """Retry-After가 최대 대기 시간보다 길면 재시도하지 않음"""
+    service, generate = create_service(
+        create_status_error(429, {"retry-after": "3600"})
+    )
+
+    with pytest.raises(openai.RateLimitError):
+        await service.generate(prompt="테스트")
+    assert generate.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_exhausted() -> None:
+    """재시도 예산이 없으면 재시도하지 않음"""
+    budget = RetryBudget(ratio=0.1, capacity=1)
+    service, generate = create_service(create_status_error(503), budget)
+
+    with pytest.raises(openai.InternalServerError):
+        await service.generate(prompt="테스트")
+    # 예산 1개로 한 번만 재시도
+    assert generate.await_count == 2
+    assert budget.tokens < 1
+
+
+@pytest.mark.asyncio
+async def test_stream_retried_before_first_chunk() -> None:
+    """첫 청크 이전의 스트림 생성 실패만 재시도"""
+
+    async def stream() -> AsyncIterator[dict[str, Any]]:
+        yield {"content": "청크 1"}
+        yield {"content": "청크 2"}
+
+    service, generate = create_service([create_status_error(502), stream()])
+
+    response = await service.generate(prompt="테스트", streaming=True)
+    assert isinstance(response, AsyncIterator)
+    chunks = [chunk["content"] async for chunk in response]
+    assert chunks == ["청크 1", "청크 2"]
+    assert generate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_exhausted_attempts_charge_only_actual_retries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """마지막 시도의 실패는 재시도 예산과 메트릭에 반영하지 않음"""
+    monkeypatch.setattr("src.core.config.settings.llm_retry_max_attempts", 2)
+    budget = RetryBudget(ratio=0, capacity=10)
+    service, generate = create_service(create_status_error(503), budget)
+    retries = LLM_RETRIES.labels(model="test-model", reason="server_error")
+    before = retries._value.get()
+
+    with pytest.raises(openai.InternalServerError):
+        await service.generate(prompt="테스트")
+
+    assert generate.await_count == 2
+    assert budget.tokens == 9
+    assert retries._value.get() - before == 1
@@ -0,0 +1,227 @@
+"""동일 LLM 요청 병합 테스트"""
+
+import asyncio
+import json
+from typing import Any, AsyncGenerator, AsyncIterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.exceptions import LLMError
+from src.services.llm.factory import wrap_llm_service
+from src.services.llm.singleflight import (
+    LOCK_KEY_PREFIX,
+    RESULT_KEY_PREFIX,
+    SingleFlight,
+    SingleFlightLLMService,
+)
+from tests.helpers.mock_data import MockRedisService
+
+
+def create_slow_service(release: asyncio.Event) -> MagicMock:
+    """호출 후 이벤트가 설정될 때까지 응답하지 않는 Mock 서비스"""
+    service = MagicMock()
+    service.model = "gpt-test"
+    service.max_tokens = 100
+    service.calls = 0
+
+    async def generate(**kwargs: Any) -> Any:
+        service.calls += 1
+        if kwargs["streaming"]:
+            return stream(release)
+        await release.wait()
+        return {"content": "응답", "function_call": None}
+
+    service.generate = generate
+    return service
+
+
+async def stream(release: asyncio.Event) -> AsyncGenerator[dict[str, Any], None]:
+    """이벤트 전후로 청크를 내보내는 스트림"""
+    yield {"content": "청크 1"}
+    await release.wait()
+    yield {"content": "청크 2"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_coalesced() -> None:
+    """동시 동일 요청 병합 테스트"""
+    release = asyncio.Event()
+    inner = create_slow_service(release)
+    service = SingleFlightLLMService(inner, SingleFlight())
+
+    tasks = [asyncio.create_task(service.generate("질문")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert inner.calls == 1
+    assert all(result["content"] == "응답" for result in results)
+
+
+@pytest.mark.asyncio
+async def test_different_requests_not_coalesced() -> None:
+    """서로 다른 요청은 병합하지 않음 테스트"""
+    release = asyncio.Event()
+    release.set()
+    inner = create_slow_service(release)
+    service = SingleFlightLLMService(inner, SingleFlight())
+
+    await asyncio.gather(service.generate("질문 1"), service.generate("질문 2"))
+
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_fan_out() -> None:
+    """스트리밍 대기자 fan-out 테스트"""
+    release = asyncio.Event()
+    inner = create_slow_service(release)
+    service = SingleFlightLLMService(inner, SingleFlight())
+
+    async def consume() -> list[str]:
+        result = await service.generate("질문", streaming=True)
+        assert isinstance(result, AsyncIterator)
+        return [chunk["content"] async for chunk in result]
+
+    tasks = [asyncio.create_task(consume()) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert inner.calls == 1
+    assert results == [["청크 1", "청크 2"], ["청크 1", "청크 2"]]
+
+
+@pytest.mark.asyncio
+async def test_follower_uses_leader_result() -> None:
+    """다른 워커가 리더인 경우 결과 재사용 테스트"""
+    redis = MockRedisService()
+    redis.store[f"{LOCK_KEY_PREFIX}key"] = "other-worker"
+    redis.store[f"{RESULT_KEY_PREFIX}key"] = json.dumps(
+        {"response": {"content": "리더 응답", "function_call": None}}
+    )
+    group = SingleFlight(redis)
+    fn = MagicMock()
+
+    result = await group.call("key", fn, "gpt-test")
+
+    assert result == {"content": "리더 응답", "function_call": None, "tool_calls": None}
+    fn.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_leader_publishes_result() -> None:
+    """리더 결과 발행 및 락 해제 테스트"""
+    redis = MockRedisService()
+    group = SingleFlight(redis)
+
+    async def fn() -> dict[str, Any]:
+        return {"content": "응답", "function_call": None}
+
+    await group.call("key", fn, "gpt-test")
+
+    assert f"{LOCK_KEY_PREFIX}key" not in redis.store
+    assert json.loads(redis.store[f"{RESULT_KEY_PREFIX}key"]) == {
+        "response": {"content": "응답", "function_call": None, "tool_calls": None}
+    }
+    assert redis.published[0][0] == f"{RESULT_KEY_PREFIX}key"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_cancels_upstream_call() -> None:
+    """마지막 대기자가 취소되면 기본 설정의 서비스 스택에서도 업스트림 호출 취소"""
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+    inner = MagicMock()
+    inner.model = "gpt-cancel-test"
+    inner.max_tokens = 100
+
+    async def generate(**kwargs: Any) -> Any:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    inner.generate = generate
+    service = wrap_llm_service(inner)
+
+    first = asyncio.create_task(service.generate("질문"))
+    second = asyncio.create_task(service.generate("질문"))
+    await started.wait()
+
+    # 다른 대기자가 남아 있으면 호출 유지
+    first.cancel()
+    await asyncio.sleep(0.01)
+    assert not cancelled.is_set()
+
+    second.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+    with pytest.raises(asyncio.CancelledError):
+        await second
+
+
+@pytest.mark.asyncio
+async def test_truncated_response_not_shared() -> None:
+    """잘린 응답을 받은 대기자는 결과를 공유하지 않고 직접 호출"""
+    release = asyncio.Event()
+    inner = MagicMock()
+    inner.model = "gpt-test"
+    inner.max_tokens = 100
+    inner.calls = 0
+
+    async def generate(**kwargs: Any) -> Any:
+        inner.calls += 1
+        await release.wait()
+        return {"content": "잘린 응", "function_call": None, "finish_reason": "length"}
+
+    inner.generate = generate
+    service = SingleFlightLLMService(inner, SingleFlight())
+
+    tasks = [asyncio.create_task(service.generate("질문")) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_follower_registered_before_reading() -> None:
+    """리더가 먼저 닫아도 아직 읽기 전인 대기자의 스트림은 유지"""
+    release = asyncio.Event()
+    inner = create_slow_service(release)
+    service = SingleFlightLLMService(inner, SingleFlight())
+
+    leader = await service.generate("질문", streaming=True)
+    follower = await service.generate("질문", streaming=True)
+    assert isinstance(leader, AsyncIterator) and isinstance(follower, AsyncIterator)
+
+    assert (await anext(leader))["content"] == "청크 1"
+    await leader.aclose()  # type: ignore[attr-defined]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert [chunk["content"] async for chunk in follower] == ["청크 1", "청크 2"]
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_stream_raises_llm_error_to_followers() -> None:
+    """공유 스트림이 취소되면 대기자에게는 취소가 아닌 LLMError로 전달"""
+    release = asyncio.Event()
+    flight = SingleFlight()
+    service = SingleFlightLLMService(create_slow_service(release), flight)
+
+    follower = await service.generate("질문", streaming=True)
+    assert isinstance(follower, AsyncIterator)
+    assert (await anext(follower))["content"] == "청크 1"
+
+    broadcast = next(iter(flight._streams.values()))
+    assert broadcast._task is not None
+    broadcast._task.cancel()
+
+    with pytest.raises(LLMError):
+        await anext(follower)
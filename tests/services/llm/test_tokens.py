@@ -0,0 +1,79 @@
+"""토큰 추정 및 max_tokens 계획 테스트"""
+
+import pytest
+
+from src.core.exceptions import ValidationError
+from src.services.llm.tokens import (
+    MIN_OUTPUT_SAMPLES,
+    TokenPlanner,
+    estimate_message_tokens,
+    estimate_tokens,
+)
+
+
+def create_planner(**kwargs: float) -> TokenPlanner:
+    options = {
+        "context_window": 8000,
+        "max_output_tokens": 4000,
+        "min_output_tokens": 100,
+        "headroom": 1.5,
+        "sample_size": 100,
+    }
+    options.update(kwargs)
+    return TokenPlanner(**options)  # type: ignore[arg-type]
+
+
+def test_estimate_tokens() -> None:
+    """단어, 숫자, 구두점, 한글 조각별 추정"""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("Hello, world!") == 4
+    # 숫자는 3자리씩 분할
+    assert estimate_tokens("1234567") == 3
+    assert estimate_tokens("청구서") == 3
+
+
+def test_estimate_message_tokens_includes_tool_calls() -> None:
+    """assistant 메시지의 tool_calls 인자도 계산"""
+    message = {"role": "assistant", "content": None}
+    with_calls = {
+        **message,
+        "tool_calls": [
+            {
+                "id": "call_0",
+                "type": "function",
+                "function": {"name": "lookup", "arguments": '{"invoice": "INV-1"}'},
+            }
+        ],
+    }
+    assert estimate_message_tokens([with_calls]) > estimate_message_tokens([message])
+
+
+def test_planner_uses_max_without_samples() -> None:
+    """관측이 부족하면 설정된 최댓값 예약"""
+    planner = create_planner()
+    assert planner.plan(1000) == 4000
+
+
+def test_planner_reserves_from_observed_outputs() -> None:
+    """관측된 p99 출력 토큰에 여유 배수를 곱해 예약"""
+    planner = create_planner()
+    for _ in range(MIN_OUTPUT_SAMPLES):
+        planner.observe(200)
+    assert planner.plan(1000) == 300
+
+    # 잘린 응답은 최댓값으로 기록되어 예약량이 다시 커짐
+    planner.observe(300, truncated=True)
+    assert planner.plan(1000) == 4000
+
+
+def test_planner_limits_to_context_window() -> None:
+    """남은 컨텍스트만큼만 예약하고, 부족하면 거절"""
+    planner = create_planner()
+    assert planner.plan(6000) == 2000
+
+    with pytest.raises(ValidationError) as exc_info:
+        planner.plan(7950)
+    assert exc_info.value.detail["details"] == {
+        "estimated_tokens": 7950,
+        "context_window": 8000,
+    }
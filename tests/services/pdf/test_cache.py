@@ -0,0 +1,148 @@
+"""PDF 파싱 결과 캐시 테스트"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Sequence
+
+import pytest
+
+from src.core.config import settings
+from src.services.pdf import cache as cache_module
+from src.services.pdf import extractor
+from src.services.pdf.cache import CACHE_KEY_PREFIX, DiskCache, DocumentCache, hash_file
+from src.services.pdf.extractor import extract_pdf_document
+from src.services.pdf.parser import parse_pages
+from tests.helpers.mock_data import MockRedisService
+from tests.helpers.pdf import write_pdf
+
+
+def test_hash_file(tmp_path: Path) -> None:
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_bytes(b"same")
+    second.write_bytes(b"same")
+
+    assert hash_file(first) == hash_file(second)
+    assert len(hash_file(first)) == 64
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    disk = DiskCache(tmp_path, max_bytes=250)
+    for index, key in enumerate(["aa-1", "bb-1"]):
+        disk.set(key, b"x" * 100)
+        os.utime(disk._path(key), (index, index))
+    # 조회한 항목은 최근 사용으로 갱신
+    assert disk.get("aa-1") == b"x" * 100
+
+    disk.set("cc-1", b"x" * 100)
+
+    assert disk.get("bb-1") is None
+    assert disk.get("aa-1") is not None
+    assert disk.get("cc-1") is not None
+    assert disk.usage() == 200
+
+
+def test_disk_cache_concurrent_writes_skip_temp_files(tmp_path: Path) -> None:
+    """같은 키를 동시에 써도 임시 파일이 겹치지 않고, 쓰는 중인 파일은 제거하지 않음"""
+    disk = DiskCache(tmp_path, max_bytes=1 << 20)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda index: disk.set("aa-1", bytes([index]) * 100), range(32)))
+
+    assert len(disk.get("aa-1") or b"") == 100
+    assert [path.name for path in tmp_path.glob("*/*")] == ["aa-1"]
+
+    # 다른 워커가 쓰는 중인 임시 파일
+    writing = tmp_path / "aa" / "aa-2.1234.tmp"
+    writing.write_bytes(b"x" * 100)
+    disk.max_bytes = 50
+    disk.evict()
+
+    assert writing.exists()
+    assert disk.usage() == 0
+
+
+def test_disk_cache_size_consistent_under_concurrent_writes(tmp_path: Path) -> None:
+    """여러 스레드가 동시에 써도 추정 크기가 실제 사용량과 일치"""
+    disk = DiskCache(tmp_path, max_bytes=1 << 20)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda index: disk.set(f"k{index:03d}", b"x" * 100), range(64)))
+
+    assert disk._size == disk.usage() == 6400
+
+
+@pytest.mark.asyncio
+async def test_document_cache_backfills_disk_from_redis(tmp_path: Path) -> None:
+    redis = MockRedisService()
+    pages = [{"page": 1, "text": "a", "duration": 0.1}, {"page": 2, "error": "timeout"}]
+    await DocumentCache(None, redis, ttl=60).set_pages("d" * 64, 2, pages)  # type: ignore[arg-type]
+
+    assert all(key.startswith(CACHE_KEY_PREFIX) for key in redis.store)
+    assert set(redis.expires.values()) == {60}
+
+    disk = DiskCache(tmp_path, max_bytes=1 << 20)
+    cache = DocumentCache(disk, redis, ttl=60)  # type: ignore[arg-type]
+    assert await cache.get_page_count("d" * 64) == 2
+    # 시간 초과 페이지는 저장하지 않음
+    assert await cache.get_pages("d" * 64, [1, 2]) == {1: pages[0]}
+
+    redis.store.clear()
+    assert await cache.get_pages("d" * 64, [1]) == {1: pages[0]}
+
+
+@pytest.fixture
+def parse_calls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> list[Sequence[int] | None]:
+    """프로세스 풀 대신 현재 프로세스에서 파싱하고 요청 페이지 기록"""
+    calls: list[Sequence[int] | None] = []
+
+    async def run_in_process(function: Any, *args: Any) -> Any:
+        if function is parse_pages:
+            calls.append(args[1])
+        return function(*args)
+
+    monkeypatch.setattr(extractor, "run_in_pdf_pool", run_in_process)
+    monkeypatch.setattr(settings, "pdf_cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setattr(cache_module, "_document_cache", None)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_extract_uses_content_addressed_cache(
+    tmp_path: Path, parse_calls: list[Sequence[int] | None]
+) -> None:
+    path = write_pdf(tmp_path / "invoice.pdf", [["one"], ["two"], ["three"]])
+
+    first = await extract_pdf_document(path, [2], ["text"])
+    second = await extract_pdf_document(path, None, ["text"])
+
+    assert [page["cached"] for page in first["pages"]] == [False]
+    assert [page["cached"] for page in second["pages"]] == [False, True, False]
+    assert "three" in second["pages"][2]["text"]
+    # 캐시에 없는 페이지만 파싱
+    assert parse_calls == [[2], [1, 3]]
+
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(path.read_bytes())
+    third = await extract_pdf_document(copy, None, ["words"])
+
+    # 캐시에 없는 항목(단어 좌표)은 다시 파싱해 기존 항목과 함께 저장
+    assert not any(page["cached"] for page in third["pages"])
+    assert "text" not in third["pages"][0] and "words" in third["pages"][0]
+    assert len(parse_calls) == 3
+
+    fourth = await extract_pdf_document(copy, None, ["text", "words"])
+    assert all(page["cached"] for page in fourth["pages"])
+    assert len(parse_calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_extract_cached_page_out_of_range(
+    tmp_path: Path, parse_calls: list[Sequence[int] | None]
+) -> None:
+    path = write_pdf(tmp_path / "invoice.pdf", [["one"]])
+    await extract_pdf_document(path, None, ["text"])
+
+    with pytest.raises(ValueError, match="out of range"):
+        await extract_pdf_document(path, [2], ["text"])
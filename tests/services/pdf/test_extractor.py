@@ -0,0 +1,87 @@
+"""페이지 범위별 병렬 파싱 테스트"""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.core.config import settings
+from src.services.pdf import extractor
+from src.services.pdf.extractor import parse_pages_parallel, split_pages
+from src.services.pdf.parser import MemoryLimitError
+from tests.helpers.pdf import write_pdf
+
+
+def test_split_pages() -> None:
+    assert split_pages([1, 2, 3, 4, 5], workers=2, max_pages_per_task=8) == [
+        [1, 2, 3],
+        [4, 5],
+    ]
+    # 범위당 최대 페이지 수 제한
+    assert split_pages(list(range(1, 8)), workers=1, max_pages_per_task=3) == [
+        [1, 2, 3],
+        [4, 5, 6],
+        [7],
+    ]
+    assert split_pages([2], workers=4, max_pages_per_task=8) == [[2]]
+
+
+@pytest.fixture
+def document(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(settings, "pdf_workers", 3)
+    monkeypatch.setattr(settings, "pdf_pages_per_task", 1)
+    monkeypatch.setattr(settings, "pdf_document_memory_limit", 300)
+    return write_pdf(tmp_path / "invoice.pdf", [["one"], ["two"], ["three"]])
+
+
+@pytest.mark.asyncio
+async def test_parse_pages_parallel_merges_in_order(
+    document: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[tuple[list[int], int]] = []
+
+    async def run_in_process(function: Any, *args: Any) -> Any:
+        calls.append((args[1], args[4]))
+        # 앞 범위가 늦게 끝나도 페이지 순서 유지
+        await asyncio.sleep(0.01 * (4 - args[1][0]))
+        return function(*args)
+
+    monkeypatch.setattr(extractor, "run_in_pdf_pool", run_in_process)
+
+    pages = await parse_pages_parallel(document, [1, 2, 3])
+
+    assert [page["page"] for page in pages] == [1, 2, 3]
+    assert "three" in pages[2]["text"]
+    # 문서 메모리 상한을 동시 작업 수로 나눔
+    assert calls == [([1], 100), ([2], 100), ([3], 100)]
+
+
+@pytest.mark.asyncio
+async def test_parse_pages_parallel_cancels_on_failure(
+    document: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cancel_files: list[str] = []
+    cancelled: list[list[int]] = []
+
+    async def run_in_process(function: Any, *args: Any) -> Any:
+        cancel_files.append(args[5])
+        if args[1] == [1]:
+            raise MemoryLimitError("Memory limit exceeded while parsing page 1")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(args[1])
+            raise
+
+    monkeypatch.setattr(extractor, "run_in_pdf_pool", run_in_process)
+
+    with pytest.raises(MemoryLimitError):
+        await parse_pages_parallel(document, [1, 2, 3])
+
+    assert cancelled == [[2], [3]]
+    # 실행 중인 워커가 확인할 취소 파일 생성
+    assert len(set(cancel_files)) == 1
+    assert os.path.exists(cancel_files[0])
+    os.unlink(cancel_files[0])
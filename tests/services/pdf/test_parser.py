@@ -0,0 +1,123 @@
+"""PDF 파싱 테스트"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from src.services.pdf import parser
+from src.services.pdf.parser import (
+    MemoryLimitError,
+    memory_limit,
+    parse_pages,
+    select_pages,
+)
+from tests.helpers.pdf import write_pdf
+
+TABLE = [["Item", "Amount"], ["Widget", "1200"]]
+
+
+@pytest.fixture
+def invoice(tmp_path: Path) -> Path:
+    return write_pdf(
+        tmp_path / "invoice.pdf",
+        [["Invoice No. INV-001", "Total 1,200"], ["Page two"], ["Page three"]],
+        TABLE,
+    )
+
+
+def test_parse_pages(invoice: Path) -> None:
+    assert parser.document_info(str(invoice)) == {"page_count": 3}
+
+    pages = parse_pages(str(invoice), [1, 2, 3], parser.PARTS, 5)
+
+    first = pages[0]
+    assert first["page"] == 1
+    assert "INV-001" in first["text"]
+    assert first["tables"] == [TABLE]
+    word = next(word for word in first["words"] if word["text"] == "INV-001")
+    assert word["x0"] < word["x1"] and word["top"] < word["bottom"]
+    assert first["duration"] >= 0
+
+
+def test_parse_selected_pages(invoice: Path) -> None:
+    pages = parse_pages(str(invoice), [3, 1], ("text",), 5)
+
+    assert [page["page"] for page in pages] == [3, 1]
+    assert "words" not in pages[0]
+    assert "tables" not in pages[0]
+
+
+def test_select_pages() -> None:
+    assert select_pages(None, 3) == [1, 2, 3]
+    assert select_pages([3, 1], 3) == [3, 1]
+    with pytest.raises(ValueError, match="out of range"):
+        select_pages([4], 3)
+
+
+def test_invalid_pdf(tmp_path: Path) -> None:
+    path = tmp_path / "broken.pdf"
+    path.write_bytes(b"not a pdf")
+
+    with pytest.raises(ValueError, match="Invalid PDF"):
+        parser.document_info(str(path))
+
+
+def test_page_timeout(invoice: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """시간이 초과된 페이지는 오류로 표시하고 다음 페이지를 계속 파싱"""
+    original = parser.parse_page
+
+    def slow_parse_page(page, include):  # type: ignore[no-untyped-def]
+        if page.page_number == 2:
+            time.sleep(5)
+        return original(page, include)
+
+    monkeypatch.setattr(parser, "parse_page", slow_parse_page)
+
+    pages = parse_pages(str(invoice), [1, 2, 3], ("text",), 0.2)
+
+    assert pages[1] == {"page": 2, "error": "timeout", "duration": pages[1]["duration"]}
+    assert pages[1]["duration"] < 1
+    assert "Page three" in pages[2]["text"]
+
+
+def test_parse_pages_stops_when_cancelled(
+    invoice: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """취소 파일이 생기면 다음 페이지 전에 중단"""
+    cancel_file = tmp_path / "cancel"
+    original = parser.parse_page
+
+    def cancel_after_first(page, include):  # type: ignore[no-untyped-def]
+        cancel_file.touch()
+        return original(page, include)
+
+    monkeypatch.setattr(parser, "parse_page", cancel_after_first)
+
+    pages = parse_pages(
+        str(invoice), [1, 2, 3], ("text",), 5, cancel_file=str(cancel_file)
+    )
+
+    assert [page["page"] for page in pages] == [1]
+
+
+def test_memory_limit() -> None:
+    with pytest.raises(MemoryError):
+        with memory_limit(64 * 1024 * 1024):
+            bytearray(256 * 1024 * 1024)
+
+    # 블록을 벗어나면 제한 해제
+    assert len(bytearray(256 * 1024 * 1024)) == 256 * 1024 * 1024
+
+
+def test_parse_pages_memory_limit(
+    invoice: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def allocate(page, include):  # type: ignore[no-untyped-def]
+        page.close()
+        return {"page": page.page_number, "data": bytearray(256 * 1024 * 1024)}
+
+    monkeypatch.setattr(parser, "parse_page", allocate)
+
+    with pytest.raises(MemoryLimitError, match="page 1"):
+        parse_pages(str(invoice), [1], ("text",), 5, memory=64 * 1024 * 1024)
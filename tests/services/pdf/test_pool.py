@@ -0,0 +1,37 @@
+"""PDF 파싱 프로세스 풀 테스트"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.core.config import settings, worker_count
+from src.services.pdf.pool import ParseSlots, pdf_pool_size
+
+
+def test_pool_size_uses_all_cpus(monkeypatch: pytest.MonkeyPatch) -> None:
+    """미설정 시 서버 워커 수와 무관하게 문서 하나가 모든 CPU를 사용"""
+    monkeypatch.setattr(settings, "pdf_workers", None)
+    monkeypatch.setattr(settings, "server_workers", None)
+    assert pdf_pool_size() == worker_count()
+
+    monkeypatch.setattr(settings, "pdf_workers", 3)
+    assert pdf_pool_size() == 3
+
+
+@pytest.mark.asyncio
+async def test_parse_slots_shared_across_processes(tmp_path: Path) -> None:
+    """다른 프로세스(별도 잠금 파일 핸들)가 점유한 슬롯은 비워질 때까지 대기"""
+    worker1 = ParseSlots(tmp_path, 2)
+    worker2 = ParseSlots(tmp_path, 2)
+
+    first = await worker1.acquire()
+    second = await worker1.acquire()
+    assert first != second
+
+    waiter = asyncio.create_task(worker2.acquire())
+    await asyncio.sleep(0.1)
+    assert not waiter.done()
+
+    worker1.release(first)
+    assert await asyncio.wait_for(waiter, 1) == first
@@ -0,0 +1,215 @@
+"""청구서 추출 파이프라인 테스트"""
+
+import asyncio
+import json
+from typing import Any, AsyncGenerator, cast
+
+import pytest
+
+from src.core.exceptions import LLMError
+from src.services.invoice import InvoicePipeline, PageChunk, merge_answers, parse_answer
+from src.services.llm.base import LLMService
+from src.services.pdf.extractor import DocumentStream
+
+
+def test_parse_answer() -> None:
+    assert parse_answer('```json\n{"total": 1200}\n```') == {"total": 1200}
+
+    with pytest.raises(ValueError):
+        parse_answer("[1, 2]")
+    with pytest.raises(ValueError):
+        parse_answer("not json")
+
+
+def test_merge_answers() -> None:
+    first = PageChunk(index=0, pages=[1, 2])
+    second = PageChunk(index=1, pages=[3])
+    third = PageChunk(index=2, pages=[4])
+
+    merged = merge_answers(
+        [
+            (
+                first,
+                {
+                    "invoice_number": "INV-001",
+                    "vendor": None,
+                    "line_items": [{"description": "Widget", "amount": 1000}],
+                    "total": 999,
+                },
+            ),
+            (
+                second,
+                {
+                    "invoice_number": "INV-002",
+                    "vendor": "ACME",
+                    "line_items": [{"description": "Bolt", "amount": 200}],
+                    "subtotal": 1200,
+                    "total": 1320,
+                },
+            ),
+            (third, None),
+        ]
+    )
+
+    # 머리글은 처음 값, 합계는 마지막 값
+    assert merged["invoice_number"] == "INV-001"
+    assert merged["vendor"] == "ACME"
+    assert merged["total"] == 1320
+    assert merged["tax"] is None
+    assert [item["description"] for item in merged["line_items"]] == [
+        "Widget",
+        "Bolt",
+    ]
+    assert merged["line_items"][1]["pages"] == [3]
+    assert merged["errors"] == [{"pages": [4], "error": "invalid_response"}]
+
+
+class FakeLLMService:
+    """호출 시점과 동시 호출 수를 기록하는 LLM 서비스"""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, prompt: str, **kwargs: Any) -> dict[str, Any]:
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        page = prompt.split("--- page ")[1].split(" ")[0]
+        return {"content": json.dumps({"line_items": [{"description": page}]})}
+
+
+class PageSource:
+    """파싱 지연을 흉내 내며 생성한 페이지 수를 기록하는 페이지 스트림"""
+
+    def __init__(self, count: int, delay: float) -> None:
+        self.count = count
+        self.delay = delay
+        self.produced = 0
+        self.closed = False
+
+    async def pages(self) -> AsyncGenerator[dict[str, Any], None]:
+        try:
+            for number in range(1, self.count + 1):
+                await asyncio.sleep(self.delay)
+                self.produced += 1
+                yield {"page": number, "text": f"page {number} text", "tables": []}
+        finally:
+            self.closed = True
+
+    def document(self) -> DocumentStream:
+        return DocumentStream(
+            sha256="d" * 64,
+            page_count=self.count,
+            numbers=list(range(1, self.count + 1)),
+            truncated=False,
+            pages=self.pages(),
+        )
+
+
+@pytest.mark.asyncio
+async def test_pipeline_overlaps_parsing_and_llm_calls() -> None:
+    source = PageSource(count=8, delay=0.02)
+    llm = FakeLLMService(delay=0.05)
+    pipeline = InvoicePipeline(
+        cast(LLMService, llm), chunk_pages=2, concurrency=2, queue_size=1
+    )
+
+    produced_at_first_call: list[int] = []
+    generate = llm.generate
+
+    async def record(prompt: str, **kwargs: Any) -> dict[str, Any]:
+        if not produced_at_first_call:
+            produced_at_first_call.append(source.produced)
+        return await generate(prompt, **kwargs)
+
+    llm.generate = record  # type: ignore[method-assign]
+
+    invoice = await pipeline.run(source.document())
+
+    # 첫 LLM 호출은 파싱이 끝나기 전에 시작
+    assert produced_at_first_call[0] < source.count
+    assert llm.max_in_flight == 2
+    # 완료 순서와 무관하게 페이지 순서로 병합
+    assert [item["description"] for item in invoice["line_items"]] == [
+        "1",
+        "3",
+        "5",
+        "7",
+    ]
+    assert len(llm.prompts) == 4
+    assert source.closed
+
+
+@pytest.mark.asyncio
+async def test_pipeline_backpressure_bounds_pending_pages() -> None:
+    """LLM 호출이 밀리면 페이지 소비도 멈춤"""
+    source = PageSource(count=40, delay=0)
+    llm = FakeLLMService(delay=0.2)
+    pipeline = InvoicePipeline(
+        cast(LLMService, llm), chunk_pages=2, concurrency=1, queue_size=1
+    )
+
+    task = asyncio.create_task(pipeline.run(source.document()))
+    await asyncio.sleep(0.1)
+
+    # 호출 중인 청크 + 대기열 청크 + 만드는 중인 청크
+    assert source.produced <= 2 * 3
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert source.closed
+
+
+@pytest.mark.asyncio
+async def test_pipeline_llm_failure_stops_parsing() -> None:
+    source = PageSource(count=20, delay=0.01)
+
+    class FailingLLMService:
+        async def generate(self, prompt: str, **kwargs: Any) -> dict[str, Any]:
+            raise RuntimeError("upstream error")
+
+    pipeline = InvoicePipeline(
+        cast(LLMService, FailingLLMService()),
+        chunk_pages=1,
+        concurrency=2,
+        queue_size=2,
+    )
+
+    with pytest.raises(LLMError):
+        await pipeline.run(source.document())
+
+    assert source.closed
+    assert source.produced < source.count
+
+
+@pytest.mark.asyncio
+async def test_pipeline_reports_page_parse_errors() -> None:
+    """파싱 시간이 초과된 페이지는 errors에 기록하고, 빈 페이지는 조용히 제외"""
+
+    async def pages() -> AsyncGenerator[dict[str, Any], None]:
+        yield {"page": 1, "text": "page 1 text", "tables": []}
+        yield {"page": 2, "error": "timeout"}
+        yield {"page": 3, "text": "", "tables": []}
+        yield {"page": 4, "text": "page 4 text", "tables": []}
+
+    llm = FakeLLMService(delay=0)
+    document = DocumentStream(
+        sha256="d" * 64,
+        page_count=4,
+        numbers=[1, 2, 3, 4],
+        truncated=False,
+        pages=pages(),
+    )
+
+    invoice = await InvoicePipeline(cast(LLMService, llm), 1, 2, 2).run(document)
+
+    assert len(llm.prompts) == 2
+    assert [item["description"] for item in invoice["line_items"]] == ["1", "4"]
+    assert invoice["errors"] == [{"pages": [2], "error": "timeout"}]
@@ -0,0 +1,122 @@
+"""재개 가능한 스트림 저장소 테스트"""
+
+import asyncio
+import json
+from typing import AsyncIterator
+
+import pytest
+
+from src.core.exceptions import LLMError, ValidationError
+from src.services.streams import StreamStore
+from tests.helpers.mock_data import MockRedisService
+
+
+def create_store(reader_grace: int = 30) -> StreamStore:
+    return StreamStore(
+        MockRedisService(),  # type: ignore[arg-type]
+        ttl=300,
+        block_timeout=0.05,
+        reader_grace=reader_grace,
+    )
+
+
+async def events(
+    *items: str, delay: float = 0.0, error: Exception | None = None
+) -> AsyncIterator[dict[str, str]]:
+    for item in items:
+        await asyncio.sleep(delay)
+        yield {"data": item}
+    if error is not None:
+        raise error
+
+
+async def collect(stream: AsyncIterator[dict[str, str]]) -> list[dict[str, str]]:
+    return [event async for event in stream]
+
+
+@pytest.mark.asyncio
+async def test_resume_from_last_event_id() -> None:
+    """Last-Event-ID 이후 청크만 다시 전달"""
+    store = create_store()
+    await store.start("s1", events("a", "b", "c"))
+
+    received = await collect(store.read("s1"))
+    assert [event["data"] for event in received] == ["a", "b", "c"]
+
+    resumed = await collect(store.read("s1", received[0]["id"]))
+    assert [event["data"] for event in resumed] == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_late_subscriber_follows_live_tail() -> None:
+    """생성 중에 붙은 구독자도 처음부터 끝까지 수신"""
+    store = create_store()
+    await store.start("s1", events("a", "b", "c", delay=0.02))
+
+    first = asyncio.create_task(collect(store.read("s1")))
+    await asyncio.sleep(0.03)
+    second = await collect(store.read("s1"))
+
+    assert [event["data"] for event in second] == ["a", "b", "c"]
+    assert await first == second
+
+
+@pytest.mark.asyncio
+async def test_error_is_delivered_as_event() -> None:
+    """생성 실패는 error 이벤트로 전달"""
+    store = create_store()
+    await store.start("s1", events("a", error=LLMError("API 호출 실패")))
+
+    received = await collect(store.read("s1"))
+    assert received[-1]["event"] == "error"
+    assert json.loads(received[-1]["data"])["code"] == "LLM_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_producer_cancelled_without_readers() -> None:
+    """구독 표시가 만료되면 생성 취소"""
+    store = create_store(reader_grace=0)
+    cancelled = asyncio.Event()
+
+    async def slow_events() -> AsyncIterator[dict[str, str]]:
+        try:
+            await asyncio.sleep(10)
+            yield {"data": "a"}
+        finally:
+            cancelled.set()
+
+    await store.start("s1", slow_events())
+    # 구독자가 없는 상태를 흉내내기 위해 표시 삭제
+    await store.redis.delete("agent:stream:s1:readers")
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+    received = await collect(store.read("s1"))
+    assert json.loads(received[-1]["data"])["code"] == "STREAM_CANCELLED"
+
+
+@pytest.mark.asyncio
+async def test_producer_kept_within_reader_grace() -> None:
+    """구독 표시가 사라져도 reader_grace 동안은 유지하고, 그 뒤 바로 취소"""
+    store = create_store(reader_grace=1)
+    cancelled = asyncio.Event()
+
+    async def slow_events() -> AsyncIterator[dict[str, str]]:
+        try:
+            await asyncio.sleep(10)
+            yield {"data": "a"}
+        finally:
+            cancelled.set()
+
+    await store.start("s1", slow_events())
+    await store.redis.delete("agent:stream:s1:readers")
+    await asyncio.sleep(0.5)
+    assert not cancelled.is_set()
+
+    # 구독 표시 확인 주기(block_timeout) 안에 취소
+    await asyncio.wait_for(cancelled.wait(), 0.7)
+
+
+def test_invalid_last_event_id() -> None:
+    """잘못된 Last-Event-ID 거절"""
+    with pytest.raises(ValidationError):
+        create_store().read("s1", "not-an-id")
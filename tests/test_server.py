@@ -0,0 +1,95 @@
+"""프로덕션 서버 실행 테스트"""
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from src.core.config import worker_count
+from src.core.metrics import MULTIPROC_DIR_ENV
+from src.server import max_requests, reset_multiprocess_dir
+
+
+def test_worker_count() -> None:
+    assert worker_count(3) == 3
+    assert worker_count(None) >= 1
+    assert worker_count(0) == worker_count(None)
+
+
+def test_max_requests_jitter() -> None:
+    assert max_requests(0, 100) is None
+    assert max_requests(100, 0) == 100
+    assert all(100 <= (max_requests(100, 10) or 0) <= 110 for _ in range(50))
+
+
+def test_reset_multiprocess_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "counter_1.db").write_bytes(b"")
+    (tmp_path / "keep.txt").write_text("")
+    monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+
+    reset_multiprocess_dir()
+
+    assert not list(tmp_path.glob("*.db"))
+    assert (tmp_path / "keep.txt").exists()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def get(url: str, timeout: float = 10.0) -> int:
+    """서버가 뜰 때까지 재시도하며 GET 요청"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                return int(response.status)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+def test_server_recycles_workers_and_shuts_down(tmp_path: Path) -> None:
+    """워커가 요청 수 한도에 도달하면 교체되고, SIGTERM에 정상 종료"""
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.server"],
+        env={
+            **os.environ,
+            "APP_ENVIRONMENT": "test",
+            "APP_OPENAI_API_KEY": "test-key",
+            "APP_SERVER_HOST": "127.0.0.1",
+            "APP_SERVER_PORT": str(port),
+            "APP_SERVER_WORKERS": "2",
+            "APP_SERVER_MAX_REQUESTS": "2",
+            "APP_SERVER_MAX_REQUESTS_JITTER": "0",
+            MULTIPROC_DIR_ENV: str(tmp_path),
+        },
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    try:
+        for _ in range(10):
+            assert get(f"http://127.0.0.1:{port}/health") == 200
+            # 워커는 0.1초 주기로 요청 수 한도를 확인
+            time.sleep(0.15)
+    finally:
+        process.send_signal(signal.SIGTERM)
+        output, _ = process.communicate(timeout=30)
+
+    assert process.returncode == 0, output
+    # 로그는 ASCII 이스케이프된 JSON
+    assert json.dumps("워커 교체") in output, output